@@ -0,0 +1,91 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib.util
+import time
+
+from qiskit import QuantumCircuit
+from qiskit_aer.noise import NoiseModel, depolarizing_error
+
+from qio.core import (
+    QuantumProgram,
+    QuantumComputationModel,
+    QuantumNoiseModel,
+    BackendData,
+    ClientData,
+)
+
+from qiskit_scaleway.utils import compress
+
+# Measures the compression ratio and CPU cost of compressing the computation
+# model pushed by backend.run(), as enabled by
+# ScalewayProvider(model_compression=...). No upload is made: the upload time
+# saved is estimated from the bytes saved at the given uplink bandwidths, minus
+# the compression time.
+NUM_CIRCUITS = 300
+NUM_QUBITS = 40
+DEPTH = 20
+BANDWIDTHS_MBITS = [10, 100, 1000]
+
+
+def build_circuit(seed: int) -> QuantumCircuit:
+    qc = QuantumCircuit(NUM_QUBITS, NUM_QUBITS)
+
+    for layer in range(DEPTH):
+        for q in range(NUM_QUBITS):
+            qc.rx(0.01 * seed + 0.1 * layer + q, q)
+        for q in range(NUM_QUBITS - 1):
+            qc.cx(q, q + 1)
+
+    qc.measure(range(NUM_QUBITS), range(NUM_QUBITS))
+
+    return qc
+
+
+noise_model = NoiseModel()
+noise_model.add_all_qubit_quantum_error(depolarizing_error(0.01, 2), ["cx"])
+
+payload = QuantumComputationModel(
+    programs=[
+        QuantumProgram.from_qiskit_circuit(build_circuit(i))
+        for i in range(NUM_CIRCUITS)
+    ],
+    backend=BackendData(name="aer_simulation_pop_c16m128", version="1.0"),
+    client=ClientData(user_agent="benchmark"),
+    noise_model=QuantumNoiseModel.from_qiskit_aer_noise_model(noise_model),
+).to_json_str()
+
+raw = payload.encode("utf-8")
+print(f"{NUM_CIRCUITS} circuits, raw model: {len(raw) / 1024:.0f} KiB")
+
+encodings = ["gzip"]
+if importlib.util.find_spec("zstandard") is not None:
+    encodings.append("zstd")
+
+for encoding in encodings:
+    start = time.perf_counter()
+    compressed = compress(raw, encoding)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{encoding}: {len(compressed) / 1024:.0f} KiB "
+        f"({100 * (1 - len(compressed) / len(raw)):.0f}% smaller), "
+        f"compressed in {elapsed * 1000:.1f} ms"
+    )
+
+    for bandwidth in BANDWIDTHS_MBITS:
+        saved = (len(raw) - len(compressed)) * 8 / (bandwidth * 1e6) - elapsed
+        print(
+            f"  estimated upload time saved at {bandwidth} Mbit/s: "
+            f"{saved * 1000:.0f} ms"
+        )
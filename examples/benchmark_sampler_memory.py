@@ -0,0 +1,65 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import random
+import time
+import numpy as np
+
+from qiskit_scaleway.primitives.sampler import _memory_to_bytes
+from qiskit_scaleway.utils import MemoryArray
+
+# Measures the decoding of per-shot memory strings into packed bytes, as done
+# by the Sampler primitive, against the former per-shot int() conversion.
+# Streamed results (MemoryArray) of up to 64 bits skip the strings entirely
+NUM_SHOTS = 200_000
+WIDTHS = [1, 8, 16, 32, 64, 100, 128, 200]
+
+
+def per_shot_decode(memory, num_bytes: int, base: int) -> np.ndarray:
+    data = b"".join(int(i, base).to_bytes(num_bytes, "big") for i in memory)
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, num_bytes)
+
+
+def measure(decode, memory, num_bytes: int, base: int):
+    start = time.perf_counter()
+    result = decode(memory, num_bytes, base)
+    return result, time.perf_counter() - start
+
+
+print(f"{NUM_SHOTS} shots")
+
+for width in WIDTHS:
+    num_bytes = (width + 7) // 8
+    values = [random.getrandbits(width) for _ in range(NUM_SHOTS)]
+
+    for base, memory in (
+        (16, [hex(v) for v in values]),
+        (2, [format(v, f"0{width}b") for v in values]),
+    ):
+        expected, before = measure(per_shot_decode, memory, num_bytes, base)
+        result, after = measure(_memory_to_bytes, memory, num_bytes, base)
+
+        assert np.array_equal(expected, result)
+
+        print(
+            f"{width:>3} bits, base {base:>2}: per shot {before * 1000:7.1f} ms, "
+            f"vectorized {after * 1000:6.1f} ms ({before / after:4.1f}x)"
+        )
+
+    if width <= 64:
+        array = MemoryArray(np.array(values, dtype=np.uint64))
+        result, elapsed = measure(_memory_to_bytes, array, num_bytes, 16)
+
+        assert np.array_equal(expected, result)
+
+        print(f"{width:>3} bits, MemoryArray: {elapsed * 1000:6.1f} ms")
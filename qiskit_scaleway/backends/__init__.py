@@ -13,6 +13,17 @@
 # limitations under the License.
 from .base_backend import BaseBackend
 from .base_job import BaseJob
+from .composite_job import CompositeJob, merge_results
+from .coalescer import CoalescedJob, RunCoalescer
+from .inflight import InFlightJobs
+from .result_memo import MemoizedJob, ResultMemo
+from .polling import (
+    PollingStrategy,
+    FixedPolling,
+    ExponentialBackoffPolling,
+    AdaptivePolling,
+)
+from .job_monitor import JobMonitor
 from .aer.backend import AerBackend
 from .quobly.backend import QuoblyBackend
 from .qsim.backend import QsimBackend
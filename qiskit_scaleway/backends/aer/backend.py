@@ -11,19 +11,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List
-from qiskit.providers import Options
+from typing import List, Optional, Union
+
+from qiskit import QuantumCircuit
+from qiskit.providers import JobV1, Options
 from qiskit.transpiler import Target
 
 from qiskit_aer.backends.aer_simulator import BASIS_GATES, AerBackendConfiguration
 from qiskit_aer.backends.aerbackend import NAME_MAPPING
 
-from qiskit_scaleway.backends import BaseBackend
+from qiskit_scaleway.backends import BaseBackend, BaseJob
+
+from .local import HybridJob, LocalExecutionPolicy, run_locally
+from .parameter_binds import to_parameter_table
 
 from scaleway_qaas_client.v1alpha1 import QaaSClient, QaaSPlatform
 
 
 class AerBackend(BaseBackend):
+    # Runs with a seed are reproducible and can be memoized
+    _seed_option = "seed_simulator"
+
     def __init__(self, provider, client: QaaSClient, platform: QaaSPlatform):
         super().__init__(
             provider=provider,
@@ -53,6 +61,7 @@ class AerBackend(BaseBackend):
         self._properties = None
 
         self._target = self._convert_to_target()
+        self._local_policy: Optional[LocalExecutionPolicy] = None
 
     def __repr__(self) -> str:
         return f"<AerBackend(name={self.name},num_qubits={self.num_qubits},platform_id={self.id})>"
@@ -61,6 +70,133 @@ class AerBackend(BaseBackend):
     def target(self):
         return self._target
 
+    def enable_local_execution(
+        self,
+        max_qubits: Optional[int] = 10,
+        max_depth: Optional[int] = None,
+        max_shots: Optional[int] = None,
+    ) -> None:
+        """Simulates the circuits within every threshold on a local
+        ``AerSimulator`` with the same options and noise model, instead of
+        submitting them. ``None`` means no limit.
+
+        Runs mixing local and remote circuits return a ``HybridJob``.
+        """
+        self._local_policy = LocalExecutionPolicy(
+            max_qubits=max_qubits, max_depth=max_depth, max_shots=max_shots
+        )
+
+    def disable_local_execution(self) -> None:
+        self._local_policy = None
+
+    def run(
+        self, circuits: Union[QuantumCircuit, List[QuantumCircuit]], **run_options
+    ) -> JobV1:
+        """Runs the circuits on the platform.
+
+        With ``parameter_binds`` (one ``{Parameter: values}`` dict per
+        circuit, as with ``AerSimulator``), each parametrized circuit is sent
+        once along with a table of its parameter values, and bound on the
+        platform at runtime. The result holds one experiment per binding, in
+        circuit order.
+        """
+        circuits, run_options = self._bind_at_runtime(circuits, run_options)
+
+        return super().run(circuits, **run_options)
+
+    async def arun(
+        self, circuits: Union[QuantumCircuit, List[QuantumCircuit]], **run_options
+    ) -> JobV1:
+        circuits, run_options = self._bind_at_runtime(circuits, run_options)
+
+        return await super().arun(circuits, **run_options)
+
+    def _bind_at_runtime(
+        self, circuits: Union[QuantumCircuit, List[QuantumCircuit]], run_options: dict
+    ):
+        parameter_binds = run_options.get("parameter_binds")
+
+        if parameter_binds is None:
+            return circuits, run_options
+
+        if not isinstance(circuits, List):
+            circuits = [circuits]
+
+        circuits, table = to_parameter_table(circuits, parameter_binds)
+        run_options = dict(
+            run_options, parameter_binds=table, runtime_parameter_bind_enable=True
+        )
+
+        return circuits, run_options
+
+    def _create_jobs(
+        self, circuits: List[QuantumCircuit], job_config: dict
+    ) -> List[BaseJob]:
+        job_config = dict(job_config)
+        parameter_binds = job_config.pop("parameter_binds", None)
+
+        jobs = super()._create_jobs(circuits, job_config)
+
+        if parameter_binds is None:
+            return jobs
+
+        # Each job gets the parameter table of its own circuits
+        start = 0
+        for job in jobs:
+            stop = start + len(job._circuits)
+            job._config["parameter_binds"] = parameter_binds[start:stop]
+            start = stop
+
+        return jobs
+
+    def _uses_run_layers(self, job_config: dict) -> bool:
+        # Runs with a parameter table are never simulated locally, see _run
+        return super()._uses_run_layers(job_config) or (
+            self._local_policy is not None
+            and job_config.get("parameter_binds") is None
+        )
+
+    def _run(
+        self,
+        circuits: List[QuantumCircuit],
+        job_config: dict,
+        session_id: Optional[str],
+    ) -> JobV1:
+        if job_config.get("parameter_binds") is not None:
+            # The table is aligned with the circuits of this run, which are
+            # neither coalesced with other runs nor simulated locally
+            return self._submit_jobs(
+                self._create_jobs(circuits, job_config), session_id
+            )
+
+        if self._local_policy is None:
+            return super()._run(circuits, job_config, session_id)
+
+        shots = job_config.get("shots")
+        local = [self._local_policy.is_local(c, shots) for c in circuits]
+
+        if not any(local):
+            return super()._run(circuits, job_config, session_id)
+
+        local_indices = [i for i, is_local in enumerate(local) if is_local]
+        remote_indices = [i for i, is_local in enumerate(local) if not is_local]
+
+        parts = [
+            (
+                local_indices,
+                run_locally([circuits[i] for i in local_indices], job_config),
+                True,
+            )
+        ]
+
+        if remote_indices:
+            remote_job = super()._run(
+                [circuits[i] for i in remote_indices], job_config, session_id
+            )
+            parts.append((remote_indices, remote_job, False))
+
+        return HybridJob(self, parts, len(circuits))
+
     @classmethod
     def _default_options(self):
         return Options(
@@ -68,6 +204,11 @@ class AerBackend(BaseBackend):
             session_name="qs-qiskit-aer",
             session_max_duration="59m",
             session_max_idle_duration="59m",
+            polling_strategy=None,
+            max_payload_bytes=None,
+            serialization_workers=None,
+            serialization_threshold=64,
+            result_workers=8,
             shots=1000,
             memory=False,
             seed_simulator=None,
@@ -81,6 +222,7 @@ class AerBackend(BaseBackend):
             validation_threshold=1e-8,
             accept_distributed_results=None,
             runtime_parameter_bind_enable=False,
+            parameter_binds=None,
             statevector_parallel_threshold=14,
             statevector_sample_measure_opt=10,
             stabilizer_max_snapshot_probabilities=32,
@@ -0,0 +1,209 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import threading
+import time
+
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.result import Result
+from qiskit.providers import JobStatus, JobV1
+
+from qiskit_aer import AerSimulator
+
+from qiskit_scaleway.backends.composite_job import gather_futures, merge_results
+
+
+class LocalExecutionPolicy:
+    """Decides which circuits are simulated locally rather than on the
+    platform: those within every threshold, ``None`` meaning no limit.
+
+    :param max_qubits: maximum number of qubits of a local circuit
+    :param max_depth: maximum depth of a local circuit
+    :param max_shots: maximum number of shots of a local run
+    """
+
+    def __init__(
+        self,
+        max_qubits: Optional[int] = 10,
+        max_depth: Optional[int] = None,
+        max_shots: Optional[int] = None,
+    ):
+        self.max_qubits = max_qubits
+        self.max_depth = max_depth
+        self.max_shots = max_shots
+
+    def is_local(self, circuit: QuantumCircuit, shots: Optional[int]) -> bool:
+        if self.max_shots is not None and (shots or 0) > self.max_shots:
+            return False
+
+        if self.max_qubits is not None and circuit.num_qubits > self.max_qubits:
+            return False
+
+        if self.max_depth is not None and circuit.depth() > self.max_depth:
+            return False
+
+        return True
+
+    def __repr__(self) -> str:
+        return f"<LocalExecutionPolicy(max_qubits={self.max_qubits},max_depth={self.max_depth},max_shots={self.max_shots})>"
+
+
+def run_locally(circuits: List[QuantumCircuit], job_config: dict) -> JobV1:
+    """Runs circuits on a local ``AerSimulator`` configured with the Aer
+    options of the job (shots, seed, noise model, method...)."""
+    default_options = AerSimulator._default_options()
+    options = {
+        key: value
+        for key, value in job_config.items()
+        if value is not None and hasattr(default_options, key)
+    }
+
+    simulator = AerSimulator(**options)
+
+    return simulator.run(transpile(circuits, simulator))
+
+
+class HybridJob(JobV1):
+    """A run whose circuits were split between the local simulator and the
+    platform.
+
+    ``result()`` returns a single ``Result`` whose experiments follow the
+    original circuit order.
+    """
+
+    def __init__(
+        self, backend, parts: List[Tuple[List[int], JobV1, bool]], num_circuits: int
+    ) -> None:
+        super().__init__(backend, ",".join(job.job_id() for _, job, _ in parts))
+        self._parts = parts
+        self._num_circuits = num_circuits
+        self._future: Optional[Future] = None
+
+    @property
+    def jobs(self) -> List[JobV1]:
+        return [job for _, job, _ in self._parts]
+
+    @property
+    def session_id(self) -> Optional[str]:
+        for _, job, local in self._parts:
+            if not local:
+                return job.session_id
+
+        return None
+
+    def submit(self):
+        raise RuntimeError("HybridJob is submitted through its sub-jobs")
+
+    def future(self) -> Future:
+        """Returns a future resolved with the job results of the platform
+        sub-job, once the local circuits are simulated too. It fails as soon
+        as one of the parts fails."""
+        if self._future is None or self._future.cancelled():
+            self._future = gather_futures(
+                [
+                    _local_future(job) if local else job.future()
+                    for _, job, local in self._parts
+                ]
+            )
+
+        return self._future
+
+    def status(self) -> JobStatus:
+        statuses = [job.status() for job in self.jobs]
+
+        if JobStatus.ERROR in statuses:
+            return JobStatus.ERROR
+
+        if all(status == JobStatus.DONE for status in statuses):
+            return JobStatus.DONE
+
+        if JobStatus.RUNNING in statuses or JobStatus.DONE in statuses:
+            return JobStatus.RUNNING
+
+        return JobStatus.QUEUED
+
+    def result(self, timeout: Optional[float] = None, **kwargs) -> Result:
+        start_time = time.time()
+        results = []
+
+        for _, job, local in self._parts:
+            remaining = None
+
+            if timeout is not None:
+                remaining = max(0, timeout - (time.time() - start_time))
+
+            if local:
+                results.append(job.result(timeout=remaining))
+            else:
+                results.append(job.result(timeout=remaining, **kwargs))
+
+        return self._merge(results)
+
+    async def aresult(self, timeout: Optional[float] = None) -> Result:
+        """Asyncio counterpart of ``result``, the local simulation is awaited
+        in the default executor."""
+        loop = asyncio.get_running_loop()
+
+        results = await asyncio.gather(
+            *(
+                (
+                    loop.run_in_executor(None, lambda job=job: job.result(timeout))
+                    if local
+                    else job.aresult(timeout=timeout)
+                )
+                for _, job, local in self._parts
+            )
+        )
+
+        return self._merge(list(results))
+
+    def _merge(self, results: List[Result]) -> Result:
+        experiments = [None] * self._num_circuits
+        merged_parts = []
+
+        for (indices, _, _), result in zip(self._parts, results):
+            result = merge_results([result])
+            merged_parts.append(result)
+
+            for index, experiment in zip(indices, result.results):
+                experiments[index] = experiment
+
+        merged = merge_results(merged_parts, job_id=self.job_id())
+        merged.backend_name = self.backend().name
+        merged.backend_version = self.backend().version
+        merged.results = experiments
+
+        return merged
+
+
+def _local_future(job: JobV1) -> Future:
+    """Future resolved once a local simulation is finished, with no job
+    results since nothing ran on the platform."""
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    def _wait():
+        try:
+            job.result()
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result([])
+
+    threading.Thread(target=_wait, daemon=True).start()
+
+    return future
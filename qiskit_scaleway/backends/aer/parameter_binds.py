@@ -0,0 +1,65 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+from typing import Dict, List, Tuple
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+
+def to_parameter_table(
+    circuits: List[QuantumCircuit], parameter_binds: List[Dict]
+) -> Tuple[List[QuantumCircuit], List[Dict[str, List[float]]]]:
+    """Converts Aer ``parameter_binds`` (one ``{Parameter: values}`` dict per
+    circuit) into a JSON table bound on the platform at runtime.
+
+    Parameters are renamed by position, as names such as ``θ[0]`` are not kept
+    by the QASM serialization. Returns the renamed circuits and, for each of
+    them, the values of every binding keyed by the new parameter names.
+    """
+    if len(parameter_binds) != len(circuits):
+        raise ValueError(
+            f"Got {len(parameter_binds)} parameter_binds for {len(circuits)} circuits"
+        )
+
+    renamed_circuits = []
+    table = []
+
+    for circuit, binds in zip(circuits, parameter_binds):
+        if set(binds) != set(circuit.parameters):
+            raise ValueError(
+                f"parameter_binds of circuit {circuit.name} do not match its parameters"
+            )
+
+        names = {param: f"_pb{i}" for i, param in enumerate(circuit.parameters)}
+        values = {
+            names[param]: np.asarray(value, dtype=float).ravel().tolist()
+            for param, value in binds.items()
+        }
+
+        if len({len(v) for v in values.values()}) > 1:
+            raise ValueError(
+                f"parameter_binds of circuit {circuit.name} have different lengths"
+            )
+
+        if names:
+            circuit = circuit.assign_parameters(
+                {param: Parameter(name) for param, name in names.items()}
+            )
+
+        renamed_circuits.append(circuit)
+        table.append(values)
+
+    return renamed_circuits, table
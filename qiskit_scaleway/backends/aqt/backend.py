@@ -48,6 +48,11 @@ class AqtBackend(BaseBackend):
             session_name="qs-qiskit-aqt",
             session_max_duration="59m",
             session_max_idle_duration="59m",
+            polling_strategy=None,
+            max_payload_bytes=None,
+            serialization_workers=None,
+            serialization_threshold=64,
+            result_workers=8,
             shots=100,
             memory=True,
             open_pulse=False,
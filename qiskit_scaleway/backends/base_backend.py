@@ -11,12 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import logging
+import randomname
 import warnings
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Optional
 from abc import ABC
 
-from typing import Union, List
+from typing import Union, List, Tuple, Type
 
 from qiskit.providers import BackendV2
 from qiskit.circuit import QuantumCircuit
@@ -24,9 +28,27 @@ from qiskit.circuit import QuantumCircuit
 from scaleway_qaas_client.v1alpha1 import QaaSClient, QaaSPlatform
 
 from .base_job import BaseJob
+from .coalescer import CoalescedJob, RunCoalescer
+from .composite_job import CompositeJob
+from .inflight import InFlightJobs
+from .result_memo import MemoizedJob, ResultMemo
+from .session_pool import SessionPool
+
+_MAX_SUBMIT_WORKERS = 8
+
+_logger = logging.getLogger(__name__)
 
 
 class BaseBackend(BackendV2, ABC):
+    _job_name_prefix = "qj-qiskit"
+
+    # Maximum number of circuits the platform accepts in a single job,
+    # on top of the platform max_circuit_count
+    _max_circuits_per_job: Optional[int] = None
+
+    # Option seeding the platform, runs setting it always give the same result
+    _seed_option: Optional[str] = None
+
     def __init__(
         self,
         provider,
@@ -43,6 +65,10 @@ class BaseBackend(BackendV2, ABC):
 
         self._platform = platform
         self._client = client
+        self._session_pool = SessionPool(self)
+        self._coalescer: Optional[RunCoalescer] = None
+        self._inflight: Optional[InFlightJobs] = None
+        self._result_memo: Optional[ResultMemo] = None
 
     @property
     def num_qubits(self) -> int:
@@ -52,6 +78,10 @@ class BaseBackend(BackendV2, ABC):
     def max_circuits(self) -> int:
         return self._platform.max_circuit_count
 
+    @property
+    def job_cls(self) -> Type[BaseJob]:
+        return BaseJob
+
     @property
     def id(self) -> str:
         return self._platform.id
@@ -60,12 +90,178 @@ class BaseBackend(BackendV2, ABC):
     def availability(self):
         return self._platform.availability
 
+    def enable_coalescing(
+        self, window: float = 0.05, max_circuits: Optional[int] = None
+    ) -> None:
+        """Makes ``run()`` buffer its calls for up to ``window`` seconds and
+        submit the calls sharing the same options and session as one job.
+
+        ``run()`` then returns a ``CoalescedJob`` per call, whose result only
+        holds the experiments of that call.
+
+        :param window: maximum number of seconds a call is buffered
+        :param max_circuits: optional maximum number of circuits per shared
+            job, defaults to the platform limit
+        """
+        self.disable_coalescing()
+        self._coalescer = RunCoalescer(self, window=window, max_circuits=max_circuits)
+
+    def disable_coalescing(self) -> None:
+        """Submits the buffered calls and stops coalescing ``run()`` calls."""
+        coalescer, self._coalescer = self._coalescer, None
+
+        if coalescer is not None:
+            coalescer.flush()
+
+    def enable_deduplication(self) -> None:
+        """Makes ``run()`` return the in-flight job of an identical submission
+        (same circuits, options, shots and session) instead of submitting the
+        circuits again. A job stops being shared once it is finished."""
+        if self._inflight is None:
+            self._inflight = InFlightJobs()
+
+    def disable_deduplication(self) -> None:
+        self._inflight = None
+
+    @property
+    def inflight_jobs(self) -> Optional[InFlightJobs]:
+        """Registry of the deduplicated in-flight jobs, exposes ``hits``."""
+        return self._inflight
+
+    def enable_result_memoization(self, max_size: int = 1024) -> None:
+        """Makes seeded runs return the result of the first identical run
+        (same circuits, options, shots and seed) without submitting anything.
+
+        Only backends whose platform takes a seed support it, runs without a
+        seed are always submitted.
+
+        :param max_size: maximum number of runs kept
+        :raises ValueError: if the platform of the backend takes no seed
+        """
+        if self._seed_option is None:
+            raise ValueError(
+                f"{self.name} runs cannot be seeded, their results cannot be memoized"
+            )
+
+        self._result_memo = ResultMemo(max_size=max_size)
+
+    def disable_result_memoization(self) -> None:
+        self._result_memo = None
+
+    @property
+    def result_memo(self) -> Optional[ResultMemo]:
+        """Memo of the seeded runs, exposes ``hits`` and ``misses``."""
+        return self._result_memo
+
     def run(
         self, circuits: Union[QuantumCircuit, List[QuantumCircuit]], **run_options
-    ) -> BaseJob:
+    ) -> Union[BaseJob, CompositeJob, CoalescedJob, MemoizedJob]:
+        if not isinstance(circuits, List):
+            circuits = [circuits]
+
+        job_config, session_id = self._job_config(run_options)
+
+        return self._memoize(circuits, job_config, session_id)
+
+    def _memoize(
+        self,
+        circuits: List[QuantumCircuit],
+        job_config: dict,
+        session_id: Optional[str],
+    ) -> Union[BaseJob, CompositeJob, CoalescedJob, MemoizedJob]:
+        if self._is_memoized(job_config):
+            return self._result_memo.get_or_submit(
+                self, circuits, job_config, session_id, self._deduplicate
+            )
+
+        return self._deduplicate(circuits, job_config, session_id)
+
+    def _is_memoized(self, job_config: dict) -> bool:
+        return (
+            self._result_memo is not None
+            and job_config.get(self._seed_option) is not None
+        )
+
+    def _uses_run_layers(self, job_config: dict) -> bool:
+        """Whether a run goes through memoization, deduplication, coalescing
+        or any other layer of ``_run``, which are only implemented by the
+        blocking ``run`` path."""
+        return (
+            self._is_memoized(job_config)
+            or self._inflight is not None
+            or self._coalescer is not None
+        )
+
+    def _deduplicate(
+        self,
+        circuits: List[QuantumCircuit],
+        job_config: dict,
+        session_id: Optional[str],
+    ) -> Union[BaseJob, CompositeJob, CoalescedJob]:
+        if self._inflight is not None:
+            return self._inflight.get_or_submit(
+                circuits, job_config, session_id, self._run
+            )
+
+        return self._run(circuits, job_config, session_id)
+
+    def _run(
+        self,
+        circuits: List[QuantumCircuit],
+        job_config: dict,
+        session_id: Optional[str],
+    ) -> Union[BaseJob, CompositeJob, CoalescedJob]:
+        if self._coalescer is not None:
+            return self._coalescer.submit(circuits, job_config, session_id)
+
+        return self._submit_jobs(self._create_jobs(circuits, job_config), session_id)
+
+    async def arun(
+        self, circuits: Union[QuantumCircuit, List[QuantumCircuit]], **run_options
+    ) -> Union[BaseJob, CompositeJob, CoalescedJob, MemoizedJob]:
+        """Asyncio counterpart of ``run``, the jobs are submitted concurrently
+        on the running event loop.
+
+        Runs that are memoized, deduplicated, coalesced or simulated locally go
+        through the blocking path in the default executor instead, so they
+        share their jobs with ``run`` calls."""
         if not isinstance(circuits, List):
             circuits = [circuits]
 
+        job_config, session_id = self._job_config(run_options)
+
+        if self._uses_run_layers(job_config):
+            loop = asyncio.get_running_loop()
+
+            return await loop.run_in_executor(
+                None, self._memoize, circuits, job_config, session_id
+            )
+
+        jobs = self._create_jobs(circuits, job_config)
+
+        if session_id in ["auto", None]:
+            loop = asyncio.get_running_loop()
+            session_id = await loop.run_in_executor(None, self._session_pool.acquire)
+
+        outcomes = await asyncio.gather(
+            *(self._asubmit_job(job, session_id) for job in jobs),
+            return_exceptions=True,
+        )
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+
+        if errors:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._cancel_submitted, jobs)
+            raise errors[0]
+
+        if len(jobs) == 1:
+            return jobs[0]
+
+        return CompositeJob(self, jobs)
+
+    def _job_config(self, run_options: dict) -> Tuple[dict, Optional[str]]:
+        """Merges the run options into the backend options, and removes the
+        client-side ones. Returns the job config and the session ID."""
         job_config = dict(self._options.items())
 
         for kwarg in run_options:
@@ -73,7 +269,7 @@ class BaseBackend(BackendV2, ABC):
                 warnings.warn(
                     f"Option {kwarg} is not used by this backend",
                     UserWarning,
-                    stacklevel=2,
+                    stacklevel=3,
                 )
             else:
                 job_config[kwarg] = run_options[kwarg]
@@ -85,19 +281,143 @@ class BaseBackend(BackendV2, ABC):
         job_config.pop("session_max_duration")
         job_config.pop("session_max_idle_duration")
 
-        job = BaseJob(
-            backend=self,
-            client=self._client,
-            circuits=circuits,
-            config=job_config,
+        return job_config, session_id
+
+    def _create_jobs(
+        self, circuits: List[QuantumCircuit], job_config: dict
+    ) -> List[BaseJob]:
+        job_config = dict(job_config)
+        max_payload_bytes = job_config.pop("max_payload_bytes", None)
+
+        job_cls = self.job_cls
+        batches = self._split_circuits(
+            circuits,
+            job_cls,
+            max_payload_bytes=max_payload_bytes,
+            max_circuits=self._max_circuits_per_job,
         )
 
+        jobs = [
+            job_cls(
+                backend=self,
+                client=self._client,
+                circuits=batch,
+                config=job_config,
+                name=f"{self._job_name_prefix}-{randomname.get_name()}",
+            )
+            for batch in batches
+        ]
+
+        return jobs
+
+    def _split_circuits(
+        self,
+        circuits: List[QuantumCircuit],
+        job_cls: Type[BaseJob],
+        max_payload_bytes: Optional[int] = None,
+        max_circuits: Optional[int] = None,
+    ) -> List[List[QuantumCircuit]]:
+        """Splits circuits in batches honoring the platform circuit limit and
+        an optional budget of serialized program bytes per job."""
+        limits = [
+            limit
+            for limit in (max_circuits, self.max_circuits)
+            if isinstance(limit, int) and limit > 0
+        ]
+        max_circuits = min(limits) if limits else len(circuits)
+
+        batches = []
+        batch = []
+        batch_bytes = 0
+
+        for circuit in circuits:
+            size = 0
+
+            if max_payload_bytes:
+                size = len(job_cls._to_quantum_program(circuit).serialization)
+
+            if batch and (
+                len(batch) >= max_circuits
+                or (max_payload_bytes and batch_bytes + size > max_payload_bytes)
+            ):
+                batches.append(batch)
+                batch = []
+                batch_bytes = 0
+
+            batch.append(circuit)
+            batch_bytes += size
+
+        if batch:
+            batches.append(batch)
+
+        return batches or [circuits]
+
+    def _submit_jobs(
+        self, jobs: List[BaseJob], session_id: Optional[str]
+    ) -> Union[BaseJob, CompositeJob]:
         if session_id in ["auto", None]:
-            session_id = self.start_session(name=f"auto-{self._options.session_name}")
-            assert session_id is not None
+            session_id = self._session_pool.acquire()
+
+        if len(jobs) == 1:
+            self._submit_job(jobs[0], session_id)
+            return jobs[0]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(jobs), _MAX_SUBMIT_WORKERS)
+        ) as executor:
+            futures = [
+                executor.submit(self._submit_job, job, session_id) for job in jobs
+            ]
+
+        errors = [f.exception() for f in futures if f.exception() is not None]
+
+        if errors:
+            self._cancel_submitted(jobs)
+            raise errors[0]
+
+        return CompositeJob(self, jobs)
+
+    def _cancel_submitted(self, jobs: List[BaseJob]) -> None:
+        """Cancels the jobs of a run that could only be partly submitted, the
+        caller gets no handle on them."""
+        for job in jobs:
+            if not job.job_id():
+                continue
+
+            try:
+                job.cancel()
+            except Exception as e:
+                _logger.warning("Cannot cancel job %s: %s", job.job_id(), e)
+
+    def _submit_job(self, job: BaseJob, session_id: Optional[str]) -> None:
+        if session_id in ["auto", None]:
+            session_id = self._session_pool.acquire()
 
         job.submit(session_id)
 
+        # Let the provider's shared monitor track the job from now on
+        if getattr(self.provider, "job_monitor", None) is not None:
+            job.future()
+
+    async def _asubmit_job(self, job: BaseJob, session_id: str) -> None:
+        await job.asubmit(session_id)
+
+        if getattr(self.provider, "job_monitor", None) is not None:
+            job.future()
+
+    def _attach_job(
+        self,
+        job_id: str,
+        session_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> BaseJob:
+        """Builds the job object of an already submitted job."""
+        job = self.job_cls(
+            backend=self, client=self._client, circuits=[], config={}, name=name
+        )
+        job._job_id = job_id
+        job._session_id = session_id
+
         return job
 
     def start_session(
@@ -124,6 +444,11 @@ class BaseBackend(BackendV2, ABC):
             max_idle_duration=max_idle_duration,
         ).id
 
+    def close(self):
+        """Terminates the sessions automatically opened by ``run()``."""
+        self.disable_coalescing()
+        self._session_pool.close()
+
     def stop_session(self, session_id: str):
         self._client.terminate_session(
             session_id=session_id,
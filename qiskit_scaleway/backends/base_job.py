@@ -11,21 +11,44 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import logging
+import multiprocessing
+import queue
+import threading
 import time
 import httpx
 import randomname
 
-from typing import List, Union, Optional, Dict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from typing import Callable, List, Union, Optional, Dict, Tuple
 
 from qiskit import QuantumCircuit
 from qiskit.result import Result
 from qiskit.providers import JobV1
 from qiskit.providers import JobError, JobTimeoutError, JobStatus
+from qiskit.transpiler.passes import RemoveBarriers
 
 from qiskit_scaleway.versions import USER_AGENT
+from qiskit_scaleway.utils import (
+    ProgramCache,
+    StreamedProgramResult,
+    decode_result_stream,
+    default_http_client,
+    error_status_code,
+)
+from .polling import (
+    PollingStrategy,
+    FixedPolling,
+    AdaptivePolling,
+)
 
 from qio.core import (
     QuantumProgram,
+    QuantumProgramSerializationFormat,
     QuantumProgramResult,
     QuantumComputationModel,
     QuantumComputationParameters,
@@ -36,11 +59,57 @@ from qio.core import (
 
 from scaleway_qaas_client.v1alpha1 import (
     QaaSClient,
+    QaaSJob,
     QaaSJobResult,
 )
 
+_logger = logging.getLogger(__name__)
+
+# Serialized programs shared by every job, see ProgramCache.hits/misses
+PROGRAM_CACHE = ProgramCache()
+
+# Below this number of circuits, serializing in a process pool costs more
+# than it saves
+_SERIALIZATION_THRESHOLD = 64
+
+# Result downloads larger than this (or of unknown size) are decoded on the fly
+_STREAMING_THRESHOLD = 4 * 1024 * 1024
+
+# Maximum number of program results downloaded and parsed at once
+_RESULT_WORKERS = 8
+
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    with _process_pools_lock:
+        pool = _process_pools.get(max_workers)
+
+        if pool is None:
+            # Forking a process running the monitor, session and HTTP threads
+            # can deadlock the children on a lock held by another thread
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _process_pools[max_workers] = pool
+
+        return pool
+
+
+def _discard_process_pool(max_workers: int) -> None:
+    with _process_pools_lock:
+        pool = _process_pools.pop(max_workers, None)
+
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 class BaseJob(JobV1):
+    _serialization_format = QuantumProgramSerializationFormat.QASM_V3
+    _remove_barriers = False
+
     def __init__(
         self,
         backend,
@@ -53,16 +122,41 @@ class BaseJob(JobV1):
         self._name = name or f"qj-qiskit-{randomname.get_name()}"
         self._client = client
         self._circuits = circuits
-        self._config = config
+        self._config = dict(config)
+        self._serialization_workers = self._config.pop("serialization_workers", None)
+        self._serialization_threshold = self._config.pop(
+            "serialization_threshold", _SERIALIZATION_THRESHOLD
+        )
+        self._polling_strategy: Optional[PollingStrategy] = self._config.pop(
+            "polling_strategy", None
+        )
+        self._result_workers = self._config.pop(
+            "result_workers", backend.options.get("result_workers", _RESULT_WORKERS)
+        )
+        self._session_id = None
+        self._last_status = None
         self._last_progress_message = ""
+        self._result_timings: List[Dict[str, float]] = []
+        self._future: Optional[Future] = None
 
     @property
     def name(self):
         return self._name
 
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._session_id
+
     def status(self) -> JobStatus:
-        job = self._client.get_job(self._job_id)
+        return self._update_status(self._client.get_job(self._job_id))
+
+    def cancel(self) -> None:
+        if self._job_id == None:
+            raise JobError("Job ID error")
+
+        self._client.cancel_job(self._job_id)
 
+    def _update_status(self, job: QaaSJob) -> JobStatus:
         status_mapping = {
             "running": JobStatus.RUNNING,
             "waiting": JobStatus.QUEUED,
@@ -72,19 +166,123 @@ class BaseJob(JobV1):
         if job.progress_message is not None:
             self._last_progress_message = job.progress_message
 
-        return status_mapping.get(job.status, JobStatus.ERROR)
+        self._last_status = status_mapping.get(job.status, JobStatus.ERROR)
+
+        return self._last_status
+
+    def _get_http_client(self) -> httpx.Client:
+        return (
+            getattr(self.backend().provider, "http_client", None)
+            or default_http_client()
+        )
+
+    def _get_job_monitor(self):
+        return getattr(self.backend().provider, "job_monitor", None)
+
+    def future(self) -> Future:
+        """Returns a future resolved with the job results once the job is finished.
+
+        The job is polled by the provider's shared ``JobMonitor``, with the
+        polling strategy given to ``run()`` or set on the backend if any.
+        """
+        if self._job_id == None:
+            raise JobError("Job ID error")
+
+        if self._future is not None and not self._future.cancelled():
+            return self._future
+
+        job_monitor = self._get_job_monitor()
+
+        if job_monitor is None:
+            raise JobError("No job monitor available for this backend")
+
+        self._future = job_monitor.watch(
+            self, self._get_polling_strategy(None, None)
+        )
+
+        return self._future
+
+    def _watch(self, polling_strategy: Optional[PollingStrategy]) -> Future:
+        """Returns the monitor future of the job, polled from now on with the
+        given strategy. The job is never polled both by the monitor and by the
+        caller."""
+        future = self.future()
+
+        if polling_strategy is not None and not future.done():
+            self._get_job_monitor().watch(self, polling_strategy)
+
+        return future
+
+    @classmethod
+    def _to_quantum_program(cls, circuit: QuantumCircuit) -> QuantumProgram:
+        return PROGRAM_CACHE.get_or_create(
+            circuit,
+            (cls._serialization_format, cls._remove_barriers),
+            cls._serialize_circuit,
+        )
+
+    def _to_quantum_programs(
+        self, circuits: List[QuantumCircuit]
+    ) -> List[QuantumProgram]:
+        """Serializes circuits in order, through a process pool when the
+        ``serialization_workers`` option is set and the batch is at least
+        ``serialization_threshold`` circuits long."""
+        workers = self._serialization_workers
+
+        if not workers or len(circuits) < max(self._serialization_threshold, 2):
+            return list(map(self._to_quantum_program, circuits))
+
+        return PROGRAM_CACHE.get_or_create_many(
+            circuits,
+            (self._serialization_format, self._remove_barriers),
+            lambda missing: self._serialize_in_pool(missing, workers),
+        )
+
+    @classmethod
+    def _serialize_in_pool(
+        cls, circuits: List[QuantumCircuit], workers: int
+    ) -> List[QuantumProgram]:
+        if len(circuits) < 2:
+            return list(map(cls._serialize_circuit, circuits))
+
+        # Large chunks limit the pickling round trips, map() keeps the order
+        chunksize = max(1, len(circuits) // (workers * 4))
+
+        try:
+            pool = _get_process_pool(workers)
+            return list(
+                pool.map(cls._serialize_circuit, circuits, chunksize=chunksize)
+            )
+        except BrokenProcessPool:
+            _discard_process_pool(workers)
+            return list(map(cls._serialize_circuit, circuits))
+
+    @classmethod
+    def _serialize_circuit(cls, circuit: QuantumCircuit) -> QuantumProgram:
+        if cls._remove_barriers:
+            circuit = RemoveBarriers()(circuit)
+
+        return QuantumProgram.from_qiskit_circuit(circuit, cls._serialization_format)
 
     def submit(self, session_id: str) -> None:
         if self._job_id:
             raise RuntimeError(f"Job already submitted (ID: {self._job_id})")
 
+        computation_model_json, computation_parameters_json = self._build_payloads()
+
+        self._create_job(
+            session_id=session_id,
+            computation_model_json=computation_model_json,
+            computation_parameters_json=computation_parameters_json,
+        )
+
+    def _build_payloads(self) -> Tuple[str, str]:
+        """Returns the serialized computation model and parameters of the job."""
         options = self._config.copy()
         shots = options.pop("shots")
         memory = options.pop("memory", False)
 
-        programs = list(
-            map(lambda c: QuantumProgram.from_qiskit_circuit(c), self._circuits)
-        )
+        programs = self._to_quantum_programs(self._circuits)
 
         noise_model = options.pop("noise_model", None)
         if noise_model:
@@ -114,42 +312,170 @@ class BaseJob(JobV1):
             },
         ).to_json_str()
 
-        model = self._client.create_model(
+        return computation_model_json, computation_parameters_json
+
+    def _create_job(
+        self,
+        session_id: str,
+        computation_model_json: str,
+        computation_parameters_json: str,
+    ) -> None:
+        model_id, cache_key = self._create_model(computation_model_json)
+
+        def _create(model_id: str) -> str:
+            return self._client.create_job(
+                name=self._name,
+                session_id=session_id,
+                model_id=model_id,
+                parameters=computation_parameters_json,
+            ).id
+
+        try:
+            job_id = _create(model_id)
+        except Exception as e:
+            if cache_key is None or error_status_code(e) != 404:
+                raise
+
+            # The cached model has expired server side, push it again
+            self._get_model_cache().invalidate(cache_key)
+            model_id, _ = self._create_model(computation_model_json)
+            job_id = _create(model_id)
+
+        self._last_progress_message = ""
+        self._session_id = session_id
+        self._job_id = job_id
+
+    def _get_model_cache(self):
+        return getattr(self.backend().provider, "model_cache", None)
+
+    def _model_cache_key(self, computation_model_json: str) -> Optional[str]:
+        model_cache = self._get_model_cache()
+
+        if model_cache is None:
+            return None
+
+        return model_cache.key(
+            computation_model_json,
+            getattr(self.backend().provider, "project_id", ""),
+            self.backend().id,
+        )
+
+    def _create_model(self, computation_model_json: str) -> Tuple[str, Optional[str]]:
+        """Pushes the model unless an identical one was already pushed, returns
+        its ID and the cache key when it comes from the model cache."""
+        model_cache = self._get_model_cache()
+        cache_key = self._model_cache_key(computation_model_json)
+
+        if cache_key is not None:
+            model_id = model_cache.get(cache_key)
+
+            if model_id:
+                return model_id, cache_key
+
+        # Compressed uploads go through the provider's model client
+        client = getattr(self.backend().provider, "model_client", None)
+
+        model = (client or self._client).create_model(
             payload=computation_model_json,
         )
 
         if not model:
             raise RuntimeError("Failed to push circuit data")
 
+        if cache_key is not None:
+            model_cache.put(cache_key, model.id)
+
+        return model.id, None
+
+    def _get_async_client(self):
+        async_client = getattr(self.backend().provider, "async_client", None)
+
+        if async_client is None:
+            raise JobError("The asyncio API requires a ScalewayProvider backend")
+
+        return async_client
+
+    async def asubmit(self, session_id: str) -> None:
+        """Asyncio counterpart of ``submit``: the circuits are serialized in the
+        default executor and the API calls are made on the event loop."""
+        if self._job_id:
+            raise RuntimeError(f"Job already submitted (ID: {self._job_id})")
+
+        loop = asyncio.get_running_loop()
+        computation_model_json, computation_parameters_json = (
+            await loop.run_in_executor(None, self._build_payloads)
+        )
+
+        client = self._get_async_client()
+        model_id, cache_key = await self._acreate_model(computation_model_json)
+
+        async def _create(model_id: str) -> str:
+            job = await client.create_job(
+                name=self._name,
+                session_id=session_id,
+                model_id=model_id,
+                parameters=computation_parameters_json,
+            )
+
+            return job.id
+
+        try:
+            job_id = await _create(model_id)
+        except Exception as e:
+            if cache_key is None or error_status_code(e) != 404:
+                raise
+
+            self._get_model_cache().invalidate(cache_key)
+            model_id, _ = await self._acreate_model(computation_model_json)
+            job_id = await _create(model_id)
+
         self._last_progress_message = ""
-        self._job_id = self._client.create_job(
-            name=self._name,
-            session_id=session_id,
-            model_id=model.id,
-            parameters=computation_parameters_json,
-        ).id
+        self._session_id = session_id
+        self._job_id = job_id
+
+    async def _acreate_model(
+        self, computation_model_json: str
+    ) -> Tuple[str, Optional[str]]:
+        model_cache = self._get_model_cache()
+        cache_key = self._model_cache_key(computation_model_json)
+
+        if cache_key is not None:
+            model_id = model_cache.get(cache_key)
+
+            if model_id:
+                return model_id, cache_key
+
+        model = await self._get_async_client().create_model(
+            payload=computation_model_json
+        )
+
+        if not model:
+            raise RuntimeError("Failed to push circuit data")
+
+        if cache_key is not None:
+            model_cache.put(cache_key, model.id)
+
+        return model.id, None
 
     def result(
-        self, timeout: Optional[int] = None, fetch_interval: int = 3
+        self,
+        timeout: Optional[int] = None,
+        fetch_interval: Optional[int] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
     ) -> Union[Result, List[Result]]:
         if self._job_id == None:
             raise JobError("Job ID error")
 
-        job_results = self._wait_for_result(timeout, fetch_interval)
-
-        program_results = list(
-            map(
-                lambda r: self._extract_payload_from_response(r).to_qiskit_result(
-                    backend_name=self.backend().name,
-                    backend_version=self.backend().version,
-                    job_id=self._job_id,
-                    qobj_id=", ".join(x.name for x in self._circuits),
-                    success=r.url is not None or r.result is not None,
-                    status=JobStatus.DONE,
-                    date=r.created_at,
-                ),
-                job_results,
+        job_results = self._cached_job_results()
+        cached = job_results is not None
+
+        if not cached:
+            job_results = self._wait_for_result(
+                timeout, self._get_polling_strategy(fetch_interval, polling_strategy)
             )
+
+        program_results = self._process_results(
+            job_results, self._to_qiskit_result, store=not cached
         )
 
         if len(program_results) == 1:
@@ -157,27 +483,381 @@ class BaseJob(JobV1):
 
         return program_results
 
-    def _extract_payload_from_response(
+    async def aresult(
+        self, timeout: Optional[float] = None
+    ) -> Union[Result, List[Result]]:
+        """Asyncio counterpart of ``result``: waiting relies on the shared
+        ``JobMonitor`` and the results are downloaded with the provider's
+        async HTTP client, so no thread is held per job."""
+        if self._job_id == None:
+            raise JobError("Job ID error")
+
+        job_results = self._cached_job_results()
+        cached = job_results is not None
+
+        if not cached:
+            job_results = await self._await_job_results(timeout)
+
+        program_results = await self._aprocess_results(
+            job_results, self._to_qiskit_result, store=not cached
+        )
+
+        if len(program_results) == 1:
+            return program_results[0]
+
+        return program_results
+
+    async def _await_job_results(
+        self, timeout: Optional[float]
+    ) -> List[QaaSJobResult]:
+        polling_strategy = self._get_polling_strategy(None, None)
+
+        if self._get_job_monitor() is not None:
+            # Shielded so that a timeout does not cancel the shared future
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(self.future())), timeout
+                )
+            except asyncio.TimeoutError:
+                raise JobTimeoutError("Timed out waiting for result")
+
+        client = self._get_async_client()
+        polling_strategy = polling_strategy or AdaptivePolling()
+        start_time = time.time()
+        requests = 0
+        attempt = 0
+        last_state = None
+
+        while True:
+            if (
+                polling_strategy.max_requests is not None
+                and requests >= polling_strategy.max_requests
+            ):
+                raise JobTimeoutError(
+                    f"Gave up waiting for result after {requests} status requests"
+                )
+
+            status = self._update_status(await client.get_job(self._job_id))
+            requests += 1
+
+            if status == JobStatus.DONE:
+                return await client.list_job_results(self._job_id)
+
+            if status == JobStatus.ERROR:
+                raise JobError(f"Job failed: {self._last_progress_message}")
+
+            state = (status, self._last_progress_message)
+            attempt = attempt + 1 if state == last_state else 0
+            last_state = state
+
+            interval = polling_strategy.next_interval(
+                attempt, status, self._last_progress_message
+            )
+
+            if timeout is not None:
+                remaining = timeout - (time.time() - start_time)
+
+                if remaining <= 0:
+                    raise JobTimeoutError("Timed out waiting for result")
+
+                interval = min(interval, remaining)
+
+            await asyncio.sleep(interval)
+
+    def _to_qiskit_result(
+        self,
+        job_result: QaaSJobResult,
+        program_result: Union[QuantumProgramResult, StreamedProgramResult],
+    ) -> Result:
+        return program_result.to_qiskit_result(
+            backend_name=self.backend().name,
+            backend_version=self.backend().version,
+            job_id=self._job_id,
+            qobj_id=", ".join(x.name for x in self._circuits),
+            success=job_result.url is not None or job_result.result is not None,
+            status=JobStatus.DONE,
+            date=job_result.created_at,
+        )
+
+    @property
+    def result_timings(self) -> List[Dict[str, float]]:
+        """Seconds spent downloading and parsing each program result during
+        the last ``result()`` call, in program order."""
+        return self._result_timings
+
+    def _process_results(
+        self,
+        job_results: List[QaaSJobResult],
+        convert: Callable[[QaaSJobResult, QuantumProgramResult], Result],
+        store: bool = False,
+    ) -> List[Result]:
+        """Downloads, parses and converts the program results concurrently,
+        keeping the order of ``job_results``. With ``store``, the program
+        results are saved to the provider's result cache."""
+
+        def _process(job_result: QaaSJobResult):
+            start = time.perf_counter()
+            payload = self._download_payload(job_result)
+            downloaded = time.perf_counter()
+
+            program_result = self._load_program_result(payload)
+            result = convert(job_result, program_result)
+
+            return (
+                result,
+                {
+                    "download": downloaded - start,
+                    "parse": time.perf_counter() - downloaded,
+                },
+                program_result,
+            )
+
+        max_workers = self._result_workers
+
+        if len(job_results) < 2 or not max_workers or max_workers < 2:
+            processed = list(map(_process, job_results))
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(job_results), max_workers),
+                thread_name_prefix="qiskit-scaleway-results",
+            ) as executor:
+                processed = list(executor.map(_process, job_results))
+
+        self._result_timings = [timings for _, timings, _ in processed]
+
+        if store:
+            self._store_results(job_results, [p for _, _, p in processed])
+
+        return [result for result, _, _ in processed]
+
+    async def _aprocess_results(
+        self,
+        job_results: List[QaaSJobResult],
+        convert: Callable[[QaaSJobResult, QuantumProgramResult], Result],
+        store: bool = False,
+    ) -> List[Result]:
+        loop = asyncio.get_running_loop()
+        max_workers = self._result_workers
+        semaphore = asyncio.Semaphore(max(1, max_workers or 1))
+
+        def _parse(job_result: QaaSJobResult, payload):
+            program_result = self._load_program_result(payload)
+
+            return convert(job_result, program_result), program_result
+
+        async def _process(job_result: QaaSJobResult):
+            async with semaphore:
+                start = time.perf_counter()
+                payload = await self._adownload_payload(job_result)
+                downloaded = time.perf_counter()
+                # Parsing is CPU bound, keep it off the event loop
+                result, program_result = await loop.run_in_executor(
+                    None, _parse, job_result, payload
+                )
+
+            return (
+                result,
+                {
+                    "download": downloaded - start,
+                    "parse": time.perf_counter() - downloaded,
+                },
+                program_result,
+            )
+
+        processed = await asyncio.gather(*map(_process, job_results))
+
+        self._result_timings = [timings for _, timings, _ in processed]
+
+        if store:
+            await loop.run_in_executor(
+                None,
+                self._store_results,
+                job_results,
+                [p for _, _, p in processed],
+            )
+
+        return [result for result, _, _ in processed]
+
+    def _get_result_cache(self):
+        return getattr(self.backend().provider, "result_cache", None)
+
+    def _cached_job_results(self) -> Optional[List[QaaSJobResult]]:
+        """Job results of the provider's result cache, their program result
+        being inlined so that no download is needed."""
+        result_cache = self._get_result_cache()
+
+        if result_cache is None:
+            return None
+
+        entry = result_cache.get(self._job_id)
+
+        if entry is None:
+            return None
+
+        self._last_status = JobStatus.DONE
+
+        return [QaaSJobResult.from_dict(d) for d in entry["job_results"]]
+
+    def _store_results(
+        self,
+        job_results: List[QaaSJobResult],
+        program_results: List[Union[QuantumProgramResult, StreamedProgramResult]],
+    ) -> None:
+        result_cache = self._get_result_cache()
+
+        if result_cache is None:
+            return
+
+        entries = []
+
+        # The results are already there, failing to cache them is not an error
+        try:
+            for job_result, program_result in zip(job_results, program_results):
+                if isinstance(program_result, StreamedProgramResult):
+                    program_result = program_result.to_program_result()
+
+                entry = job_result.to_dict()
+                entry["result"] = program_result.to_json_str()
+                entries.append(entry)
+
+            result_cache.put(
+                self._job_id,
+                {
+                    "name": self._name,
+                    "session_id": self._session_id,
+                    "platform_id": self.backend().id,
+                    "job_results": entries,
+                },
+            )
+        except Exception as e:
+            _logger.warning("Cannot cache the results of job %s: %s", self._job_id, e)
+
+    async def _adownload_payload(
         self, job_result: QaaSJobResult
-    ) -> QuantumProgramResult:
+    ) -> Union[str, QuantumProgramResult, StreamedProgramResult]:
         result = job_result.result
 
         if result is None or result == "":
             url = job_result.url
 
-            if url is not None:
-                resp = httpx.get(url)
+            if url is None:
+                raise RuntimeError("Got result with empty data and url fields")
+
+            http_client = self.backend().provider.async_http_client
+
+            async with http_client.stream("GET", url) as resp:
                 resp.raise_for_status()
-                result = resp.text
-            else:
+
+                size = int(resp.headers.get("content-length") or 0)
+
+                if 0 < size < _STREAMING_THRESHOLD:
+                    await resp.aread()
+                    return resp.text
+
+                return await self._adecode_result_stream(resp)
+
+        return result
+
+    async def _adecode_result_stream(
+        self, resp: httpx.Response
+    ) -> Union[QuantumProgramResult, StreamedProgramResult]:
+        """Decodes a large body in a worker thread, fed with the chunks as
+        they are received so that the whole payload is never held."""
+        loop = asyncio.get_running_loop()
+        chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        decoded = loop.run_in_executor(
+            None, decode_result_stream, iter(chunks.get, None)
+        )
+
+        try:
+            async for chunk in resp.aiter_bytes():
+                if decoded.done():
+                    # The decoder failed, no need to download the rest
+                    break
+
+                chunks.put(chunk)
+        except BaseException:
+            chunks.put(None)
+            # The decoder sees a truncated payload, the download error wins
+            await asyncio.gather(decoded, return_exceptions=True)
+            raise
+
+        chunks.put(None)
+
+        return await decoded
+
+    def _load_program_result(
+        self, payload
+    ) -> Union[QuantumProgramResult, StreamedProgramResult]:
+        if isinstance(payload, str):
+            return QuantumProgramResult.from_json_str(payload)
+
+        return payload
+
+    def _extract_payload_from_response(
+        self, job_result: QaaSJobResult
+    ) -> Union[QuantumProgramResult, StreamedProgramResult]:
+        return self._load_program_result(self._download_payload(job_result))
+
+    def _download_payload(
+        self, job_result: QaaSJobResult
+    ) -> Union[str, QuantumProgramResult, StreamedProgramResult]:
+        """Returns the result payload, large downloads being decoded on the
+        fly instead of being loaded as text."""
+        result = job_result.result
+
+        if result is None or result == "":
+            url = job_result.url
+
+            if url is None:
                 raise RuntimeError("Got result with empty data and url fields")
 
-        return QuantumProgramResult.from_json_str(result)
+            with self._get_http_client().stream("GET", url) as resp:
+                resp.raise_for_status()
+
+                size = int(resp.headers.get("content-length") or 0)
+
+                if 0 < size < _STREAMING_THRESHOLD:
+                    resp.read()
+                    return resp.text
+
+                return decode_result_stream(resp.iter_bytes())
+
+        return result
+
+    def _get_polling_strategy(
+        self,
+        fetch_interval: Optional[int],
+        polling_strategy: Optional[PollingStrategy],
+    ) -> Optional[PollingStrategy]:
+        if polling_strategy:
+            return polling_strategy
+
+        # An explicit fetch_interval keeps the historical fixed polling
+        if fetch_interval is not None:
+            return FixedPolling(fetch_interval)
+
+        # The strategy given to run(), or else the backend one
+        return self._polling_strategy or self.backend().options.get(
+            "polling_strategy"
+        )
 
     def _wait_for_result(
-        self, timeout: Optional[int], fetch_interval: int
+        self, timeout: Optional[int], polling_strategy: Optional[PollingStrategy]
     ) -> List[QaaSJobResult]:
+        # The shared monitor polls the job, with the strategy if one is given
+        if self._get_job_monitor() is not None:
+            try:
+                return self._watch(polling_strategy).result(timeout=timeout)
+            except FutureTimeoutError:
+                raise JobTimeoutError("Timed out waiting for result")
+
+        polling_strategy = polling_strategy or AdaptivePolling()
+
         start_time = time.time()
+        requests = 0
+        attempt = 0
+        last_state = None
 
         while True:
             elapsed = time.time() - start_time
@@ -185,7 +865,16 @@ class BaseJob(JobV1):
             if timeout is not None and elapsed >= timeout:
                 raise JobTimeoutError("Timed out waiting for result")
 
+            if (
+                polling_strategy.max_requests is not None
+                and requests >= polling_strategy.max_requests
+            ):
+                raise JobTimeoutError(
+                    f"Gave up waiting for result after {requests} status requests"
+                )
+
             status = self.status()
+            requests += 1
 
             if status == JobStatus.DONE:
                 return self._client.list_job_results(self._job_id)
@@ -193,4 +882,15 @@ class BaseJob(JobV1):
             if status == JobStatus.ERROR:
                 raise JobError(f"Job failed: {self._last_progress_message}")
 
-            time.sleep(fetch_interval)
+            state = (status, self._last_progress_message)
+            attempt = attempt + 1 if state == last_state else 0
+            last_state = state
+
+            interval = polling_strategy.next_interval(
+                attempt, status, self._last_progress_message
+            )
+
+            if timeout is not None:
+                interval = min(interval, max(0, timeout - (time.time() - start_time)))
+
+            time.sleep(interval)
@@ -0,0 +1,226 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import threading
+
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, Hashable, List, Optional
+
+from qiskit import QuantumCircuit
+from qiskit.result import Result
+from qiskit.providers import JobError, JobStatus, JobTimeoutError, JobV1
+
+from .composite_job import merge_results
+
+
+def freeze_options(value) -> Hashable:
+    """Hashable view of a job option, options that are neither hashable nor
+    containers (e.g. a noise model) are compared by identity."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze_options(v)) for k, v in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_options(v) for v in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+
+    return value
+
+
+class _Batch:
+    def __init__(self, job_config: dict, session_id: Optional[str]):
+        self.job_config = job_config
+        self.session_id = session_id
+        self.circuits: List[QuantumCircuit] = []
+        self.submitted = Future()
+        self.timer: Optional[threading.Timer] = None
+        self._result: Optional[Result] = None
+        self._result_lock = threading.Lock()
+
+    def result(self, **kwargs) -> Result:
+        """Result of the shared job, downloaded once for all its callers."""
+        with self._result_lock:
+            if self._result is None:
+                job = self.submitted.result()
+                result = job.result(**kwargs)
+                self._result = merge_results([result], job_id=job.job_id())
+
+            return self._result
+
+
+class CoalescedJob(JobV1):
+    """Handle on the circuits of one ``run()`` call, submitted together with
+    other calls in a shared job.
+
+    The job ID is the one of the shared job, it is only known once the batch
+    has been submitted. ``result()`` only holds the experiments of this call.
+    """
+
+    def __init__(self, backend, batch: _Batch, start: int, stop: int) -> None:
+        super().__init__(backend, None)
+        self._batch = batch
+        self._start = start
+        self._stop = stop
+
+    def job_id(self) -> Optional[str]:
+        if self._batch.submitted.done() and not self._batch.submitted.exception():
+            return self._batch.submitted.result().job_id()
+
+        return None
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self.shared_job().session_id
+
+    def shared_job(self, timeout: Optional[float] = None) -> JobV1:
+        """Returns the job the circuits were submitted in, waiting for the
+        batch to be flushed."""
+        try:
+            return self._batch.submitted.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise JobTimeoutError("Timed out waiting for the batch submission")
+
+    def submit(self):
+        raise RuntimeError("CoalescedJob is submitted by the backend coalescer")
+
+    def status(self) -> JobStatus:
+        if not self._batch.submitted.done():
+            return JobStatus.INITIALIZING
+
+        if self._batch.submitted.exception() is not None:
+            return JobStatus.ERROR
+
+        return self._batch.submitted.result().status()
+
+    def future(self) -> Future:
+        """Returns a future resolved with the job results of the shared job."""
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def _chain(source: Future, then=None):
+            if source.exception() is not None:
+                future.set_exception(source.exception())
+            elif then is not None:
+                then(source.result())
+            else:
+                future.set_result(source.result())
+
+        self._batch.submitted.add_done_callback(
+            lambda submitted: _chain(
+                submitted,
+                lambda job: job.future().add_done_callback(_chain),
+            )
+        )
+
+        return future
+
+    def result(self, timeout: Optional[float] = None, **kwargs) -> Result:
+        self.shared_job(timeout)
+
+        result = self._batch.result(timeout=timeout, **kwargs)
+        sliced = merge_results([result], job_id=result.job_id)
+        sliced.results = sliced.results[self._start : self._stop]
+
+        return sliced
+
+    async def aresult(self, timeout: Optional[float] = None) -> Result:
+        """Asyncio counterpart of ``result``, the batch is waited for in the
+        default executor."""
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(None, lambda: self.result(timeout))
+
+
+class RunCoalescer:
+    """Buffers the ``run()`` calls of a backend for up to ``window`` seconds,
+    and submits the calls sharing the same options and session as a single
+    multi-circuit job.
+
+    A batch is flushed when its window ends or when it reaches
+    ``max_circuits`` circuits.
+
+    :param backend: the backend submitting the shared jobs
+    :param window: maximum number of seconds a call is buffered
+    :param max_circuits: optional maximum number of circuits per batch,
+        defaults to the platform limit
+    """
+
+    def __init__(
+        self, backend, window: float = 0.05, max_circuits: Optional[int] = None
+    ):
+        self._backend = backend
+        self._window = window
+        self._max_circuits = max_circuits or backend.max_circuits
+        self._lock = threading.Lock()
+        self._batches: Dict[Hashable, _Batch] = {}
+
+    def submit(
+        self,
+        circuits: List[QuantumCircuit],
+        job_config: dict,
+        session_id: Optional[str],
+    ) -> CoalescedJob:
+        key = (freeze_options(job_config), session_id)
+        full = None
+
+        with self._lock:
+            batch = self._batches.get(key)
+
+            if batch is None:
+                batch = self._batches[key] = _Batch(job_config, session_id)
+                batch.timer = threading.Timer(self._window, self._flush_key, (key,))
+                batch.timer.daemon = True
+                batch.timer.start()
+
+            start = len(batch.circuits)
+            batch.circuits.extend(circuits)
+            job = CoalescedJob(self._backend, batch, start, len(batch.circuits))
+
+            if self._max_circuits and len(batch.circuits) >= self._max_circuits:
+                full = self._batches.pop(key)
+                full.timer.cancel()
+
+        if full is not None:
+            self._submit(full)
+
+        return job
+
+    def flush(self) -> None:
+        """Submits every pending batch right away."""
+        with self._lock:
+            batches = list(self._batches.values())
+            self._batches.clear()
+
+        for batch in batches:
+            batch.timer.cancel()
+            self._submit(batch)
+
+    def _flush_key(self, key: Hashable) -> None:
+        with self._lock:
+            batch = self._batches.pop(key, None)
+
+        if batch is not None:
+            self._submit(batch)
+
+    def _submit(self, batch: _Batch) -> None:
+        try:
+            jobs = self._backend._create_jobs(batch.circuits, batch.job_config)
+            job = self._backend._submit_jobs(jobs, batch.session_id)
+        except Exception as e:
+            batch.submitted.set_exception(JobError(f"Batch submission failed: {e}"))
+        else:
+            batch.submitted.set_result(job)
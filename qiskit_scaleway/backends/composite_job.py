@@ -0,0 +1,171 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import threading
+import time
+
+from concurrent.futures import Future
+from typing import List, Optional, Union
+
+from qiskit.result import Result
+from qiskit.providers import JobV1, JobStatus
+
+from .base_job import BaseJob
+from .polling import PollingStrategy
+
+
+class CompositeJob(JobV1):
+    """A job made of several jobs submitted in the same session, usually
+    because the circuits did not fit in a single one.
+
+    ``result()`` merges the results of every sub-job into a single ``Result``
+    whose experiments follow the original circuit order.
+    """
+
+    def __init__(self, backend, jobs: List[BaseJob]) -> None:
+        super().__init__(backend, ",".join(job.job_id() for job in jobs))
+        self._jobs = jobs
+        self._future: Optional[Future] = None
+
+    @property
+    def jobs(self) -> List[BaseJob]:
+        return self._jobs
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._jobs[0].session_id if self._jobs else None
+
+    def future(self) -> Future:
+        """Returns a future resolved with the job results of every sub-job, in
+        sub-job order, once they are all finished. It fails as soon as one of
+        them fails."""
+        if self._future is None or self._future.cancelled():
+            self._future = gather_futures([job.future() for job in self._jobs])
+
+        return self._future
+
+    def submit(self):
+        raise RuntimeError("CompositeJob is submitted through its sub-jobs")
+
+    def status(self) -> JobStatus:
+        statuses = [job.status() for job in self._jobs]
+
+        if JobStatus.ERROR in statuses:
+            return JobStatus.ERROR
+
+        if all(status == JobStatus.DONE for status in statuses):
+            return JobStatus.DONE
+
+        if JobStatus.RUNNING in statuses or JobStatus.DONE in statuses:
+            return JobStatus.RUNNING
+
+        return JobStatus.QUEUED
+
+    def result(
+        self,
+        timeout: Optional[int] = None,
+        fetch_interval: Optional[int] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> Result:
+        start_time = time.time()
+        results = []
+
+        for job in self._jobs:
+            remaining = None
+
+            if timeout is not None:
+                remaining = max(0, timeout - (time.time() - start_time))
+
+            results.append(
+                job.result(
+                    timeout=remaining,
+                    fetch_interval=fetch_interval,
+                    polling_strategy=polling_strategy,
+                )
+            )
+
+        return merge_results(results, job_id=self.job_id())
+
+    async def aresult(self, timeout: Optional[float] = None) -> Result:
+        """Asyncio counterpart of ``result``, the sub-jobs are awaited
+        concurrently."""
+        results = await asyncio.gather(
+            *(job.aresult(timeout=timeout) for job in self._jobs)
+        )
+
+        return merge_results(list(results), job_id=self.job_id())
+
+
+def merge_results(
+    results: List[Union[Result, List[Result]]], job_id: Optional[str] = None
+) -> Result:
+    """Concatenates the experiments of several results, keeping their order."""
+    flat_results = []
+
+    for result in results:
+        if isinstance(result, list):
+            flat_results.extend(result)
+        else:
+            flat_results.append(result)
+
+    first = flat_results[0]
+    experiments = []
+
+    for result in flat_results:
+        experiments.extend(result.results)
+
+    return Result(
+        backend_name=first.backend_name,
+        backend_version=first.backend_version,
+        job_id=job_id or first.job_id,
+        success=all(result.success for result in flat_results),
+        results=experiments,
+        date=first.date,
+        status=first.status,
+        header=first.header,
+    )
+
+
+def gather_futures(futures: List[Future]) -> Future:
+    """Combines futures resolved with lists into one future resolved with their
+    concatenation, or with the first exception raised."""
+    gathered = Future()
+    gathered.set_running_or_notify_cancel()
+    lock = threading.Lock()
+    pending = [len(futures)]
+
+    def _on_done(_):
+        with lock:
+            pending[0] -= 1
+
+            if gathered.done():
+                return
+
+            failed = next(
+                (f for f in futures if f.done() and f.exception() is not None),
+                None,
+            )
+
+            if failed is not None:
+                gathered.set_exception(failed.exception())
+            elif pending[0] == 0:
+                gathered.set_result([r for f in futures for r in f.result()])
+
+    if not futures:
+        gathered.set_result([])
+
+    for future in futures:
+        future.add_done_callback(_on_done)
+
+    return gathered
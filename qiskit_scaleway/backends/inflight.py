@@ -0,0 +1,90 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, List, Optional
+
+from qiskit import QuantumCircuit
+from qiskit.providers import JobError, JobV1
+
+from qiskit_scaleway.utils import circuit_fingerprint
+
+from .coalescer import freeze_options
+
+
+class InFlightJobs:
+    """Registry of the jobs submitted by a backend and not finished yet,
+    keyed by circuit fingerprints, job options (shots included) and session.
+
+    A submission identical to an in-flight one gets the already submitted
+    job instead of a new one. Jobs leave the registry as soon as the shared
+    job monitor sees them finished, so later submissions run again.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._jobs: Dict[Hashable, Future] = {}
+
+    def get_or_submit(
+        self,
+        circuits: List[QuantumCircuit],
+        job_config: dict,
+        session_id: Optional[str],
+        submit: Callable[[List[QuantumCircuit], dict, Optional[str]], JobV1],
+    ) -> JobV1:
+        key = (
+            tuple(circuit_fingerprint(circuit) for circuit in circuits),
+            freeze_options(job_config),
+            session_id,
+        )
+
+        with self._lock:
+            entry = self._jobs.get(key)
+            owner = entry is None
+
+            if owner:
+                entry = self._jobs[key] = Future()
+            else:
+                self.hits += 1
+
+        if not owner:
+            # Identical submission in flight, share its job
+            return entry.result()
+
+        try:
+            job = submit(circuits, job_config, session_id)
+        except Exception as e:
+            self._discard(key, entry)
+            entry.set_exception(e)
+            raise
+
+        entry.set_result(job)
+
+        try:
+            job.future().add_done_callback(lambda _: self._discard(key, entry))
+        except JobError:
+            # Without a job monitor, the job cannot be tracked until it finishes
+            self._discard(key, entry)
+
+        return job
+
+    def _discard(self, key: Hashable, entry: Future) -> None:
+        with self._lock:
+            if self._jobs.get(key) is entry:
+                del self._jobs[key]
+
+    def __len__(self) -> int:
+        return len(self._jobs)
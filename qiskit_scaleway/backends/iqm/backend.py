@@ -52,6 +52,11 @@ class IqmBackend(BaseBackend):
             session_name="qs-qiskit-iqm",
             session_max_duration="59h",
             session_max_idle_duration="59m",
+            polling_strategy=None,
+            max_payload_bytes=None,
+            serialization_workers=None,
+            serialization_threshold=64,
+            result_workers=8,
             description="IQM transmons machine",
             shots=1000,
             memory=True,
@@ -0,0 +1,361 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import math
+import threading
+import time
+
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set
+
+from qiskit.providers import JobError, JobStatus, JobTimeoutError
+
+from scaleway_qaas_client.v1alpha1 import QaaSClient, QaaSJob
+
+from qiskit_scaleway.utils import is_transient_error
+
+from .polling import PollingStrategy, AdaptivePolling
+
+
+class JobMonitor:
+    """Tracks every submitted job from a single background thread.
+
+    On each tick, the watched jobs are grouped by session. Sessions holding
+    several watched jobs are refreshed with one ``list_jobs`` call, the
+    remaining jobs are fetched with ``get_job`` through a bounded worker pool.
+    Finished jobs resolve their future with the list of job results, failed
+    jobs with a ``JobError``.
+
+    The thread only runs while there are jobs to watch. A new job does not
+    reset the backoff: it only brings the next tick forward when its first
+    check is due sooner. Ticks are spaced by the queued interval of the
+    strategy while every watched job is waiting. Jobs still unfinished after
+    ``max_requests`` status requests of the strategy fail with a
+    ``JobTimeoutError``.
+
+    A job may be watched with its own polling strategy instead, in which case
+    it is checked on its own schedule, backing off as its status stays the
+    same, and its own ``max_requests`` applies.
+
+    Status requests failing with a network or server error are sent again on
+    the next tick, up to ``max_failures`` times in a row. Other errors (e.g. a
+    deleted job or a revoked key) fail the job right away.
+
+    :param client: the QaaS client used to poll the jobs
+    :param polling_strategy: optional strategy giving the interval between two
+        ticks, defaults to an ``AdaptivePolling``
+    :param max_workers: maximum number of concurrent ``get_job`` requests
+    :param max_failures: number of consecutive failed status requests after
+        which a job fails
+    """
+
+    def __init__(
+        self,
+        client: QaaSClient,
+        polling_strategy: Optional[PollingStrategy] = None,
+        max_workers: int = 8,
+        max_failures: int = 10,
+    ):
+        self._client = client
+        self._polling_strategy = polling_strategy or AdaptivePolling()
+        self._max_workers = max_workers
+        self._max_failures = max_failures
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._jobs: Dict[str, "BaseJob"] = {}
+        self._futures: Dict[str, Future] = {}
+        self._requests: Dict[str, int] = {}
+        self._failures: Dict[str, int] = {}
+        # Jobs watched with their own strategy, their next check and backoff
+        self._strategies: Dict[str, PollingStrategy] = {}
+        self._due: Dict[str, float] = {}
+        self._attempts: Dict[str, int] = {}
+        # Next check of the jobs polled with the monitor strategy
+        self._default_tick = math.inf
+        self._next_tick = math.inf
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def watch(
+        self, job, polling_strategy: Optional[PollingStrategy] = None
+    ) -> Future:
+        """Starts tracking a submitted job and returns the future of its results.
+
+        :param polling_strategy: optional strategy of this job, replacing the
+            one it was watched with so far
+        """
+        job_id = job.job_id()
+
+        if not job_id:
+            raise JobError("Cannot watch a job that has not been submitted")
+
+        first_check = time.monotonic() + (
+            polling_strategy or self._polling_strategy
+        ).next_interval(0, JobStatus.QUEUED, "")
+
+        with self._lock:
+            future = self._futures.get(job_id)
+
+            if future is None:
+                future = Future()
+                future.set_running_or_notify_cancel()
+                self._futures[job_id] = future
+                self._jobs[job_id] = job
+                self._requests[job_id] = 0
+
+                if polling_strategy is None:
+                    self._default_tick = min(self._default_tick, first_check)
+
+            if (
+                polling_strategy is not None
+                and self._strategies.get(job_id) is not polling_strategy
+            ):
+                # The requests of the new strategy are counted from now on
+                self._strategies[job_id] = polling_strategy
+                self._due[job_id] = first_check
+                self._attempts[job_id] = 0
+                self._requests[job_id] = 0
+
+            if first_check < self._next_tick:
+                # Only interrupt the current sleep to check the job sooner
+                self._next_tick = first_check
+                self._wakeup.set()
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="qiskit-scaleway-job-monitor", daemon=True
+                )
+                self._thread.start()
+
+        return future
+
+    def add_done_callback(self, job, callback: Callable[[Future], None]) -> None:
+        """Calls ``callback`` with the job future once the job is finished."""
+        self.watch(job).add_done_callback(callback)
+
+    def _run(self) -> None:
+        attempt = 0
+
+        while True:
+            self._sleep()
+
+            now = time.monotonic()
+
+            with self._lock:
+                if not self._jobs:
+                    self._thread = None
+                    self._next_tick = math.inf
+                    self._default_tick = math.inf
+                    return
+
+                default_due = self._default_tick <= now
+                jobs = [
+                    job
+                    for job in self._jobs.values()
+                    if (
+                        self._due[job.job_id()] <= now
+                        if job.job_id() in self._strategies
+                        else default_due
+                    )
+                ]
+
+            try:
+                changed = self._tick(jobs)
+            except Exception as e:
+                # Fail the jobs rather than leaving their futures unresolved
+                for job in jobs:
+                    self._resolve(job, functools.partial(self._raise, e))
+                changed = set()
+
+            now = time.monotonic()
+
+            with self._lock:
+                default_jobs = [
+                    job
+                    for job in self._jobs.values()
+                    if job.job_id() not in self._strategies
+                ]
+
+                if not default_jobs:
+                    self._default_tick = math.inf
+                elif default_due:
+                    polled = {job.job_id() for job in jobs}
+                    default_changed = any(
+                        job.job_id() in changed
+                        for job in default_jobs
+                        if job.job_id() in polled
+                    )
+                    attempt = 0 if default_changed else attempt + 1
+                    queued = all(
+                        job._last_status in (None, JobStatus.QUEUED)
+                        for job in default_jobs
+                    )
+                    self._default_tick = now + self._polling_strategy.next_interval(
+                        attempt, JobStatus.QUEUED if queued else JobStatus.RUNNING, ""
+                    )
+
+                for job in jobs:
+                    self._schedule_job(job, job.job_id() in changed, now)
+
+                self._next_tick = min(
+                    [self._default_tick, *self._due.values()], default=math.inf
+                )
+
+    def _schedule_job(self, job, changed: bool, now: float) -> None:
+        """Schedules the next check of a job watched with its own strategy."""
+        job_id = job.job_id()
+        strategy = self._strategies.get(job_id)
+
+        if strategy is None or job_id not in self._jobs:
+            return
+
+        attempt = 0 if changed else self._attempts[job_id] + 1
+        self._attempts[job_id] = attempt
+        self._due[job_id] = now + strategy.next_interval(
+            attempt, job._last_status or JobStatus.QUEUED, job._last_progress_message
+        )
+
+    def _sleep(self) -> None:
+        """Waits for the next tick, which ``watch`` may bring forward."""
+        while True:
+            with self._lock:
+                remaining = self._next_tick - time.monotonic()
+
+                if remaining <= 0 or not self._jobs:
+                    return
+
+                self._wakeup.clear()
+
+            self._wakeup.wait(remaining)
+
+    def _tick(self, jobs: List) -> Set[str]:
+        """Polls the jobs, returns the IDs of those whose state changed."""
+        by_session = defaultdict(list)
+
+        for job in jobs:
+            by_session[job.session_id].append(job)
+
+        qaas_jobs: Dict[str, QaaSJob] = {}
+        remaining = []
+
+        for session_id, session_jobs in by_session.items():
+            if session_id and len(session_jobs) > 1:
+                try:
+                    for qaas_job in self._client.list_jobs(session_id=session_id):
+                        qaas_jobs[qaas_job.id] = qaas_job
+                except Exception:
+                    # The jobs of the session are fetched one by one instead
+                    pass
+
+            remaining.extend(j for j in session_jobs if j.job_id() not in qaas_jobs)
+
+        if remaining:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="qiskit-scaleway-job-monitor",
+                )
+
+            def _get_job(job):
+                try:
+                    return self._client.get_job(job.job_id())
+                except Exception as e:
+                    return e
+
+            qaas_jobs.update(
+                zip(
+                    (job.job_id() for job in remaining),
+                    self._executor.map(_get_job, remaining),
+                )
+            )
+
+        changed = set()
+
+        for job in jobs:
+            qaas_job = qaas_jobs[job.job_id()]
+            failed = isinstance(qaas_job, Exception)
+
+            with self._lock:
+                max_requests = self._strategies.get(
+                    job.job_id(), self._polling_strategy
+                ).max_requests
+                requests = self._requests.get(job.job_id(), 0) + 1
+                self._requests[job.job_id()] = requests
+                failures = self._failures.get(job.job_id(), 0) + 1 if failed else 0
+                self._failures[job.job_id()] = failures
+
+            status = None
+
+            if not failed:
+                previous = (job._last_status, job._last_progress_message)
+                status = job._update_status(qaas_job)
+
+                if previous != (status, job._last_progress_message):
+                    changed.add(job.job_id())
+
+            if status == JobStatus.DONE:
+                self._resolve(job, self._fetch_results)
+            elif status == JobStatus.ERROR:
+                self._resolve(job, self._raise_error)
+            elif failed and not is_transient_error(qaas_job):
+                # Unknown job, revoked key...: polling again will not help
+                self._resolve(job, functools.partial(self._raise, qaas_job))
+            elif failed and failures >= self._max_failures:
+                self._resolve(job, functools.partial(self._fail, qaas_job))
+            elif max_requests is not None and requests >= max_requests:
+                self._resolve(job, self._give_up)
+
+        return changed
+
+    def _fetch_results(self, job):
+        return self._client.list_job_results(job.job_id())
+
+    def _raise_error(self, job):
+        raise JobError(f"Job failed: {job._last_progress_message}")
+
+    def _raise(self, error: Exception, job):
+        raise error
+
+    def _fail(self, error: Exception, job):
+        raise JobError(
+            f"Gave up polling the job after {self._failures[job.job_id()]} "
+            f"failed status requests: {error}"
+        ) from error
+
+    def _give_up(self, job):
+        raise JobTimeoutError(
+            f"Gave up waiting for result after {self._requests[job.job_id()]} "
+            "status requests"
+        )
+
+    def _resolve(self, job, outcome: Callable) -> None:
+        with self._lock:
+            self._jobs.pop(job.job_id(), None)
+            future = self._futures.pop(job.job_id(), None)
+
+        if future is None or future.done():
+            return
+
+        try:
+            future.set_result(outcome(job))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._requests.pop(job.job_id(), None)
+                self._failures.pop(job.job_id(), None)
+                self._strategies.pop(job.job_id(), None)
+                self._due.pop(job.job_id(), None)
+                self._attempts.pop(job.job_id(), None)
@@ -0,0 +1,118 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import random
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from qiskit.providers import JobStatus
+
+
+class PollingStrategy(ABC):
+    """Decides how long to wait between two job status requests.
+
+    :param max_requests: optional cap on the number of status requests sent
+        while waiting for a job, ``None`` means unlimited
+    """
+
+    def __init__(self, max_requests: Optional[int] = None):
+        self.max_requests = max_requests
+
+    @abstractmethod
+    def next_interval(
+        self, attempt: int, status: JobStatus, progress_message: str
+    ) -> float:
+        """Returns the number of seconds to wait before the next status request.
+
+        ``attempt`` counts the requests sent since the job status or progress
+        message last changed, starting at 0.
+        """
+        pass
+
+
+class FixedPolling(PollingStrategy):
+    def __init__(self, interval: float = 3, max_requests: Optional[int] = None):
+        super().__init__(max_requests=max_requests)
+        self.interval = interval
+
+    def next_interval(
+        self, attempt: int, status: JobStatus, progress_message: str
+    ) -> float:
+        return self.interval
+
+
+class ExponentialBackoffPolling(PollingStrategy):
+    """Polls fast right after submission then backs off exponentially, with
+    random jitter so that concurrent jobs do not hit the API in lockstep."""
+
+    def __init__(
+        self,
+        initial_interval: float = 0.2,
+        max_interval: float = 10,
+        multiplier: float = 1.5,
+        jitter: float = 0.1,
+        max_requests: Optional[int] = None,
+    ):
+        super().__init__(max_requests=max_requests)
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def _backoff(self, attempt: int, max_interval: float) -> float:
+        interval = min(
+            self.initial_interval * (self.multiplier**attempt), max_interval
+        )
+
+        if self.jitter:
+            interval *= 1 + random.uniform(-self.jitter, self.jitter)
+
+        return max(0, interval)
+
+    def next_interval(
+        self, attempt: int, status: JobStatus, progress_message: str
+    ) -> float:
+        return self._backoff(attempt, self.max_interval)
+
+
+class AdaptivePolling(ExponentialBackoffPolling):
+    """Backs off slowly while the job sits in the platform queue and stays
+    reactive once it runs. Since ``attempt`` restarts whenever the progress
+    message changes, a job reporting progress is polled quickly again."""
+
+    def __init__(
+        self,
+        initial_interval: float = 0.2,
+        max_interval: float = 5,
+        queued_max_interval: float = 30,
+        multiplier: float = 1.5,
+        jitter: float = 0.1,
+        max_requests: Optional[int] = None,
+    ):
+        super().__init__(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            multiplier=multiplier,
+            jitter=jitter,
+            max_requests=max_requests,
+        )
+        self.queued_max_interval = queued_max_interval
+
+    def next_interval(
+        self, attempt: int, status: JobStatus, progress_message: str
+    ) -> float:
+        if status == JobStatus.QUEUED:
+            return self._backoff(attempt, self.queued_max_interval)
+
+        return self._backoff(attempt, self.max_interval)
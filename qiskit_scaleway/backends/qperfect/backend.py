@@ -11,13 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import randomname
-import warnings
-
-from typing import Union, List
-
 from qiskit.providers import Options
-from qiskit.circuit import QuantumCircuit
 from qiskit.transpiler import Target
 
 from qiskit_scaleway.backends.qperfect.job import QperfectJob
@@ -27,6 +21,15 @@ from scaleway_qaas_client.v1alpha1 import QaaSClient, QaaSPlatform
 
 
 class QperfectBackend(BaseBackend):
+    _job_name_prefix = "qj-qperfect"
+
+    # The platform executes a single circuit per job, larger batches are
+    # fanned out as one job per circuit
+    _max_circuits_per_job = 1
+
+    # Runs with a seed are reproducible and can be memoized
+    _seed_option = "seed"
+
     def __init__(self, provider, client: QaaSClient, platform: QaaSPlatform):
         super().__init__(
             provider=provider,
@@ -50,54 +53,6 @@ class QperfectBackend(BaseBackend):
     def job_cls(self):
         return QperfectJob
 
-    def run(
-        self, circuits: Union[QuantumCircuit, List[QuantumCircuit]], **kwargs
-    ) -> QperfectJob:
-        if not isinstance(circuits, List):
-            circuits = [circuits]
-
-        job_config = dict(self._options.items())
-
-        for kwarg in kwargs:
-            if not hasattr(self.options, kwarg):
-                warnings.warn(
-                    f"Option {kwarg} is not used by this backend",
-                    UserWarning,
-                    stacklevel=2,
-                )
-            else:
-                job_config[kwarg] = kwargs[kwarg]
-
-        job_config["nsamples"] = job_config["shots"]
-        job_name = f"qj-qperfect-{randomname.get_name()}"
-
-        session_id = job_config.get("session_id", None)
-
-        job_config.pop("session_id")
-        job_config.pop("session_name")
-        job_config.pop("session_max_duration")
-        job_config.pop("session_max_idle_duration")
-
-        job = QperfectJob(
-            backend=self,
-            client=self._client,
-            circuits=circuits,
-            config=job_config,
-            name=job_name,
-        )
-
-        if session_id in ["auto", None]:
-            session_id = self.start_session(
-                name=f"auto-{self._options.session_name}",
-                max_duration=self._options.get("session_max_duration"),
-                max_idle_duration=self._options.get("session_max_idle_duration"),
-            )
-            assert session_id is not None
-
-        job.submit(session_id)
-
-        return job
-
     @classmethod
     def _default_options(self):
         return Options(
@@ -105,6 +60,7 @@ class QperfectBackend(BaseBackend):
             session_name="qs-qiskit-qperfect",
             session_max_duration="59m",
             session_max_idle_duration="59m",
+            polling_strategy=None,
             shots=1000,
             label="pyapi_v1.0",
             algorithm="auto",
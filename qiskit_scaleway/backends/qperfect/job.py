@@ -15,16 +15,15 @@ from typing import (
     List,
     Union,
     Dict,
+    Tuple,
 )
 
 from qiskit import QuantumCircuit
 
 from qiskit_scaleway.versions import USER_AGENT
 from qiskit_scaleway.backends import BaseJob
-from qiskit.transpiler.passes import RemoveBarriers
 
 from qio.core import (
-    QuantumProgram,
     QuantumProgramSerializationFormat,
     QuantumComputationModel,
     QuantumComputationParameters,
@@ -36,6 +35,9 @@ from scaleway_qaas_client.v1alpha1 import QaaSClient
 
 
 class QperfectJob(BaseJob):
+    _serialization_format = QuantumProgramSerializationFormat.QASM_V2
+    _remove_barriers = True
+
     def __init__(
         self,
         name: str,
@@ -48,23 +50,15 @@ class QperfectJob(BaseJob):
             name=name, backend=backend, client=client, config=config, circuits=circuits
         )
 
-    def submit(self, session_id: str) -> None:
-        if self._job_id:
-            raise RuntimeError(f"Job already submitted (ID: {self._job_id})")
-
+    def _build_payloads(self) -> Tuple[str, str]:
         options = self._config.copy()
 
-        circuit = RemoveBarriers()(self._circuits[0])
-
-        programs = [
-            QuantumProgram.from_qiskit_circuit(
-                circuit, QuantumProgramSerializationFormat.QASM_V2
-            )
-        ]
+        programs = [self._to_quantum_program(self._circuits[0])]
 
         # Retrieve run options
         qperfect_option = {}
         shots = options.pop("shots")
+        options["nsamples"] = shots
 
         qperfect_option = dict(
             filter(lambda item: item[1] is not None, options.items())
@@ -91,16 +85,4 @@ class QperfectJob(BaseJob):
             options=qperfect_option,
         ).to_json_str()
 
-        model = self._client.create_model(
-            payload=computation_model_json,
-        )
-
-        if not model:
-            raise RuntimeError("Failed to push circuit data")
-
-        self._job_id = self._client.create_job(
-            name=self._name,
-            session_id=session_id,
-            model_id=model.id,
-            parameters=computation_parameters_json,
-        ).id
+        return computation_model_json, computation_parameters_json
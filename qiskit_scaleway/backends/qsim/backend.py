@@ -11,13 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import randomname
-import warnings
-
-from typing import Union, List
-
 from qiskit.providers import Options
-from qiskit.circuit import QuantumCircuit
 from qiskit.transpiler import Target
 
 from qiskit_scaleway.backends.qsim.job import QsimJob
@@ -27,6 +21,12 @@ from scaleway_qaas_client.v1alpha1 import QaaSClient, QaaSPlatform
 
 
 class QsimBackend(BaseBackend):
+    _job_name_prefix = "qj-qsim"
+
+    # The platform executes a single circuit per job, larger batches are
+    # fanned out as one job per circuit
+    _max_circuits_per_job = 1
+
     def __init__(self, provider, client: QaaSClient, platform: QaaSPlatform):
         super().__init__(
             provider=provider,
@@ -50,49 +50,6 @@ class QsimBackend(BaseBackend):
     def job_cls(self):
         return QsimJob
 
-    def run(
-        self, circuits: Union[QuantumCircuit, List[QuantumCircuit]], **kwargs
-    ) -> QsimJob:
-        if not isinstance(circuits, List):
-            circuits = [circuits]
-
-        job_config = dict(self._options.items())
-
-        for kwarg in kwargs:
-            if not hasattr(self.options, kwarg):
-                warnings.warn(
-                    f"Option {kwarg} is not used by this backend",
-                    UserWarning,
-                    stacklevel=2,
-                )
-            else:
-                job_config[kwarg] = kwargs[kwarg]
-
-        job_name = f"qj-qsim-{randomname.get_name()}"
-
-        session_id = job_config.get("session_id", None)
-
-        job_config.pop("session_id")
-        job_config.pop("session_name")
-        job_config.pop("session_max_duration")
-        job_config.pop("session_max_idle_duration")
-
-        job = QsimJob(
-            backend=self,
-            client=self._client,
-            circuits=circuits,
-            config=job_config,
-            name=job_name,
-        )
-
-        if session_id in ["auto", None]:
-            session_id = self.start_session(name=f"auto-{self._options.session_name}")
-            assert session_id is not None
-
-        job.submit(session_id)
-
-        return job
-
     @classmethod
     def _default_options(self):
         return Options(
@@ -100,6 +57,7 @@ class QsimBackend(BaseBackend):
             session_name="qs-qiskit-qsim",
             session_max_duration="59m",
             session_max_idle_duration="59m",
+            polling_strategy=None,
             shots=1000,
             circuit_memoization_size=0,
             max_fused_gate_size=2,
@@ -15,18 +15,17 @@ from typing import (
     List,
     Union,
     Dict,
+    Tuple,
 )
 
 from qiskit import QuantumCircuit
-from qiskit.providers import JobError, JobStatus
+from qiskit.providers import JobStatus
 from qiskit.result import Result
-from qiskit.transpiler.passes import RemoveBarriers
 
 from qiskit_scaleway.versions import USER_AGENT
 from qiskit_scaleway.backends import BaseJob
 
 from qio.core import (
-    QuantumProgram,
     QuantumProgramSerializationFormat,
     QuantumProgramResult,
     QuantumComputationModel,
@@ -35,10 +34,15 @@ from qio.core import (
     ClientData,
 )
 
-from scaleway_qaas_client.v1alpha1 import QaaSClient
+from scaleway_qaas_client.v1alpha1 import QaaSClient, QaaSJobResult
 
 
 class QsimJob(BaseJob):
+    _serialization_format = QuantumProgramSerializationFormat.QASM_V2
+    # Barriers are only visual elements
+    # Barriers are not managed by Cirq deserialization
+    _remove_barriers = True
+
     def __init__(
         self,
         name: str,
@@ -51,22 +55,11 @@ class QsimJob(BaseJob):
             name=name, backend=backend, client=client, config=config, circuits=circuits
         )
 
-    def submit(self, session_id: str) -> None:
-        if self._job_id:
-            raise RuntimeError(f"Job already submitted (ID: {self._job_id})")
-
+    def _build_payloads(self) -> Tuple[str, str]:
         options = self._config.copy()
 
-        # Note 1: Barriers are only visual elements
-        # Barriers are not managed by Cirq deserialization
-        # Note 2: Qsim can only handle one circuit at a time
-        circuit = RemoveBarriers()(self._circuits[0])
-
-        programs = [
-            QuantumProgram.from_qiskit_circuit(
-                circuit, QuantumProgramSerializationFormat.QASM_V2
-            )
-        ]
+        # Qsim can only handle one circuit at a time
+        programs = [self._to_quantum_program(self._circuits[0])]
 
         options.pop("circuit_memoization_size")
         shots = options.pop("shots")
@@ -91,51 +84,16 @@ class QsimJob(BaseJob):
             shots=shots,
         ).to_json_str()
 
-        model = self._client.create_model(
-            payload=computation_model_json,
-        )
-
-        if not model:
-            raise RuntimeError("Failed to push circuit data")
-
-        self._job_id = self._client.create_job(
-            name=self._name,
-            session_id=session_id,
-            model_id=model.id,
-            parameters=computation_parameters_json,
-        ).id
-
-    def __to_qiskit_result(self, program_result: QuantumProgramResult) -> Result:
-        status = self.status()
+        return computation_model_json, computation_parameters_json
 
+    def _to_qiskit_result(
+        self, job_result: QaaSJobResult, program_result: QuantumProgramResult
+    ) -> Result:
         return program_result.to_qiskit_result(
             backend_name=self.backend().name,
             backend_version=self.backend().version,
             job_id=self._job_id,
             qobj_id=", ".join(x.name for x in self._circuits),
-            success=status == JobStatus.DONE,
+            success=self._last_status == JobStatus.DONE,
             status=JobStatus.DONE,
         )
-
-    def result(
-        self,
-        timeout=None,
-        fetch_interval: int = 3,
-    ) -> Union[Result, List[Result]]:
-        if self._job_id == None:
-            raise JobError("Job ID error")
-        job_results = self._wait_for_result(timeout, fetch_interval)
-
-        program_results = list(
-            map(
-                lambda r: self.__to_qiskit_result(
-                    self._extract_payload_from_response(r)
-                ),
-                job_results,
-            )
-        )
-
-        if len(program_results) == 1:
-            return program_results[0]
-
-        return program_results
@@ -11,13 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import randomname
-import warnings
-
-from typing import Union, List
-
 from qiskit.providers import Options
-from qiskit.circuit import QuantumCircuit
 from qiskit.transpiler import Target
 
 from qiskit_scaleway.backends.quobly.job import QuoblyJob
@@ -27,6 +21,12 @@ from scaleway_qaas_client.v1alpha1 import QaaSClient, QaaSPlatform
 
 
 class QuoblyBackend(BaseBackend):
+    _job_name_prefix = "qj-quobly"
+
+    # The platform executes a single circuit per job, larger batches are
+    # fanned out as one job per circuit
+    _max_circuits_per_job = 1
+
     def __init__(self, provider, client: QaaSClient, platform: QaaSPlatform):
         super().__init__(
             provider=provider,
@@ -50,53 +50,6 @@ class QuoblyBackend(BaseBackend):
     def job_cls(self):
         return QuoblyJob
 
-    def run(
-        self, circuits: Union[QuantumCircuit, List[QuantumCircuit]], **kwargs
-    ) -> QuoblyJob:
-        if not isinstance(circuits, List):
-            circuits = [circuits]
-
-        job_config = dict(self._options.items())
-
-        for kwarg in kwargs:
-            if not hasattr(self.options, kwarg):
-                warnings.warn(
-                    f"Option {kwarg} is not used by this backend",
-                    UserWarning,
-                    stacklevel=2,
-                )
-            else:
-                job_config[kwarg] = kwargs[kwarg]
-
-        job_name = f"qj-quobly-{randomname.get_name()}"
-
-        session_id = job_config.get("session_id", None)
-
-        job_config.pop("session_id")
-        job_config.pop("session_name")
-        job_config.pop("session_max_duration")
-        job_config.pop("session_max_idle_duration")
-
-        job = QuoblyJob(
-            backend=self,
-            client=self._client,
-            circuits=circuits,
-            config=job_config,
-            name=job_name,
-        )
-
-        if session_id in ["auto", None]:
-            session_id = self.start_session(
-                name=f"auto-{self._options.session_name}",
-                max_duration=self._options.get("session_max_duration"),
-                max_idle_duration=self._options.get("session_max_idle_duration"),
-            )
-            assert session_id is not None
-
-        job.submit(session_id)
-
-        return job
-
     @classmethod
     def _default_options(self):
         return Options(
@@ -104,6 +57,7 @@ class QuoblyBackend(BaseBackend):
             session_name="qs-qiskit-quobly",
             session_max_duration="59m",
             session_max_idle_duration="59m",
+            polling_strategy=None,
             shots=1000,
             seed=None,
             noise=True,
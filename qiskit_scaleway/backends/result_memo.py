@@ -0,0 +1,176 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Hashable, List, Optional, Union
+
+from qiskit import QuantumCircuit
+from qiskit.result import Result
+from qiskit.providers import JobStatus, JobV1
+
+from qiskit_scaleway.utils import circuit_fingerprint
+
+from .coalescer import freeze_options
+
+
+class _Entry:
+    def __init__(self):
+        self.submitted = Future()
+        self.result: Optional[Union[Result, List[Result]]] = None
+        self.lock = threading.Lock()
+
+
+class MemoizedJob(JobV1):
+    """Handle on a seeded run whose result is shared by every identical run.
+
+    The first ``result()`` (or ``aresult()``) call fetches the result of the
+    underlying job, the following ones (on this handle or on any other handle
+    of the same run) return it without any API call.
+    """
+
+    def __init__(self, backend, entry: _Entry, on_error: Callable[[], None]) -> None:
+        super().__init__(backend, None)
+        self._entry = entry
+        self._on_error = on_error
+
+    @property
+    def job(self) -> JobV1:
+        """The job the run was actually submitted as."""
+        return self._entry.submitted.result()
+
+    def job_id(self) -> Optional[str]:
+        return self.job.job_id()
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self.job.session_id
+
+    def submit(self):
+        raise RuntimeError("MemoizedJob is submitted through its underlying job")
+
+    def status(self) -> JobStatus:
+        if self._entry.result is not None:
+            return JobStatus.DONE
+
+        return self.job.status()
+
+    def future(self) -> Future:
+        return self.job.future()
+
+    def result(self, **kwargs) -> Union[Result, List[Result]]:
+        with self._entry.lock:
+            if self._entry.result is None:
+                try:
+                    self._entry.result = self.job.result(**kwargs)
+                except Exception:
+                    # Failed runs are submitted again next time
+                    self._on_error()
+                    raise
+
+            return self._entry.result
+
+    async def aresult(self, **kwargs) -> Union[Result, List[Result]]:
+        if self._entry.result is None:
+            try:
+                result = await self.job.aresult(**kwargs)
+            except Exception:
+                self._on_error()
+                raise
+
+            with self._entry.lock:
+                if self._entry.result is None:
+                    self._entry.result = result
+
+        return self._entry.result
+
+
+class ResultMemo:
+    """LRU memo of the results of deterministic runs, keyed by circuit
+    fingerprints, backend version and job options (shots and seed included).
+
+    An identical run returns a ``MemoizedJob`` sharing the result of the first
+    one, without submitting anything. The session is not part of the key.
+
+    :param max_size: maximum number of runs kept
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_submit(
+        self,
+        backend,
+        circuits: List[QuantumCircuit],
+        job_config: dict,
+        session_id: Optional[str],
+        submit: Callable[[List[QuantumCircuit], dict, Optional[str]], JobV1],
+    ) -> MemoizedJob:
+        key = (
+            tuple(circuit_fingerprint(circuit) for circuit in circuits),
+            backend.version,
+            freeze_options(job_config),
+        )
+
+        with self._lock:
+            entry = self._entries.get(key)
+            owner = entry is None
+
+            if owner:
+                entry = self._entries[key] = _Entry()
+                self.misses += 1
+
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+        job = MemoizedJob(backend, entry, lambda: self._discard(key, entry))
+
+        if not owner:
+            # Wait for the first run to be submitted, to share its job
+            entry.submitted.result()
+            return job
+
+        try:
+            entry.submitted.set_result(submit(circuits, job_config, session_id))
+        except Exception as e:
+            self._discard(key, entry)
+            entry.submitted.set_exception(e)
+            raise
+
+        return job
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _discard(self, key: Hashable, entry: _Entry) -> None:
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"<ResultMemo(size={len(self)},max_size={self.max_size},hits={self.hits},misses={self.misses})>"
@@ -0,0 +1,263 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import atexit
+import re
+import threading
+import time
+import weakref
+
+from typing import List, Optional, Union
+
+_DURATION_UNITS = {
+    "ms": 0.001,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+}
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(ms|s|m|h|d)")
+
+_DEFAULT_RENEWAL_MARGIN = 60
+
+# The margin never exceeds this fraction of the session durations, so short
+# sessions are still used for most of their lifetime
+_MAX_RENEWAL_MARGIN_FRACTION = 0.1
+
+_PENDING_JOB_STATUSES = ("waiting", "running")
+
+_POOLS = weakref.WeakSet()
+
+
+def duration_to_seconds(duration: Union[int, float, str, None]) -> Optional[float]:
+    """Converts a session duration such as ``59m``, ``1h30m`` or ``2.5s`` to seconds."""
+    if duration is None:
+        return None
+
+    if isinstance(duration, (int, float)):
+        return float(duration)
+
+    duration = duration.strip()
+
+    try:
+        return float(duration)
+    except ValueError:
+        pass
+
+    matches = _DURATION_PATTERN.findall(duration)
+
+    if not matches or _DURATION_PATTERN.sub("", duration).strip():
+        raise ValueError(f"Invalid duration: {duration}")
+
+    return sum(float(value) * _DURATION_UNITS[unit] for value, unit in matches)
+
+
+class SessionPool:
+    """Keeps an auto-created session alive for a backend and hands it out to
+    every ``run()`` called with ``session_id="auto"``.
+
+    The live session is reused until it gets within ``renewal_margin`` seconds
+    (at most a tenth of the duration) of its ``session_max_duration`` or
+    ``session_max_idle_duration``. A
+    background timer opens the replacement session before the current one
+    expires, so submissions never wait for a session to be provisioned. Idle
+    sessions are released instead of being renewed.
+
+    Sessions created by the pool are terminated when the pool is closed, which
+    happens automatically on interpreter exit. Sessions with waiting or running
+    jobs are left to their own timeouts, so that their jobs can still complete
+    and be retrieved later.
+    """
+
+    def __init__(self, backend, renewal_margin: float = _DEFAULT_RENEWAL_MARGIN):
+        self._backend = backend
+        self._renewal_margin = renewal_margin
+        self._lock = threading.RLock()
+        self._session_id: Optional[str] = None
+        self._retired_session_ids: List[str] = []
+        self._expires_at: Optional[float] = None
+        self._max_duration: Optional[float] = None
+        self._max_idle_duration: Optional[float] = None
+        self._last_used_at: float = 0
+        self._timer: Optional[threading.Timer] = None
+        self._timer_deadline: Optional[float] = None
+        self._closed = False
+
+        _POOLS.add(self)
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._session_id
+
+    def acquire(self) -> str:
+        """Returns the live auto session, opening a new one if needed."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Session pool is closed")
+
+            now = time.monotonic()
+
+            if self._session_id is None or self._is_expiring(now):
+                self._rotate(now)
+
+            self._last_used_at = now
+            self._schedule(now)
+
+            return self._session_id
+
+    def close(self) -> None:
+        """Stops the timer and terminates the sessions opened by the pool that
+        have no pending jobs."""
+        with self._lock:
+            self._closed = True
+            self._cancel_timer()
+
+            session_ids = self._retired_session_ids
+            if self._session_id:
+                session_ids.append(self._session_id)
+
+            self._session_id = None
+            self._retired_session_ids = []
+
+        for session_id in session_ids:
+            try:
+                if not self._has_pending_jobs(session_id):
+                    self._backend.stop_session(session_id)
+            except Exception:
+                # Session may already be stopped by its own timeouts
+                pass
+
+    def _has_pending_jobs(self, session_id: str) -> bool:
+        jobs = self._backend._client.list_jobs(session_id=session_id)
+
+        return any(job.status in _PENDING_JOB_STATUSES for job in jobs)
+
+    def _margin(self, duration: float) -> float:
+        return min(self._renewal_margin, duration * _MAX_RENEWAL_MARGIN_FRACTION)
+
+    def _renewal_deadline(self) -> Optional[float]:
+        if self._expires_at is None:
+            return None
+
+        return self._expires_at - self._margin(self._max_duration)
+
+    def _idle_deadline(self) -> Optional[float]:
+        if self._max_idle_duration is None:
+            return None
+
+        return (
+            self._last_used_at
+            + self._max_idle_duration
+            - self._margin(self._max_idle_duration)
+        )
+
+    def _is_expiring(self, now: float) -> bool:
+        return any(
+            deadline is not None and now >= deadline
+            for deadline in (self._renewal_deadline(), self._idle_deadline())
+        )
+
+    def _rotate(self, now: float) -> None:
+        options = self._backend.options
+
+        max_duration = options.get("session_max_duration", "59m")
+        max_idle_duration = options.get("session_max_idle_duration", "59m")
+
+        session_id = self._backend.start_session(
+            name=f"auto-{options.get('session_name', 'qs-qiskit')}",
+            max_duration=max_duration,
+            max_idle_duration=max_idle_duration,
+        )
+
+        if session_id is None:
+            raise RuntimeError("Failed to create an auto session")
+
+        # Jobs may still run on the previous session, let it end by itself
+        # and only terminate it when the pool is closed.
+        if self._session_id:
+            self._retired_session_ids.append(self._session_id)
+
+        self._session_id = session_id
+        self._last_used_at = now
+
+        self._max_duration = duration_to_seconds(max_duration) or None
+        self._expires_at = now + self._max_duration if self._max_duration else None
+        self._max_idle_duration = duration_to_seconds(max_idle_duration) or None
+
+    def _schedule(self, now: float) -> None:
+        deadlines = [
+            deadline
+            for deadline in (self._renewal_deadline(), self._idle_deadline())
+            if deadline is not None
+        ]
+
+        if not deadlines or min(deadlines) <= now:
+            # Already due, the next acquire() renews the session itself
+            self._cancel_timer()
+            return
+
+        deadline = min(deadlines)
+
+        if self._timer is not None and self._timer_deadline <= deadline:
+            # Each acquire() pushes the idle deadline back: the pending timer
+            # fires early and schedules the next check, so that runs do not
+            # start a timer thread each
+            return
+
+        self._cancel_timer()
+        self._timer = threading.Timer(deadline - now, self._on_timer)
+        self._timer.daemon = True
+        self._timer_deadline = deadline
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._timer_deadline = None
+
+            if self._closed or self._session_id is None:
+                return
+
+            now = time.monotonic()
+
+            idle_deadline = self._idle_deadline()
+            renewal_deadline = self._renewal_deadline()
+
+            if idle_deadline is not None and now >= idle_deadline:
+                # Nobody used the session lately: release it instead of renewing
+                self._retired_session_ids.append(self._session_id)
+                self._session_id = None
+                self._expires_at = None
+                return
+
+            if renewal_deadline is not None and now >= renewal_deadline:
+                try:
+                    self._rotate(now)
+                except Exception:
+                    # Next acquire() will retry synchronously
+                    return
+
+            self._schedule(now)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_deadline = None
+
+
+@atexit.register
+def _close_all_pools() -> None:
+    for pool in list(_POOLS):
+        pool.close()
@@ -11,54 +11,239 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.exceptions import QiskitError
 from qiskit.primitives import BackendEstimatorV2
 from qiskit.primitives.backend_estimator_v2 import (
+    _measurement_circuit,
+    _pauli_expval_with_variance,
     _prepare_counts,
-    _run_circuits,
+    _PreprocessedData,
+)
+from qiskit.quantum_info import Pauli, PauliList
+
+from .parameter_binding import (
+    parameter_table,
+    run_circuits,
+    supports_runtime_parameter_bind,
+)
+from .pauli_grouping import (
+    COLORING_STRATEGIES,
+    GROUPING_STRATEGIES,
+    commuting_measurement_circuit,
+    group_paulis,
 )
 
 
 class Estimator(BackendEstimatorV2):
+    """Estimator running the pubs on a Scaleway backend.
+
+    The Pauli terms of the observables are grouped so that each group is
+    measured by a single circuit. ``grouping`` selects which terms share a
+    circuit:
+
+    * ``"none"``: one circuit per term
+    * ``"qubit_wise"``: qubit-wise commuting terms, measured with single-qubit
+      basis changes
+    * ``"commuting"``: commuting terms, measured after a Clifford circuit
+      diagonalizing them all. Fewer circuits, but deeper ones
+
+    Groups are found by greedy coloring of the non-commutation graph of the
+    terms, with the ``coloring`` heuristic. The metadata of each pub result
+    reports ``num_circuits`` and ``circuits_saved`` compared to one circuit
+    per term.
+
+    With ``runtime_parameter_bind``, on backends binding parameters at
+    runtime (Aer), the measurement circuits of a parametric pub are sent once,
+    parametrized, along with the table of its parameter values. They measure
+    the terms of the observables of every binding.
+
+    :param backend: the backend running the circuits
+    :param session_id: the session the jobs are submitted in
+    :param options: ``BackendEstimatorV2`` options
+    :param grouping: ``"none"``, ``"qubit_wise"`` or ``"commuting"``, defaults to
+        ``"qubit_wise"``, or ``"none"`` when the ``abelian_grouping`` option is off
+    :param coloring: ``"largest_first"``, ``"saturation"`` or ``"independent_set"``
+    :param runtime_parameter_bind: bind the parameters on the platform
+    """
+
     def __init__(
         self,
         backend,
         session_id: str,
         options: dict | None = None,
+        grouping: str | None = None,
+        coloring: str = "largest_first",
+        runtime_parameter_bind: bool = False,
     ):
         if not session_id:
             raise Exception("session_id must be not None")
 
+        if grouping is not None and grouping not in GROUPING_STRATEGIES:
+            raise ValueError(f"Invalid grouping strategy: {grouping}")
+
+        if coloring not in COLORING_STRATEGIES:
+            raise ValueError(f"Invalid coloring strategy: {coloring}")
+
+        if runtime_parameter_bind and not supports_runtime_parameter_bind(backend):
+            raise ValueError(f"{backend.name} cannot bind parameters at runtime")
+
         self._session_id = session_id
+        self._grouping = grouping
+        self._coloring = coloring
+        self._runtime_parameter_bind = runtime_parameter_bind
 
         super().__init__(
             backend=backend,
             options=options,
         )
 
+    @property
+    def grouping(self) -> str:
+        if self._grouping is not None:
+            return self._grouping
+
+        return "qubit_wise" if self._options.abelian_grouping else "none"
+
     def _run_pubs(self, pubs, shots: int) -> list:
         """Compute results for pubs that all require the same value of ``shots``."""
         preprocessed_data = []
+        num_experiments = []
         flat_circuits = []
+        parameter_binds = []
         for pub in pubs:
-            data = self._preprocess_pub(pub)
+            if self._runtime_parameter_bind and pub.circuit.num_parameters:
+                data = self._preprocess_parametric_pub(pub)
+                table = parameter_table(pub.circuit, pub.parameter_values)
+                parameter_binds.extend(table for _ in data.circuits)
+                num_experiments.append(len(data.circuits) * pub.parameter_values.size)
+            else:
+                data = self._preprocess_pub(pub)
+                parameter_binds.extend({} for _ in data.circuits)
+                num_experiments.append(len(data.circuits))
             preprocessed_data.append(data)
             flat_circuits.extend(data.circuits)
 
-        run_result, metadata = _run_circuits(
+        run_result, metadata = run_circuits(
             flat_circuits,
             self._backend,
+            parameter_binds if self._runtime_parameter_bind else None,
             shots=shots,
             seed_simulator=self._options.seed_simulator,
             session_id=self._session_id,
         )
         counts = _prepare_counts(run_result)
 
+        # Circuits bound at runtime give one experiment per parameter set
+        experiments = []
+        for meta in metadata:
+            if "param_indices" in meta:
+                experiments.extend(
+                    dict(meta, param_index=index) for index in meta["param_indices"]
+                )
+            else:
+                experiments.append(meta)
+
         results = []
         start = 0
-        for pub, data in zip(pubs, preprocessed_data):
-            end = start + len(data.circuits)
-            expval_map = self._calc_expval_map(counts[start:end], metadata[start:end])
+        for pub, data, num in zip(pubs, preprocessed_data, num_experiments):
+            end = start + num
+            pub_experiments = experiments[start:end]
+            expval_map = self._calc_expval_map(counts[start:end], pub_experiments)
+            num_terms = sum(len(meta["orig_paulis"]) for meta in pub_experiments)
             start = end
-            results.append(self._postprocess_pub(pub, expval_map, data, shots))
+
+            result = self._postprocess_pub(pub, expval_map, data, shots)
+            result.metadata["num_circuits"] = num
+            result.metadata["circuits_saved"] = num_terms - num
+            results.append(result)
 
         return results
+
+    def _preprocess_parametric_pub(self, pub) -> _PreprocessedData:
+        """Builds the parametrized measurement circuits of a pub, measuring the
+        terms of the observables of all its bindings."""
+        param_shape = pub.parameter_values.shape
+        param_indices = np.fromiter(np.ndindex(param_shape), dtype=object).reshape(
+            param_shape
+        )
+        bc_param_ind, bc_obs = np.broadcast_arrays(param_indices, pub.observables)
+
+        pauli_strings = set()
+        for observable in bc_obs.flat:
+            pauli_strings.update(observable)
+
+        circuits = self._create_measurement_circuits(
+            pub.circuit, PauliList(sorted(pauli_strings)), None
+        )
+        for circuit in circuits:
+            # In the order of the parameter table
+            circuit.metadata["param_indices"] = list(np.ndindex(param_shape))
+
+        return _PreprocessedData(circuits, bc_param_ind, bc_obs)
+
+    def _calc_expval_map(self, counts, metadata: dict) -> dict:
+        expval_map = {}
+        for count, meta in zip(counts, metadata):
+            orig_paulis = meta["orig_paulis"]
+            expvals, variances = _pauli_expval_with_variance(count, meta["meas_paulis"])
+            # Commuting groups are measured as signed Z strings
+            expvals = expvals * meta.get("signs", 1.0)
+            for pauli, expval, variance in zip(orig_paulis, expvals, variances):
+                expval_map[meta["param_index"], pauli.to_label()] = (expval, variance)
+        return expval_map
+
+    def _create_measurement_circuits(
+        self, circuit: QuantumCircuit, observable: PauliList, param_index: tuple
+    ) -> list[QuantumCircuit]:
+        """Generates the circuits measuring the given Paulis, one per group."""
+        meas_circuits = []
+        for index, obs in enumerate(
+            group_paulis(observable, self.grouping, self._coloring)
+        ):
+            if self.grouping == "commuting":
+                meas_circuit, indices, paulis, signs = commuting_measurement_circuit(
+                    circuit.num_qubits, obs, f"__c_g{index}"
+                )
+                meas_circuit.metadata = {"signs": signs}
+            else:
+                basis = Pauli(
+                    (np.logical_or.reduce(obs.z), np.logical_or.reduce(obs.x))
+                )
+                meas_circuit, indices = _measurement_circuit(circuit.num_qubits, basis)
+                paulis = PauliList.from_symplectic(
+                    obs.z[:, indices], obs.x[:, indices], obs.phase
+                )
+                meas_circuit.metadata = {}
+
+            meas_circuit.metadata.update(
+                {
+                    "orig_paulis": obs,
+                    "meas_paulis": paulis,
+                    "param_index": param_index,
+                }
+            )
+            meas_circuits.append(meas_circuit)
+
+        # unroll basis gates
+        meas_circuits = self._passmanager.run(meas_circuits)
+
+        # combine measurement circuits
+        preprocessed_circuits = []
+        for meas_circuit in meas_circuits:
+            circuit_copy = circuit.copy()
+            clbits = meas_circuit.cregs[0]
+            for creg in circuit_copy.cregs:
+                if clbits.name == creg.name:
+                    raise QiskitError(
+                        "Classical register for measurements conflict with those of the input "
+                        f"circuit: {clbits}. "
+                        "Recommended to avoid register names starting with '__'."
+                    )
+            circuit_copy.add_register(clbits)
+            circuit_copy.compose(meas_circuit, clbits=clbits, inplace=True)
+            circuit_copy.metadata = meas_circuit.metadata
+            preprocessed_circuits.append(circuit_copy)
+        return preprocessed_circuits
@@ -0,0 +1,65 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.primitives.containers.bindings_array import BindingsArray
+from qiskit.result import Result
+
+
+def supports_runtime_parameter_bind(backend) -> bool:
+    return hasattr(backend.options, "parameter_binds")
+
+
+def parameter_table(
+    circuit: QuantumCircuit, parameter_values: BindingsArray
+) -> dict[Parameter, list[float]]:
+    """Values of every binding of a pub, for each parameter of its circuit,
+    in the order of ``np.ndindex(parameter_values.shape)``."""
+    values = parameter_values.as_array(circuit.parameters).reshape(
+        -1, circuit.num_parameters
+    )
+
+    return {param: values[:, i].tolist() for i, param in enumerate(circuit.parameters)}
+
+
+def run_circuits(
+    circuits: list[QuantumCircuit],
+    backend,
+    parameter_binds: list[dict] | None = None,
+    clear_metadata: bool = True,
+    **run_options,
+) -> tuple[list[Result], list[dict]]:
+    """Runs the circuits like ``_run_circuits`` of the reference primitives,
+    along with their ``parameter_binds`` when given.
+
+    Returns the results and the metadata of the circuits.
+    """
+    metadata = []
+    for circuit in circuits:
+        metadata.append(circuit.metadata)
+        if clear_metadata:
+            circuit.metadata = {}
+
+    if parameter_binds is not None and not any(parameter_binds):
+        # Nothing to bind at runtime
+        parameter_binds = None
+
+    max_circuits = backend.max_circuits or max(len(circuits), 1)
+    jobs = []
+    for pos in range(0, len(circuits), max_circuits):
+        options = dict(run_options)
+        if parameter_binds is not None:
+            options["parameter_binds"] = parameter_binds[pos : pos + max_circuits]
+        jobs.append(backend.run(circuits[pos : pos + max_circuits], **options))
+
+    return [job.result() for job in jobs], metadata
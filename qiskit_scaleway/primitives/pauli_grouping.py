@@ -0,0 +1,115 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import rustworkx as rx
+
+from qiskit.circuit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.quantum_info import Clifford, PauliList, StabilizerState
+
+GROUPING_STRATEGIES = ("none", "qubit_wise", "commuting")
+
+COLORING_STRATEGIES = {
+    "largest_first": rx.ColoringStrategy.Degree,
+    "saturation": rx.ColoringStrategy.Saturation,
+    "independent_set": rx.ColoringStrategy.IndependentSet,
+}
+
+
+def group_paulis(
+    paulis: PauliList, grouping: str, coloring: str = "largest_first"
+) -> list[PauliList]:
+    """Partitions Paulis into groups measurable with a single circuit.
+
+    The groups are the color classes of the non-commutation graph of the
+    Paulis, colored with the greedy ``coloring`` heuristic.
+
+    :param paulis: the Paulis to measure
+    :param grouping: ``"none"`` for one group per Pauli, ``"qubit_wise"`` for
+        qubit-wise commuting groups, ``"commuting"`` for commuting groups
+    :param coloring: ``"largest_first"``, ``"saturation"`` or ``"independent_set"``
+    """
+    if grouping == "none":
+        return [paulis[[i]] for i in range(len(paulis))]
+
+    graph = paulis.noncommutation_graph(qubit_wise=grouping == "qubit_wise")
+    colors = rx.graph_greedy_color(graph, strategy=COLORING_STRATEGIES[coloring])
+
+    groups = {}
+    for index, color in sorted(colors.items()):
+        groups.setdefault(color, []).append(index)
+
+    return [paulis[indices] for _, indices in sorted(groups.items())]
+
+
+def commuting_measurement_circuit(
+    num_qubits: int, paulis: PauliList, name: str
+) -> tuple[QuantumCircuit, list[int], PauliList, np.ndarray]:
+    """Builds a circuit measuring commuting Paulis at once.
+
+    A Clifford ``C`` is synthesized from independent generators of the group,
+    such that every ``C† P C`` is a signed Z string. The circuit applies ``C†``
+    and measures the qubits those Z strings act on.
+
+    Returns the circuit, the measured qubits, the Z strings restricted to the
+    measured qubits, and the sign of each Pauli.
+    """
+    generators = _independent_rows(paulis)
+
+    if len(generators):
+        clifford = StabilizerState.from_stabilizer_list(
+            [pauli.to_label() for pauli in generators], allow_underconstrained=True
+        ).clifford
+    else:
+        # Identities only, already diagonal
+        clifford = Clifford(QuantumCircuit(num_qubits))
+    diagonal = paulis.evolve(clifford, frame="h")
+
+    qubit_indices = np.arange(num_qubits)[np.logical_or.reduce(diagonal.z, axis=0)]
+    if len(qubit_indices) == 0:
+        # Identity only, measure a qubit anyway
+        qubit_indices = np.array([0])
+
+    meas_circuit = QuantumCircuit(
+        QuantumRegister(num_qubits, "q"),
+        ClassicalRegister(len(qubit_indices), name),
+    )
+    meas_circuit.compose(clifford.adjoint().to_circuit(), inplace=True)
+    for clbit, i in enumerate(qubit_indices):
+        meas_circuit.measure(i, clbit)
+
+    meas_paulis = PauliList.from_symplectic(
+        diagonal.z[:, qubit_indices], diagonal.x[:, qubit_indices]
+    )
+    signs = np.where(diagonal.phase == 2, -1.0, 1.0)
+
+    return meas_circuit, list(qubit_indices), meas_paulis, signs
+
+
+def _independent_rows(paulis: PauliList) -> PauliList:
+    """Returns a subset of the Paulis whose symplectic vectors are a basis
+    over GF(2) of those of all the Paulis, the identity excluded."""
+    basis = []
+    indices = []
+
+    for index, row in enumerate(np.hstack([paulis.z, paulis.x])):
+        # Reduce the row by the basis, kept with distinct leading bits
+        for pivot, vector in basis:
+            if row[pivot]:
+                row = row ^ vector
+
+        if row.any():
+            basis.append((int(np.argmax(row)), row))
+            indices.append(index)
+
+    return paulis[indices]
@@ -18,8 +18,9 @@ from numpy.typing import NDArray
 
 from qiskit.primitives.backend_sampler_v2 import (
     BackendSamplerV2,
+    _analyze_circuit,
     _MeasureInfo,
-    _samples_to_packed_array,
+    _prepare_memory,
     QiskitError,
     ResultMemory,
 )
@@ -29,20 +30,58 @@ from qiskit.primitives.containers import (
     DataBin,
     SamplerPubResult,
 )
+from qiskit.primitives.containers.sampler_pub import SamplerPub
+from qiskit.result import Result
+
+from .parameter_binding import (
+    parameter_table,
+    run_circuits,
+    supports_runtime_parameter_bind,
+)
 
 _NON_BINARY_CHARS = re.compile(r"[^01]")
 
 
 class Sampler(BackendSamplerV2):
+    """Sampler running the pubs on a Scaleway backend.
+
+    With ``counts_only``, jobs return the counts of each circuit instead of
+    one memory string per shot, and the bit arrays are rebuilt by repeating
+    each outcome as many times as it was measured. The shot order is then
+    lost: outcomes are grouped, or shuffled with ``shuffle_seed`` when given.
+    The counts of the bit arrays are exact.
+
+    With ``runtime_parameter_bind``, on backends binding parameters at
+    runtime (Aer), each parametric pub is sent as a single parametrized
+    circuit along with the table of its parameter values.
+
+    :param backend: the backend running the circuits
+    :param session_id: the session the jobs are submitted in
+    :param options: ``BackendSamplerV2`` options
+    :param counts_only: request counts instead of per-shot memory
+    :param shuffle_seed: optional seed of the shuffling of the rebuilt shots
+    :param runtime_parameter_bind: bind the parameters on the platform
+    """
+
     def __init__(
         self,
         backend,
         session_id: str,
         options: dict | None = None,
+        counts_only: bool = False,
+        shuffle_seed: int | None = None,
+        runtime_parameter_bind: bool = False,
     ):
         if not session_id:
             raise Exception("session_id must be not None")
 
+        if runtime_parameter_bind and not supports_runtime_parameter_bind(backend):
+            raise ValueError(f"{backend.name} cannot bind parameters at runtime")
+
+        self._counts_only = counts_only
+        self._shuffle_seed = shuffle_seed
+        self._runtime_parameter_bind = runtime_parameter_bind
+
         if not options:
             options = {}
 
@@ -57,15 +96,83 @@ class Sampler(BackendSamplerV2):
             options=options,
         )
 
+    def _run_pubs(self, pubs: list[SamplerPub], shots: int) -> list[SamplerPubResult]:
+        """Compute results for pubs that all require the same value of ``shots``."""
+        if not self._counts_only and not self._runtime_parameter_bind:
+            return super()._run_pubs(pubs, shots)
+
+        run_opts = self._options.run_options or {}
+        meas_level = run_opts.get("meas_level")
+
+        if self._counts_only and meas_level not in (None, 2):
+            raise QiskitError("counts_only requires meas_level 2 results")
+
+        flatten_circuits = []
+        parameter_binds = []
+        for pub in pubs:
+            if self._runtime_parameter_bind and pub.circuit.num_parameters:
+                # One program, bound to every parameter set on the platform
+                flatten_circuits.append(pub.circuit)
+                parameter_binds.append(
+                    parameter_table(pub.circuit, pub.parameter_values)
+                )
+            else:
+                circuits = np.ravel(pub.parameter_values.bind_all(pub.circuit))
+                flatten_circuits.extend(circuits.tolist())
+                parameter_binds.extend({} for _ in circuits)
+
+        results, _ = run_circuits(
+            flatten_circuits,
+            self._backend,
+            parameter_binds if self._runtime_parameter_bind else None,
+            clear_metadata=False,
+            memory=not self._counts_only,
+            shots=shots,
+            seed_simulator=self._options.seed_simulator,
+            **run_opts,
+        )
+
+        if self._counts_only:
+            result_memory = _prepare_counts(results)
+        else:
+            result_memory = _prepare_memory(results)
+
+        rng = None
+
+        if self._shuffle_seed is not None:
+            rng = np.random.default_rng(self._shuffle_seed)
+
+        pub_results = []
+        start = 0
+        for pub in pubs:
+            meas_info, max_num_bytes = _analyze_circuit(pub.circuit)
+            end = start + pub.parameter_values.size
+            pub_results.append(
+                self._postprocess_pub(
+                    result_memory[start:end],
+                    shots,
+                    pub.parameter_values.shape,
+                    meas_info,
+                    max_num_bytes,
+                    pub.circuit.metadata,
+                    meas_level,
+                    rng,
+                )
+            )
+            start = end
+
+        return pub_results
+
     def _postprocess_pub(
         self,
-        result_memory: list[ResultMemory],
+        result_memory: list[ResultMemory] | list[dict[str, int]],
         shots: int,
         shape: tuple[int, ...],
         meas_info: list[_MeasureInfo],
         max_num_bytes: int,
         circuit_metadata: dict,
         meas_level: int | None,
+        rng: np.random.Generator | None = None,
     ) -> SamplerPubResult:
         """Converts the memory data into a sampler pub result
 
@@ -74,21 +181,15 @@ class Sampler(BackendSamplerV2):
         complex numpy array.
         """
         if meas_level == 2 or meas_level is None:
-            arrays = {
-                item.creg_name: np.zeros(
-                    shape + (shots, item.num_bytes), dtype=np.uint8
-                )
-                for item in meas_info
-            }
-            memory_array = _memory_array(result_memory, max_num_bytes)
-
-            for samples, index in zip(memory_array, np.ndindex(*shape)):
-                for item in meas_info:
-                    ary = _samples_to_packed_array(samples, item.num_bits, item.start)
-                    arrays[item.creg_name][index] = ary
+            memory_array = _memory_array(result_memory, max_num_bytes, rng).reshape(
+                shape + (shots, max_num_bytes)
+            )
 
             meas = {
-                item.creg_name: BitArray(arrays[item.creg_name], item.num_bits)
+                item.creg_name: BitArray(
+                    _extract_register(memory_array, item.num_bits, item.start),
+                    item.num_bits,
+                )
                 for item in meas_info
             }
         elif meas_level == 1:
@@ -104,20 +205,127 @@ class Sampler(BackendSamplerV2):
         )
 
 
-def _memory_array(results: list[list[str]], num_bytes: int) -> NDArray[np.uint8]:
-    """Converts the memory data into an array in an unpacked way."""
+def _prepare_counts(results: list[Result]) -> list[dict[str, int]]:
+    """Joins the counts of split results, keyed by hex or binary outcome."""
     lst = []
+    for res in results:
+        for exp in res.results:
+            if hasattr(exp.data, "counts") and exp.data.counts:
+                lst.append(exp.data.counts)
+            else:
+                # no measure in a circuit
+                lst.append({"0x0": exp.shots})
+    return lst
+
+
+def _memory_array(
+    results: list[list[str]] | list[dict[str, int]],
+    num_bytes: int,
+    rng: np.random.Generator | None = None,
+) -> NDArray[np.uint8]:
+    """Converts the memory data, or the counts, into an array of big-endian
+    packed bytes, of shape ``(len(results), shots, num_bytes)``."""
+    if len(results) > 0 and isinstance(results[0], dict):
+        return np.stack(
+            [_counts_to_bytes(counts, num_bytes, rng) for counts in results]
+        )
+
+    base = 16
     # Heuristic: check only the first result format
     if len(results) > 0 and len(results[0]) > 0:
         base = 16 if _NON_BINARY_CHARS.search(results[0][0]) else 2
 
-    for memory in results:
-        if num_bytes > 0:
-            data = b"".join(int(i, base).to_bytes(num_bytes, "big") for i in memory)
-            data = np.frombuffer(data, dtype=np.uint8).reshape(-1, num_bytes)
-        else:
-            # no measure in a circuit
-            data = np.zeros((len(memory), num_bytes), dtype=np.uint8)
-        lst.append(data)
-    ary = np.asarray(lst)
-    return np.unpackbits(ary, axis=-1, bitorder="big")
+    return np.stack([_memory_to_bytes(memory, num_bytes, base) for memory in results])
+
+
+def _counts_to_bytes(
+    counts: dict[str, int], num_bytes: int, rng: np.random.Generator | None
+) -> NDArray[np.uint8]:
+    """Rebuilds the per-shot rows of a circuit from its counts, each outcome
+    repeated as many times as it was measured, shuffled when ``rng`` is given."""
+    outcomes = [outcome.replace(" ", "") for outcome in counts]
+    base = 16 if any(_NON_BINARY_CHARS.search(o) for o in outcomes) else 2
+
+    rows = _memory_to_bytes(outcomes, num_bytes, base)
+    ary = np.repeat(rows, list(counts.values()), axis=0)
+
+    if rng is not None:
+        ary = ary[rng.permutation(len(ary))]
+
+    return ary
+
+
+def _extract_register(
+    memory: NDArray[np.uint8], num_bits: int, start: int
+) -> NDArray[np.uint8]:
+    """Extracts the ``num_bits`` bits from clbit ``start`` of packed memory
+    (big-endian bytes on the last axis) as packed bytes, for all the leading
+    axes at once."""
+    num_bytes = _min_num_bytes(num_bits)
+    byte_shift, bit_shift = divmod(start, 8)
+
+    # Bytes of the register plus the next higher one, zero-padded on the left
+    # when the window goes past the first byte of the memory
+    end = memory.shape[-1] - byte_shift
+    begin = end - num_bytes - 1
+    window = memory[..., max(begin, 0) : end]
+
+    if begin < 0:
+        padding = [(0, 0)] * (memory.ndim - 1) + [(-begin, 0)]
+        window = np.pad(window, padding)
+
+    ary = window[..., 1:]
+
+    if bit_shift:
+        high = window[..., :-1]
+        ary = (ary >> bit_shift) | (high << (8 - bit_shift))
+    else:
+        ary = ary.copy()
+
+    if num_bits % 8:
+        ary[..., 0] &= (1 << (num_bits % 8)) - 1
+
+    return ary
+
+
+def _min_num_bytes(num_bits: int) -> int:
+    return num_bits // 8 + (num_bits % 8 > 0)
+
+
+def _memory_to_bytes(memory, num_bytes: int, base: int) -> NDArray[np.uint8]:
+    """Decodes the memory of a circuit into one big-endian ``num_bytes`` row
+    per shot, with array operations only."""
+    shots = len(memory)
+
+    if num_bytes == 0 or shots == 0:
+        # no measure in a circuit
+        return np.zeros((shots, num_bytes), dtype=np.uint8)
+
+    values = getattr(memory, "array", None)
+
+    if values is not None and values.dtype == np.uint64:
+        # MemoryArray of a streamed result, the outcomes are already integers
+        data = values.astype(">u8").view(np.uint8).reshape(shots, 8)
+
+        if num_bytes <= 8:
+            return data[:, 8 - num_bytes :]
+
+        return np.pad(data, ((0, 0), (num_bytes - 8, 0)))
+
+    num_digits = num_bytes * 2 if base == 16 else num_bytes * 8
+
+    # Right-align the digits on a common width, one byte per character
+    strings = np.asarray(list(memory), dtype=np.bytes_)
+    width = max(num_digits, strings.dtype.itemsize)
+    strings = np.char.rjust(strings, width, b"0")
+    chars = strings.view(np.uint8).reshape(shots, width)[:, -num_digits:]
+
+    if base == 2:
+        return np.packbits(chars == ord("1"), axis=-1, bitorder="big")
+
+    # "0"-"9" map to 0-9, "a"-"f" and "A"-"F" to 10-15, and the "x" of the
+    # prefix, left of the digits, to 0
+    digits = (chars & 0x0F) + 9 * (chars >> 6)
+    digits[chars == ord("x")] = 0
+
+    return (digits[:, 0::2] << 4) | digits[:, 1::2]
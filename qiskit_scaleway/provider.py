@@ -11,14 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import functools
 import os
+import threading
+import time
+import weakref
+import httpx
 
-from typing import Optional, List, Dict
+from concurrent import futures
+from typing import Iterable, Iterator, Optional, List, Dict, Tuple
 
+from qiskit.providers import JobTimeoutError, JobV1
 from qiskit.providers.providerutils import filter_backends
 
 from qiskit_scaleway.backends import (
     BaseBackend,
+    BaseJob,
+    JobMonitor,
+    PollingStrategy,
     IqmBackend,
     AqtBackend,
     QsimBackend,
@@ -28,6 +39,16 @@ from qiskit_scaleway.backends import (
     QuoblyBackend,
 )
 
+from qiskit_scaleway.utils import (
+    ModelCache,
+    AsyncQaaSClient,
+    CompressionTransport,
+    ModelClient,
+    ResultCache,
+    create_async_http_client,
+    create_http_client,
+)
+
 from scaleway_qaas_client.v1alpha1 import QaaSClient
 
 _MAP_NAME_TO_BACKEND = {
@@ -48,6 +69,22 @@ class ScalewayProvider:
     :param secret_key: optional authentication token required to access the Scaleway API, if the provided ``secret_key`` is None, the value is loaded from the QISKIT_SCALEWAY_SECRET_KEY environment variables
 
     :param url: optional value, endpoint URL of the API, if the provided ``url`` is None, the value is loaded from the QISKIT_SCALEWAY_API_URL environment variables
+
+    :param platform_cache_ttl: optional value, number of seconds a platform listing is reused before the API is queried again, ``0`` disables the cache
+
+    :param model_cache: optional ``ModelCache`` used to avoid pushing the same computation model twice, an in-memory cache is used by default
+
+    :param http_client: optional ``httpx.Client`` used to download job results, a connection-pooled client with retries is created by default (see ``qiskit_scaleway.utils.create_http_client``)
+
+    :param model_compression: optional ``gzip`` or ``zstd``, compresses the computation models larger than ``model_compression_threshold`` bytes when pushing them to the API. Compression is turned off if the API does not accept it
+
+    :param model_compression_threshold: optional value, minimum size in bytes of a computation model to compress it
+
+    :param result_cache: optional ``ResultCache``, keeps the results of finished jobs on disk so that ``result()`` and ``retrieve_job()`` do not download them again
+
+    :param async_http_client: optional ``httpx.AsyncClient`` used by ``job.aresult()`` to download job results, by default one client is created per event loop (see ``qiskit_scaleway.utils.create_async_http_client``)
+
+    :param polling_strategy: optional ``PollingStrategy`` of the ``job_monitor`` polling every submitted job, an ``AdaptivePolling`` by default
     """
 
     def __init__(
@@ -55,6 +92,14 @@ class ScalewayProvider:
         project_id: Optional[str] = None,
         secret_key: Optional[str] = None,
         url: Optional[str] = None,
+        platform_cache_ttl: float = 60,
+        model_cache: Optional[ModelCache] = None,
+        http_client: Optional[httpx.Client] = None,
+        model_compression: Optional[str] = None,
+        model_compression_threshold: int = 64 * 1024,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        result_cache: Optional[ResultCache] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
     ) -> None:
         secret_key = secret_key or os.getenv("QISKIT_SCALEWAY_SECRET_KEY")
         project_id = project_id or os.getenv("QISKIT_SCALEWAY_PROJECT_ID")
@@ -66,10 +111,245 @@ class ScalewayProvider:
         if project_id is None:
             raise Exception("project_id is missing")
 
+        self.__project_id = project_id
+        self.__secret_key = secret_key
+        self.__url = url
         self.__client = QaaSClient(
             url=url, secret_key=secret_key, project_id=project_id
         )
 
+        self.__platform_cache_ttl = platform_cache_ttl
+        self.__platform_cache: Dict[Optional[str], Tuple[float, List]] = {}
+        self.__backend_cache: Dict[Tuple[str, str], BaseBackend] = {}
+        self.__cache_lock = threading.Lock()
+
+        self.__job_monitor = JobMonitor(
+            self.__client, polling_strategy=polling_strategy
+        )
+        self.__model_cache = ModelCache() if model_cache is None else model_cache
+        self.__http_client = http_client or create_http_client()
+        self.__model_compression = None
+        self.__model_client = None
+        self.__async_http_client = async_http_client
+        self.__result_cache = result_cache
+        # Async clients are bound to the event loop they are used on
+        self.__async_clients = weakref.WeakKeyDictionary()
+
+        if model_compression:
+            # QaaSClient does not take a transport, models are pushed by a
+            # dedicated client compressing them
+            self.__model_compression = CompressionTransport(
+                httpx.HTTPTransport(),
+                encoding=model_compression,
+                threshold=model_compression_threshold,
+            )
+            self.__model_client = ModelClient(
+                project_id=project_id,
+                secret_key=secret_key,
+                url=url,
+                transport=self.__model_compression,
+            )
+
+    @property
+    def project_id(self) -> str:
+        return self.__project_id
+
+    @property
+    def model_cache(self) -> ModelCache:
+        """Cache of the computation models already pushed to the API."""
+        return self.__model_cache
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Connection-pooled client downloading the job results."""
+        return self.__http_client
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """On-disk store of the results of finished jobs, if any."""
+        return self.__result_cache
+
+    @property
+    def async_client(self) -> AsyncQaaSClient:
+        """Asyncio QaaS client of the running event loop."""
+        return self.__get_async_clients()[0]
+
+    @property
+    def async_http_client(self) -> httpx.AsyncClient:
+        """Asyncio client downloading the job results on the running event loop."""
+        return self.__get_async_clients()[1]
+
+    def __get_async_clients(self) -> Tuple[AsyncQaaSClient, httpx.AsyncClient]:
+        loop = asyncio.get_running_loop()
+
+        with self.__cache_lock:
+            clients = self.__async_clients.get(loop)
+
+            if clients is None:
+                clients = (
+                    AsyncQaaSClient(
+                        project_id=self.__project_id,
+                        secret_key=self.__secret_key,
+                        url=self.__url,
+                    ),
+                    self.__async_http_client or create_async_http_client(),
+                )
+                self.__async_clients[loop] = clients
+
+        return clients
+
+    async def aclose(self) -> None:
+        """Closes the async clients opened on the running event loop."""
+        with self.__cache_lock:
+            clients = self.__async_clients.pop(asyncio.get_running_loop(), None)
+
+        if clients is not None:
+            api_client, http_client = clients
+            await api_client.aclose()
+
+            if http_client is not self.__async_http_client:
+                await http_client.aclose()
+
+    @property
+    def model_compression(self) -> Optional[CompressionTransport]:
+        """Transport compressing the pushed models, exposes ``enabled`` and the
+        ``bytes_sent``/``bytes_saved`` counters."""
+        return self.__model_compression
+
+    @property
+    def model_client(self) -> Optional[ModelClient]:
+        """Client pushing the computation models when they are compressed,
+        ``None`` when models are pushed by the QaaS client."""
+        return self.__model_client
+
+    @property
+    def job_monitor(self) -> JobMonitor:
+        """Shared monitor polling every job submitted through this provider."""
+        return self.__job_monitor
+
+    def retrieve_job(self, job_id: str) -> BaseJob:
+        """Rebuilds the job object of a job submitted earlier, possibly by
+        another process.
+
+        Jobs found in the result cache are rebuilt without querying the job
+        or its session, and their results are read from the cache.
+
+        :param job_id: ID of the job
+        """
+        entry = self.__result_cache.get(job_id) if self.__result_cache else None
+
+        if entry is not None:
+            session_id = entry["session_id"]
+            platform_id = entry["platform_id"]
+            name = entry["name"]
+        else:
+            qaas_job = self.__client.get_job(job_id)
+            session_id = qaas_job.session_id
+            platform_id = self.__client.get_session(session_id).platform_id
+            name = qaas_job.name or None
+
+        backends = [backend for backend in self.backends() if backend.id == platform_id]
+
+        if not backends:
+            raise Exception(f"No backend matches the platform of job {job_id}")
+
+        return backends[0]._attach_job(job_id, session_id=session_id, name=name)
+
+    def as_completed(
+        self, jobs: Iterable[JobV1], timeout: Optional[float] = None
+    ) -> Iterator[JobV1]:
+        """Yields the given jobs as soon as they are finished (done or failed),
+        whatever their submission order. Their ``result()`` then returns
+        without polling.
+
+        All jobs are tracked by the shared ``job_monitor``.
+
+        :param jobs: submitted jobs, possibly ``CompositeJob``
+        :param timeout: optional maximum number of seconds to wait for all jobs
+
+        :raises JobTimeoutError: if some jobs are still running after ``timeout``
+        """
+        job_futures = {job.future(): job for job in jobs}
+
+        try:
+            for future in futures.as_completed(job_futures, timeout=timeout):
+                yield job_futures[future]
+        except futures.TimeoutError:
+            raise JobTimeoutError("Timed out waiting for jobs")
+
+    def wait(
+        self,
+        jobs: Iterable[JobV1],
+        timeout: Optional[float] = None,
+        return_when: str = futures.ALL_COMPLETED,
+    ) -> Tuple[List[JobV1], List[JobV1]]:
+        """Waits for the given jobs, like ``concurrent.futures.wait``.
+
+        :param jobs: submitted jobs, possibly ``CompositeJob``
+        :param timeout: optional maximum number of seconds to wait
+        :param return_when: ``concurrent.futures.ALL_COMPLETED``,
+            ``FIRST_COMPLETED`` or ``FIRST_EXCEPTION``
+
+        :return: the finished jobs and the pending ones, in the given order
+        """
+        jobs = list(jobs)
+        job_futures = [job.future() for job in jobs]
+
+        done, _ = futures.wait(job_futures, timeout=timeout, return_when=return_when)
+
+        return (
+            [job for job, future in zip(jobs, job_futures) if future in done],
+            [job for job, future in zip(jobs, job_futures) if future not in done],
+        )
+
+    def invalidate_cache(self) -> None:
+        """Forget cached platform listings, next lookups query the API again."""
+        with self.__cache_lock:
+            self.__platform_cache.clear()
+
+    def _list_platforms(self, name: Optional[str]) -> List:
+        now = time.monotonic()
+
+        with self.__cache_lock:
+            cached = self.__platform_cache.get(name)
+
+            if cached and now - cached[0] < self.__platform_cache_ttl:
+                return cached[1]
+
+        platforms = self.__client.list_platforms(name=name)
+
+        if self.__platform_cache_ttl > 0:
+            with self.__cache_lock:
+                self.__platform_cache[name] = (now, platforms)
+
+        return platforms
+
+    def _get_or_create_backend(self, platform) -> Optional[BaseBackend]:
+        key = (platform.id, platform.version)
+
+        with self.__cache_lock:
+            backend = self.__backend_cache.get(key)
+
+            if backend:
+                # Same platform version, only refresh volatile fields (availability...)
+                backend._platform = platform
+                return backend
+
+        backend_class = _MAP_NAME_TO_BACKEND.get(
+            platform.provider_name.lower()
+        )  # aqt, iqm
+        backend_class = backend_class or _MAP_NAME_TO_BACKEND.get(
+            platform.backend_name.lower()
+        )  # qsim, aer, cudaq
+
+        if not backend_class:
+            return None
+
+        backend = backend_class(provider=self, client=self.__client, platform=platform)
+
+        with self.__cache_lock:
+            return self.__backend_cache.setdefault(key, backend)
+
     def get_backend(self, name=None, **kwargs):
         """Return a single backend matching the specified filtering.
 
@@ -112,20 +392,12 @@ class ScalewayProvider:
         if kwargs.get("min_num_qubits") is not None:
             filters["min_num_qubits"] = kwargs.pop("min_num_qubits", None)
 
-        platforms = self.__client.list_platforms(name=name)
+        platforms = self._list_platforms(name)
 
         for platform in platforms:
-            backend_class = _MAP_NAME_TO_BACKEND.get(
-                platform.provider_name.lower()
-            )  # aqt, iqm
-            backend_class = backend_class or _MAP_NAME_TO_BACKEND.get(
-                platform.backend_name.lower()
-            )  # qsim, aer, cudaq
-
-            if backend_class:
-                backend = backend_class(
-                    provider=self, client=self.__client, platform=platform
-                )
+            backend = self._get_or_create_backend(platform)
+
+            if backend:
                 scaleway_backends.append(backend)
 
         if filters is not None:
@@ -133,6 +405,31 @@ class ScalewayProvider:
 
         return filter_backends(scaleway_backends, **kwargs)
 
+    async def aget_backend(self, name=None, **kwargs):
+        """Asyncio counterpart of ``get_backend``."""
+        loop = asyncio.get_running_loop()
+
+        # Platform listings are cached and rare, a worker thread is enough
+        return await loop.run_in_executor(
+            None, functools.partial(self.get_backend, name, **kwargs)
+        )
+
+    async def abackends(
+        self, name: Optional[str] = None, **kwargs
+    ) -> List[BaseBackend]:
+        """Asyncio counterpart of ``backends``."""
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            None, functools.partial(self.backends, name, **kwargs)
+        )
+
+    async def __aenter__(self) -> "ScalewayProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     def filters(self, backends: List[BaseBackend], filters: Dict) -> List[BaseBackend]:
         operational = filters.get("operational")
         min_num_qubits = filters.get("min_num_qubits")
@@ -12,3 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from .target import create_target_from_platform
+from .api_errors import error_status_code, is_transient_error
+from .model_cache import ModelCache
+from .program_cache import ProgramCache, circuit_fingerprint
+from .http_client import (
+    CompressionTransport,
+    compress,
+    create_async_http_client,
+    create_http_client,
+    default_http_client,
+)
+from .result_stream import MemoryArray, StreamedProgramResult, decode_result_stream
+from .async_client import AsyncQaaSClient
+from .model_client import ModelClient
+from .result_cache import ResultCache
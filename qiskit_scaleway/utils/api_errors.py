@@ -0,0 +1,40 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import re
+import httpx
+
+from typing import Optional
+
+# The QaaS clients report failed requests as Exception("error <status>: <body>")
+_STATUS_CODE = re.compile(r"error (\d{3}):")
+
+
+def error_status_code(error: BaseException) -> Optional[int]:
+    """HTTP status code of an error raised by a QaaS client call, ``None`` when
+    the request did not get a response."""
+    match = _STATUS_CODE.match(str(error))
+
+    return int(match.group(1)) if match else None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a failed QaaS client call may succeed if sent again: network
+    errors, rate limiting and server errors. Other client errors (unknown or
+    deleted resource, revoked key...) are permanent."""
+    if isinstance(error, httpx.TransportError):
+        return True
+
+    status = error_status_code(error)
+
+    return status is not None and (status == 429 or status >= 500)
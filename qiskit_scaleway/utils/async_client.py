@@ -0,0 +1,144 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional
+
+from scaleway_qaas_client.v1alpha1 import QaaSJob, QaaSJobResult
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.api.jobs.create_job import (
+    asyncio_detailed as _create_job_async,
+)
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.api.jobs.get_job import (
+    asyncio_detailed as _get_job_async,
+)
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.api.jobs.list_job_results import (
+    asyncio_detailed as _list_job_results_async,
+)
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.api.jobs.list_jobs import (
+    asyncio_detailed as _list_jobs_async,
+)
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.api.models.create_model import (
+    asyncio_detailed as _create_model_async,
+)
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.client import (
+    AuthenticatedClient,
+)
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.models import (
+    CreateJobBody,
+    CreateJobBodyCircuit,
+    CreateModelBody,
+)
+
+_DEFAULT_URL = "https://api.scaleway.com"
+
+
+def _raise_on_error(response) -> None:
+    if not response:
+        raise Exception("error: None response")
+
+    if int(response.status_code) >= 400:
+        raise Exception(
+            f"error {response.status_code}: {response.content.decode('utf-8')}"
+        )
+
+
+class AsyncQaaSClient:
+    """Asyncio counterpart of ``QaaSClient`` for the calls made while
+    submitting and waiting for jobs.
+
+    The underlying ``httpx.AsyncClient`` is bound to the event loop it is
+    first used on.
+    """
+
+    def __init__(self, project_id: str, secret_key: str, url: Optional[str] = None):
+        url = url or _DEFAULT_URL
+
+        self.__project_id = project_id
+        self.__client = AuthenticatedClient(
+            base_url=url,
+            timeout=10.0,
+            verify_ssl="https" in url,
+            token=secret_key,
+            prefix=None,
+            auth_header_name="X-Auth-Token",
+        )
+
+    def __repr__(self) -> str:
+        return f"<AsyncQaaSClient(project_id={self.__project_id})>"
+
+    async def create_model(self, payload: str):
+        if not payload:
+            raise Exception("create_model: payload cannot be None")
+
+        response = await _create_model_async(
+            client=self.__client,
+            body=CreateModelBody(project_id=self.__project_id, payload=payload),
+        )
+
+        _raise_on_error(response)
+
+        return response.parsed
+
+    async def create_job(
+        self,
+        name: str,
+        session_id: str,
+        model_id: str,
+        parameters: Optional[str] = None,
+    ) -> QaaSJob:
+        if not session_id:
+            raise Exception("create_job: session_id cannot be None")
+
+        response = await _create_job_async(
+            client=self.__client,
+            body=CreateJobBody(
+                name=name,
+                session_id=session_id,
+                model_id=model_id,
+                circuit=CreateJobBodyCircuit(qiskit_circuit=None),
+                parameters=parameters,
+            ),
+        )
+
+        _raise_on_error(response)
+
+        return response.parsed
+
+    async def get_job(self, job_id: str) -> QaaSJob:
+        if not job_id:
+            raise Exception("get_job: job_id cannot be None")
+
+        response = await _get_job_async(client=self.__client, job_id=job_id)
+
+        _raise_on_error(response)
+
+        return response.parsed
+
+    async def list_jobs(self, session_id: str) -> List[QaaSJob]:
+        response = await _list_jobs_async(client=self.__client, session_id=session_id)
+
+        _raise_on_error(response)
+
+        return response.parsed.jobs
+
+    async def list_job_results(self, job_id: str) -> List[QaaSJobResult]:
+        if not job_id:
+            raise Exception("list_job_results: job_id cannot be None")
+
+        response = await _list_job_results_async(client=self.__client, job_id=job_id)
+
+        _raise_on_error(response)
+
+        return response.parsed.job_results
+
+    async def aclose(self) -> None:
+        await self.__client.get_async_httpx_client().aclose()
@@ -0,0 +1,313 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import gzip
+import importlib.util
+import random
+import threading
+import time
+import httpx
+
+from typing import Optional
+
+from qiskit_scaleway.versions import USER_AGENT
+
+_RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+_default_client: Optional[httpx.Client] = None
+_default_client_lock = threading.Lock()
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Retries idempotent requests failing with a transport error or a
+    transient status code, with an exponential backoff.
+
+    :param transport: the transport actually sending the requests
+    :param retries: maximum number of retries per request
+    :param backoff_factor: base delay in seconds, doubled on each retry
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        retries: int = 3,
+        backoff_factor: float = 0.2,
+    ):
+        self._transport = transport
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in ("GET", "HEAD"):
+            return self._transport.handle_request(request)
+
+        attempt = 0
+
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError:
+                if attempt >= self._retries:
+                    raise
+            else:
+                if (
+                    response.status_code not in _RETRY_STATUS_CODES
+                    or attempt >= self._retries
+                ):
+                    return response
+
+                response.close()
+
+            time.sleep(self._backoff_factor * (2**attempt) * random.uniform(0.5, 1))
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Asyncio counterpart of ``RetryTransport``."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int = 3,
+        backoff_factor: float = 0.2,
+    ):
+        self._transport = transport
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in ("GET", "HEAD"):
+            return await self._transport.handle_async_request(request)
+
+        attempt = 0
+
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                if attempt >= self._retries:
+                    raise
+            else:
+                if (
+                    response.status_code not in _RETRY_STATUS_CODES
+                    or attempt >= self._retries
+                ):
+                    return response
+
+                await response.aclose()
+
+            await asyncio.sleep(
+                self._backoff_factor * (2**attempt) * random.uniform(0.5, 1)
+            )
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compresses a request body with ``gzip`` or ``zstd`` (the latter needs
+    the optional ``zstandard`` package)."""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6)
+
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress(data)
+
+    raise ValueError(f"Unsupported compression: {encoding}")
+
+
+class CompressionTransport(httpx.BaseTransport):
+    """Compresses the body of the requests sent to a set of paths, when it
+    is larger than ``threshold`` bytes.
+
+    The capability is negotiated with the server on the first compressed
+    request: if it is rejected with ``400 Bad Request`` or ``415 Unsupported
+    Media Type``, it is sent again uncompressed and compression stays disabled
+    for this transport. Once a compressed request is accepted, later
+    responses are returned as is.
+
+    :param transport: the transport actually sending the requests
+    :param encoding: ``gzip`` or ``zstd``
+    :param threshold: minimum body size in bytes to compress
+    :param paths: suffixes of the request paths whose body is compressed
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        encoding: str = "gzip",
+        threshold: int = 64 * 1024,
+        paths: tuple = ("/models",),
+    ):
+        if encoding == "zstd" and importlib.util.find_spec("zstandard") is None:
+            raise ValueError("zstd compression requires the zstandard package")
+
+        self._transport = transport
+        self._encoding = encoding
+        self._threshold = threshold
+        self._paths = paths
+        self._lock = threading.Lock()
+        self._counters_lock = threading.Lock()
+        self.enabled = True
+        self.negotiated = False
+        self.bytes_sent = 0
+        self.bytes_saved = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if (
+            not self.enabled
+            or request.method != "POST"
+            or not request.url.path.endswith(self._paths)
+        ):
+            return self._transport.handle_request(request)
+
+        body = request.read()
+
+        if len(body) < self._threshold:
+            return self._transport.handle_request(request)
+
+        if self.negotiated:
+            return self._send_compressed(request, body)
+
+        # Concurrent first requests wait for the outcome of the negotiation
+        with self._lock:
+            if not self.enabled:
+                return self._transport.handle_request(request)
+
+            if self.negotiated:
+                return self._send_compressed(request, body)
+
+            response = self._send_compressed(request, body)
+
+            if response.status_code in (400, 415):
+                response.close()
+                self.enabled = False
+                return self._transport.handle_request(request)
+
+            self.negotiated = response.status_code < 400
+
+            return response
+
+    def _send_compressed(self, request: httpx.Request, body: bytes) -> httpx.Response:
+        compressed = compress(body, self._encoding)
+        headers = request.headers.copy()
+        headers["Content-Encoding"] = self._encoding
+        headers["Content-Length"] = str(len(compressed))
+
+        response = self._transport.handle_request(
+            httpx.Request(
+                request.method,
+                request.url,
+                headers=headers,
+                content=compressed,
+                extensions=request.extensions,
+            )
+        )
+
+        if response.status_code < 400:
+            with self._counters_lock:
+                self.bytes_sent += len(compressed)
+                self.bytes_saved += len(body) - len(compressed)
+
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+def create_http_client(
+    timeout: float = 30,
+    connect_timeout: float = 10,
+    max_connections: int = 32,
+    max_keepalive_connections: int = 16,
+    retries: int = 3,
+    http2: Optional[bool] = None,
+    transport: Optional[httpx.BaseTransport] = None,
+) -> httpx.Client:
+    """Creates the connection-pooled client used to download job results.
+
+    :param timeout: read, write and pool timeout in seconds
+    :param connect_timeout: connection timeout in seconds
+    :param max_connections: maximum number of concurrent connections
+    :param max_keepalive_connections: maximum number of idle connections kept
+    :param retries: number of retries on transient failures
+    :param http2: enables HTTP/2, by default only when the ``h2`` package is installed
+    :param transport: optional transport to use instead of the network one,
+        e.g. an ``httpx.MockTransport`` in tests
+    """
+    if http2 is None:
+        http2 = importlib.util.find_spec("h2") is not None
+
+    if transport is None:
+        transport = httpx.HTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    return httpx.Client(
+        transport=RetryTransport(transport, retries=retries),
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+def create_async_http_client(
+    timeout: float = 30,
+    connect_timeout: float = 10,
+    max_connections: int = 32,
+    max_keepalive_connections: int = 16,
+    retries: int = 3,
+    http2: Optional[bool] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """Asyncio counterpart of ``create_http_client``, takes the same parameters."""
+    if http2 is None:
+        http2 = importlib.util.find_spec("h2") is not None
+
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    return httpx.AsyncClient(
+        transport=AsyncRetryTransport(transport, retries=retries),
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+def default_http_client() -> httpx.Client:
+    """Returns the client shared by jobs whose provider does not own one."""
+    global _default_client
+
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = create_http_client()
+
+        return _default_client
@@ -0,0 +1,249 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+# Entry files are named after ModelCache.key()
+_ENTRY_NAME = re.compile(r"[0-9a-f]{64}")
+# Temporary files of the writers, unique to each of them
+_TMP_NAME = re.compile(r"[0-9a-f]{64}(?:\.\w+)?\.tmp")
+
+_logger = logging.getLogger(__name__)
+
+# Temporary files older than this are left over by a crashed writer
+_STALE_TMP_AGE = 60
+
+
+class ModelCache:
+    """Remembers the ID of the models already pushed to the QaaS API, keyed by
+    a hash of their serialized payload.
+
+    Submitting the same ``QuantumComputationModel`` again (same circuits,
+    backend options and noise model) then only creates a new job referencing
+    the existing model.
+
+    :param max_size: maximum number of models kept, least recently used
+        entries are evicted first, ``0`` disables the cache
+    :param max_age: number of seconds after which a model is pushed again
+    :param directory: optional directory where entries are persisted so they
+        survive process restarts, and shared with other processes. Only the
+        files named after ``key()`` are managed, other files of the directory
+        are left untouched. Writing to it is best effort: failures are logged
+        and the entry is only kept in memory
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        max_age: float = 3600,
+        directory: Optional[str] = None,
+    ):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.directory = os.path.expanduser(directory) if directory else None
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(payload: str, *scope: str) -> str:
+        """Computes the cache key of a model payload within a scope such as
+        the project and platform IDs."""
+        digest = hashlib.sha256()
+
+        for part in scope:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\0")
+
+        digest.update(payload.encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if self.max_size <= 0:
+            return None
+
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                entry = self._read(key)
+
+                if entry is not None:
+                    self._entries[key] = entry
+
+            if entry is None:
+                return None
+
+            model_id, created_at = entry
+
+            if now - created_at >= self.max_age:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+
+            return model_id
+
+    def put(self, key: str, model_id: str) -> None:
+        if self.max_size <= 0:
+            return
+
+        entry = (model_id, time.time())
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._write(key, entry)
+
+            while len(self._entries) > self.max_size:
+                oldest, _ = self._entries.popitem(last=False)
+                self._delete_file(oldest)
+
+            self._evict_files()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+            for name in self._entry_files():
+                self._delete_file(name)
+
+            self._delete_stale_tmp_files()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._delete_file(key)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def _read(self, key: str) -> Optional[Tuple[str, float]]:
+        if not self.directory:
+            return None
+
+        try:
+            with open(self._path(key), "r") as f:
+                data = json.load(f)
+
+            return data["model_id"], data["created_at"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, key: str, entry: Tuple[str, float]) -> None:
+        if not self.directory:
+            return
+
+        tmp_path = None
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.directory, prefix=f"{key}.", suffix=".tmp"
+            )
+
+            with os.fdopen(fd, "w") as f:
+                json.dump({"model_id": entry[0], "created_at": entry[1]}, f)
+
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            _logger.warning("Cannot write model cache entry %s: %s", key, e)
+
+            if tmp_path is not None:
+                self._delete_path(tmp_path)
+
+    def _delete_file(self, key: str) -> None:
+        if not self.directory:
+            return
+
+        self._delete_path(self._path(key))
+
+    @staticmethod
+    def _delete_path(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _entry_files(self) -> List[str]:
+        if not self.directory:
+            return []
+
+        return [
+            name for name in os.listdir(self.directory) if _ENTRY_NAME.fullmatch(name)
+        ]
+
+    def _delete_stale_tmp_files(self) -> None:
+        """Removes the temporary files of writes that never completed, the
+        recent ones may still be written by another process."""
+        if not self.directory:
+            return
+
+        now = time.time()
+
+        for name in os.listdir(self.directory):
+            if not _TMP_NAME.fullmatch(name):
+                continue
+
+            path = os.path.join(self.directory, name)
+
+            try:
+                if now - os.path.getmtime(path) > _STALE_TMP_AGE:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _evict_files(self) -> None:
+        if not self.directory:
+            return
+
+        try:
+            names = self._entry_files()
+        except OSError as e:
+            _logger.warning("Cannot list model cache directory: %s", e)
+            return
+
+        if len(names) <= self.max_size:
+            return
+
+        def _mtime(name: str) -> float:
+            try:
+                return os.path.getmtime(self._path(name))
+            except OSError:
+                return 0
+
+        names.sort(key=_mtime)
+
+        for name in names[: len(names) - self.max_size]:
+            self._delete_file(name)
@@ -0,0 +1,79 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import httpx
+
+from typing import Optional
+
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.api.models.create_model import (
+    sync_detailed as _create_model_sync,
+)
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.client import (
+    AuthenticatedClient,
+)
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.models import (
+    CreateModelBody,
+    ScalewayQaasV1Alpha1Model,
+)
+
+from .async_client import _DEFAULT_URL, _raise_on_error
+
+
+class ModelClient:
+    """Pushes computation models to the QaaS API through a given transport,
+    e.g. a ``CompressionTransport``.
+
+    ``QaaSClient`` does not take a transport, this client builds its own API
+    client with one and is used for ``create_model`` calls only.
+
+    :param project_id: UUID of the Scaleway Project
+    :param secret_key: authentication token of the Scaleway API
+    :param url: optional endpoint URL of the API
+    :param transport: transport sending the requests
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        secret_key: str,
+        url: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        url = url or _DEFAULT_URL
+
+        self.__project_id = project_id
+        self.__client = AuthenticatedClient(
+            base_url=url,
+            timeout=10.0,
+            verify_ssl="https" in url,
+            token=secret_key,
+            prefix=None,
+            auth_header_name="X-Auth-Token",
+            httpx_args={"transport": transport} if transport else {},
+        )
+
+    def __repr__(self) -> str:
+        return f"<ModelClient(project_id={self.__project_id})>"
+
+    def create_model(self, payload: str) -> ScalewayQaasV1Alpha1Model:
+        if not payload:
+            raise Exception("create_model: payload cannot be None")
+
+        response = _create_model_sync(
+            client=self.__client,
+            body=CreateModelBody(project_id=self.__project_id, payload=payload),
+        )
+
+        _raise_on_error(response)
+
+        return response.parsed
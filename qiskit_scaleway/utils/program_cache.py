@@ -0,0 +1,264 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import threading
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Clbit, ClassicalRegister
+from qiskit.circuit.classical import expr
+from qiskit.circuit.library import get_standard_gate_name_mapping
+
+from qio.core import QuantumProgram
+
+_STANDARD_GATE_NAMES = frozenset(get_standard_gate_name_mapping().keys())
+
+# Serialized operation state held outside of ``params``: control-flow
+# conditions and targets, delay units, control states and classical stores
+_OPERATION_ATTRIBUTES = (
+    "condition",
+    "target",
+    "unit",
+    "ctrl_state",
+    "lvalue",
+    "rvalue",
+)
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> str:
+    """Computes a hash of everything that ends up in the serialized circuit:
+    registers, global phase and every instruction with its parameters and
+    operands, including control-flow conditions and register membership.
+    Custom gates are fingerprinted through their definition."""
+    digest = hashlib.sha256()
+    _update_fingerprint(digest, circuit)
+
+    return digest.hexdigest()
+
+
+def _update_fingerprint(digest, circuit: QuantumCircuit) -> None:
+    qubit_indices = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    clbit_indices = {clbit: i for i, clbit in enumerate(circuit.clbits)}
+
+    header = [
+        circuit.num_qubits,
+        circuit.num_clbits,
+        [(reg.name, [qubit_indices[q] for q in reg]) for reg in circuit.qregs],
+        [(reg.name, [clbit_indices[c] for c in reg]) for reg in circuit.cregs],
+        [_describe(var, clbit_indices) for var in circuit.iter_input_vars()],
+        [_describe(var, clbit_indices) for var in circuit.iter_declared_vars()],
+        str(circuit.global_phase),
+    ]
+    digest.update(repr(header).encode("utf-8"))
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+
+        digest.update(
+            repr(
+                (
+                    operation.name,
+                    operation.num_qubits,
+                    operation.num_clbits,
+                    tuple(qubit_indices[q] for q in instruction.qubits),
+                    tuple(clbit_indices[c] for c in instruction.clbits),
+                )
+            ).encode("utf-8")
+        )
+
+        attributes = [
+            (name, _describe(getattr(operation, name), clbit_indices))
+            for name in _OPERATION_ATTRIBUTES
+            if hasattr(operation, name)
+        ]
+
+        if operation.name == "switch_case":
+            attributes.append(
+                ("cases", [repr(values) for values, _ in operation.cases_specifier()])
+            )
+
+        digest.update(repr(attributes).encode("utf-8"))
+
+        for param in operation.params:
+            if isinstance(param, QuantumCircuit):
+                _update_fingerprint(digest, param)
+            else:
+                digest.update(repr(param).encode("utf-8"))
+
+        if operation.name not in _STANDARD_GATE_NAMES:
+            definition = getattr(operation, "definition", None)
+
+            if definition is not None:
+                _update_fingerprint(digest, definition)
+
+
+def _describe(value, clbit_indices: Dict[Clbit, int]):
+    """Deterministic description of an operation attribute, with bits given by
+    their index in the circuit."""
+    if isinstance(value, Clbit):
+        return ("clbit", clbit_indices.get(value))
+
+    if isinstance(value, ClassicalRegister):
+        return ("creg", value.name, [clbit_indices.get(c) for c in value])
+
+    if isinstance(value, expr.Expr):
+        return value.accept(_ExprDescriber(clbit_indices))
+
+    if isinstance(value, (tuple, list)):
+        return tuple(_describe(v, clbit_indices) for v in value)
+
+    return repr(value)
+
+
+class _ExprDescriber(expr.ExprVisitor):
+    def __init__(self, clbit_indices: Dict[Clbit, int]):
+        self._clbit_indices = clbit_indices
+
+    def _describe(self, value):
+        return _describe(value, self._clbit_indices)
+
+    def visit_var(self, node, /):
+        return ("var", self._describe(node.var), node.name, repr(node.type))
+
+    def visit_stretch(self, node, /):
+        return ("stretch", repr(node.var), node.name)
+
+    def visit_value(self, node, /):
+        return ("value", repr(node.value), repr(node.type))
+
+    def visit_unary(self, node, /):
+        return ("unary", repr(node.op), node.operand.accept(self), repr(node.type))
+
+    def visit_binary(self, node, /):
+        return (
+            "binary",
+            repr(node.op),
+            node.left.accept(self),
+            node.right.accept(self),
+            repr(node.type),
+        )
+
+    def visit_cast(self, node, /):
+        return ("cast", node.operand.accept(self), repr(node.type), node.implicit)
+
+    def visit_index(self, node, /):
+        return ("index", node.target.accept(self), node.index.accept(self))
+
+
+class ProgramCache:
+    """LRU cache of the ``QuantumProgram`` built from qiskit circuits, keyed by
+    the circuit fingerprint and the serialization settings.
+
+    :param max_size: maximum number of programs kept, ``0`` disables the cache
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._programs: "OrderedDict[Hashable, QuantumProgram]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(
+        self,
+        circuit: QuantumCircuit,
+        serialization_key: Hashable,
+        create: Callable[[QuantumCircuit], QuantumProgram],
+    ) -> QuantumProgram:
+        if self.max_size <= 0:
+            return create(circuit)
+
+        key = (circuit_fingerprint(circuit), serialization_key)
+
+        with self._lock:
+            program = self._programs.get(key)
+
+            if program is not None:
+                self._programs.move_to_end(key)
+                self.hits += 1
+                return program
+
+            self.misses += 1
+
+        program = create(circuit)
+
+        with self._lock:
+            self._programs[key] = program
+
+            while len(self._programs) > self.max_size:
+                self._programs.popitem(last=False)
+
+        return program
+
+    def get_or_create_many(
+        self,
+        circuits: List[QuantumCircuit],
+        serialization_key: Hashable,
+        create_many: Callable[[List[QuantumCircuit]], List[QuantumProgram]],
+    ) -> List[QuantumProgram]:
+        """Same as ``get_or_create`` for a batch: only the missing circuits are
+        given to ``create_many``, which must return their programs in order."""
+        if self.max_size <= 0:
+            return create_many(circuits)
+
+        keys = [(circuit_fingerprint(c), serialization_key) for c in circuits]
+        programs: List[Optional[QuantumProgram]] = []
+
+        with self._lock:
+            for key in keys:
+                program = self._programs.get(key)
+
+                if program is not None:
+                    self._programs.move_to_end(key)
+                    self.hits += 1
+                else:
+                    self.misses += 1
+
+                programs.append(program)
+
+        missing = [i for i, program in enumerate(programs) if program is None]
+
+        # Identical circuits within the batch are only serialized once
+        unique: Dict[Hashable, int] = {}
+        for i in missing:
+            unique.setdefault(keys[i], i)
+
+        created = create_many([circuits[i] for i in unique.values()])
+        by_key = dict(zip(unique.keys(), created))
+
+        for i in missing:
+            programs[i] = by_key[keys[i]]
+
+        with self._lock:
+            for key, program in by_key.items():
+                self._programs[key] = program
+
+            while len(self._programs) > self.max_size:
+                self._programs.popitem(last=False)
+
+        return programs
+
+    def clear(self) -> None:
+        with self._lock:
+            self._programs.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._programs)
+
+    def __repr__(self) -> str:
+        return f"<ProgramCache(size={len(self)},max_size={self.max_size},hits={self.hits},misses={self.misses})>"
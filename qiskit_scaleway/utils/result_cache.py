@@ -0,0 +1,188 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from typing import Dict, Optional
+
+# Entry files are named after the SHA-256 of the job ID
+_ENTRY_NAME = re.compile(r"[0-9a-f]{64}\.json\.gz")
+# Temporary files of the writers, unique to each of them
+_TMP_NAME = re.compile(r"[0-9a-f]{64}\.json\.gz(?:\.\w+)?\.tmp")
+
+_logger = logging.getLogger(__name__)
+
+# Temporary files older than this are left over by a crashed writer
+_STALE_TMP_AGE = 60
+
+
+class ResultCache:
+    """Directory store of the results of finished jobs, keyed by job ID.
+
+    Each entry holds the job results with their program result inlined, along
+    with what is needed to rebuild the job (name, session and platform IDs).
+    Entries are gzip-compressed JSON files. When the directory grows over
+    ``max_bytes``, the least recently read or written entries are removed.
+    Only the entry files are managed, other files of the directory are left
+    untouched. The directory may be shared with other processes, writing to it
+    is best effort: failures are logged and the entry is not stored.
+
+    :param directory: directory where the entries are stored
+    :param max_bytes: maximum total size of the stored entries
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1024**3):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        path = self._path(job_id)
+
+        with self._lock:
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+
+            try:
+                # Mark the entry as recently used
+                os.utime(path)
+            except OSError:
+                pass
+
+        return entry
+
+    def put(self, job_id: str, entry: Dict) -> None:
+        if self.max_bytes <= 0:
+            return
+
+        path = self._path(job_id)
+        tmp_path = None
+
+        with self._lock:
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.directory,
+                    prefix=f"{os.path.basename(path)}.",
+                    suffix=".tmp",
+                )
+
+                with os.fdopen(fd, "wb") as raw, gzip.open(
+                    raw, "wt", encoding="utf-8"
+                ) as f:
+                    json.dump(entry, f)
+
+                os.replace(tmp_path, path)
+
+                self._evict_files()
+            except OSError as e:
+                _logger.warning("Cannot write result cache entry %s: %s", job_id, e)
+
+                if tmp_path is not None:
+                    self._delete_file(tmp_path)
+
+    def invalidate(self, job_id: str) -> None:
+        with self._lock:
+            self._delete_file(self._path(job_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            for path, _, _ in self._files():
+                self._delete_file(path)
+
+            self._delete_stale_tmp_files()
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the stored entries."""
+        return sum(size for _, _, size in self._files())
+
+    def __len__(self) -> int:
+        return len(self._files())
+
+    def __repr__(self) -> str:
+        return f"<ResultCache(directory={self.directory},entries={len(self)},max_bytes={self.max_bytes})>"
+
+    def _path(self, job_id: str) -> str:
+        name = hashlib.sha256(job_id.encode("utf-8")).hexdigest()
+
+        return os.path.join(self.directory, f"{name}.json.gz")
+
+    def _files(self):
+        files = []
+
+        for name in os.listdir(self.directory):
+            if not _ENTRY_NAME.fullmatch(name):
+                continue
+
+            path = os.path.join(self.directory, name)
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            files.append((path, stat.st_mtime, stat.st_size))
+
+        return files
+
+    def _delete_stale_tmp_files(self) -> None:
+        """Removes the temporary files of writes that never completed, the
+        recent ones may still be written by another process."""
+        now = time.time()
+
+        for name in os.listdir(self.directory):
+            if not _TMP_NAME.fullmatch(name):
+                continue
+
+            path = os.path.join(self.directory, name)
+
+            try:
+                if now - os.path.getmtime(path) > _STALE_TMP_AGE:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _delete_file(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict_files(self) -> None:
+        files = self._files()
+        total = sum(size for _, _, size in files)
+
+        if total <= self.max_bytes:
+            return
+
+        files.sort(key=lambda file: file[1])
+
+        for path, _, size in files:
+            if total <= self.max_bytes:
+                break
+
+            self._delete_file(path)
+            total -= size
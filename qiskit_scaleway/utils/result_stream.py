@@ -0,0 +1,519 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import base64
+import json
+import re
+import zlib
+import numpy as np
+
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from qiskit.result import Result
+
+from qio.core import (
+    QuantumProgramResult,
+    QuantumProgramResultCompressionFormat,
+    QuantumProgramResultSerializationFormat,
+)
+
+# Longest prefix of a JSON string body made of complete characters and escapes
+_STRING_BODY = re.compile(rb'(?:[^"\\]+|\\u[0-9a-fA-F]{4}|\\[^u])*')
+_SERIALIZATION_KEY = re.compile(rb'[{,]\s*"serialization"\s*:\s*"')
+_KEY_LOOKBEHIND = 128
+# One JSON token of the containers leading to the experiment data
+_TOKEN = re.compile(
+    rb'\s*+(?:"(?:[^"\\]++|\\.)*+"|[{}\[\],:]|[^"{}\[\],:\s]++)'
+)
+# Content of a container to skip, up to its next bracket
+_SKIPPED = re.compile(rb'(?:[^"{}\[\]]++|"(?:[^"\\]++|\\.)*+")*+')
+# Placeholder of a MemoryArray when serializing a result dict, as dumped
+_MEMORY_PLACEHOLDER = "\0MemoryArray\0"
+_DUMPED_PLACEHOLDER = json.dumps(_MEMORY_PLACEHOLDER)
+# Shots formatted at once when serializing a MemoryArray
+_JSON_BATCH = 65536
+
+
+class MemoryArray(Sequence):
+    """Per-shot memory backed by a compact NumPy array of integers.
+
+    It behaves like the list of hex (or binary) strings qiskit expects, the
+    strings are only built when items are accessed. ``array`` gives direct
+    access to the integer outcomes.
+    """
+
+    def __init__(self, array: np.ndarray, base: int = 16, width: int = 0):
+        self.array = array
+        self.base = base
+        self.width = width
+
+    def _format(self, value) -> str:
+        if self.base == 2:
+            return format(int(value), f"0{self.width}b")
+
+        return hex(int(value))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._format(v) for v in self.array[index]]
+
+        return self._format(self.array[index])
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __iter__(self):
+        return (self._format(v) for v in self.array)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.array if dtype is None else self.array.astype(dtype)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"<MemoryArray(shots={len(self)},base={self.base})>"
+
+    def to_json(self) -> str:
+        """The JSON list of the memory strings, formatted by batches of shots
+        rather than as one Python string per shot."""
+        fmt = f"{{:0{self.width}b}}".format if self.base == 2 else hex
+
+        batches = [
+            '","'.join(map(fmt, self.array[start : start + _JSON_BATCH].tolist()))
+            for start in range(0, len(self.array), _JSON_BATCH)
+        ]
+
+        return '["' + '","'.join(batches) + '"]' if batches else "[]"
+
+
+class _MemoryBuffer:
+    def __init__(self):
+        self._array = np.empty(1024, dtype=np.uint64)
+        self._size = 0
+        self.base = 16
+        self.width = 0
+
+    def extend(self, region: bytes) -> None:
+        tokens = [t for t in region.translate(None, b'" \t\r\n').split(b",") if t]
+
+        if not tokens:
+            return
+
+        if self._size == 0 and not tokens[0].startswith(b"0x"):
+            self.base = 2
+            self.width = len(tokens[0])
+
+        try:
+            values = np.fromiter(
+                (int(t, self.base) for t in tokens),
+                dtype=self._array.dtype,
+                count=len(tokens),
+            )
+        except OverflowError:
+            # Registers wider than 64 bits fall back to Python integers
+            self._array = self._array.astype(object)
+            values = np.array([int(t, self.base) for t in tokens], dtype=object)
+
+        needed = self._size + len(values)
+
+        if needed > len(self._array):
+            grown = np.empty(max(needed, 2 * len(self._array)), self._array.dtype)
+            grown[: self._size] = self._array[: self._size]
+            self._array = grown
+
+        self._array[self._size : needed] = values
+        self._size = needed
+
+    def to_memory(self) -> MemoryArray:
+        return MemoryArray(self._array[: self._size].copy(), self.base, self.width)
+
+
+def _split_envelope(
+    chunks: Iterable[bytes], envelope: List[bytes]
+) -> Iterator[bytes]:
+    """Yields the escaped body of the ``serialization`` string of a
+    ``QuantumProgramResult`` document, the rest of the document is appended to
+    ``envelope`` with an empty ``serialization``."""
+    chunks = iter(chunks)
+    buf = b""
+
+    for chunk in chunks:
+        buf += chunk
+        match = _SERIALIZATION_KEY.search(buf)
+
+        if match:
+            envelope.append(buf[: match.end()] + b'"')
+            buf = buf[match.end() :]
+            break
+
+        keep = max(0, len(buf) - _KEY_LOOKBEHIND)
+        envelope.append(buf[:keep])
+        buf = buf[keep:]
+    else:
+        envelope.append(buf)
+        return
+
+    while True:
+        end = _STRING_BODY.match(buf).end()
+
+        if end < len(buf) and buf[end : end + 1] == b'"':
+            if end:
+                yield buf[:end]
+
+            envelope.append(buf[end + 1 :])
+            break
+
+        if end:
+            yield buf[:end]
+
+        buf = buf[end:]
+        chunk = next(chunks, None)
+
+        if chunk is None:
+            raise ValueError("Truncated result payload")
+
+        buf += chunk
+
+    envelope.extend(chunks)
+
+
+def _unescape(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    for chunk in chunks:
+        if b"\\" in chunk:
+            chunk = json.loads(b'"' + chunk + b'"').encode("utf-8", "surrogatepass")
+
+        yield chunk
+
+
+def _decompress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decodes a zlib+base64 stream, plain JSON streams are passed through."""
+    chunks = iter(chunks)
+    first = b""
+
+    for chunk in chunks:
+        first += chunk.lstrip()
+
+        if first:
+            break
+
+    if not first:
+        return
+
+    if first[:1] in (b"{", b"["):
+        yield first
+        yield from chunks
+        return
+
+    decompressor = zlib.decompressobj()
+    carry = b""
+
+    def _base64_chunks():
+        yield first
+        yield from chunks
+
+    for chunk in _base64_chunks():
+        data = carry + chunk.translate(None, b" \t\r\n")
+        usable = len(data) - len(data) % 4
+        carry = data[usable:]
+
+        if usable:
+            yield decompressor.decompress(base64.b64decode(data[:usable]))
+
+    if carry:
+        yield decompressor.decompress(base64.b64decode(carry))
+
+    yield decompressor.flush()
+
+
+def _extract_memory(
+    chunks: Iterable[bytes], buffers: List[_MemoryBuffer]
+) -> bytes:
+    """Returns the JSON document with the level 2 memory lists (lists of hex
+    or binary strings) of the experiments emptied, the lists being decoded
+    into ``buffers`` in document order.
+
+    Only ``results[*].data.memory`` is extracted: the document is tokenized
+    down to the experiment data, other containers (counts, headers, user
+    metadata...) are skipped as a whole.
+    """
+    chunks = iter(chunks)
+    skeleton = []
+    buf = b""
+    pos = 0
+    # Labels of the open containers leading to the experiment data
+    path: List[str] = []
+    key = None
+    expect_key = False
+    # Depth of the container being skipped, 0 when tokenizing
+    skipped = 0
+    memory = None
+    done = False
+
+    def _open(bracket: bytes) -> Optional[str]:
+        top = path[-1] if path else None
+
+        if top is None:
+            return "root"
+        if top == "root" and key == b'"results"' and bracket == b"[":
+            return "results"
+        if top == "results" and bracket == b"{":
+            return "experiment"
+        if top == "experiment" and key == b'"data"' and bracket == b"{":
+            return "data"
+        if top == "data" and key == b'"memory"' and bracket == b"[":
+            return "memory"
+
+        return None
+
+    while True:
+        chunk = next(chunks, None)
+
+        if chunk is None:
+            done = True
+        else:
+            buf = buf[pos:] + chunk
+            pos = 0
+
+        while not (done and pos >= len(buf)):
+            if memory is not None:
+                end = buf.find(b"]", pos)
+
+                if end == -1:
+                    last = buf.rfind(b",", pos)
+
+                    if last != -1:
+                        memory.extend(buf[pos:last])
+                        pos = last + 1
+
+                    if done:
+                        raise ValueError("Truncated result payload")
+                    break
+
+                memory.extend(buf[pos:end])
+                skeleton.append(b"]")
+                pos = end + 1
+                memory = None
+                continue
+
+            if skipped:
+                end = _SKIPPED.match(buf, pos).end()
+                skeleton.append(buf[pos:end])
+                pos = end
+
+                if pos >= len(buf) or buf[pos : pos + 1] == b'"':
+                    # Need more data, possibly to complete a string
+                    if done:
+                        raise ValueError("Truncated result payload")
+                    break
+
+                skeleton.append(buf[pos : pos + 1])
+                skipped += 1 if buf[pos : pos + 1] in b"{[" else -1
+                pos += 1
+                continue
+
+            match = _TOKEN.match(buf, pos)
+
+            if match is None or (match.end() == len(buf) and not done):
+                # A token may go on in the next chunk
+                if match is None and done and buf[pos:].strip():
+                    raise ValueError("Truncated result payload")
+                if done:
+                    skeleton.append(buf[pos:])
+                    pos = len(buf)
+                break
+
+            token = match.group().lstrip()
+            skeleton.append(match.group())
+            pos = match.end()
+
+            if not path and token not in (b"{", b"["):
+                continue
+
+            if token in (b"{", b"["):
+                label = _open(token)
+
+                if label == "memory":
+                    rest = buf[pos:].lstrip()
+
+                    if not rest and not done:
+                        # Peek the first item in the next chunk
+                        skeleton.pop()
+                        pos = match.start()
+                        break
+
+                    if rest[:1] in (b'"', b"]"):
+                        memory = _MemoryBuffer()
+                        buffers.append(memory)
+                        continue
+
+                    # Level 1 memory, a list of lists
+                    label = None
+
+                if label is None:
+                    skipped = 1
+                else:
+                    path.append(label)
+                    expect_key = token == b"{"
+
+                key = None
+            elif token in (b"}", b"]"):
+                path.pop()
+                key = None
+                expect_key = False
+            elif token == b",":
+                expect_key = bool(path) and path[-1] != "results"
+            elif token == b":":
+                expect_key = False
+            elif expect_key:
+                key = token
+
+        if done:
+            break
+
+    if memory is not None or skipped or path:
+        raise ValueError("Truncated result payload")
+
+    return b"".join(skeleton)
+
+
+def _assign_memory(result_dict: Dict, memories: Iterator[MemoryArray]) -> None:
+    """Puts the decoded memories back in ``results[*].data.memory``, in the
+    order ``_extract_memory`` found them."""
+    results = result_dict.get("results")
+
+    if not isinstance(results, list):
+        return
+
+    for experiment in results:
+        data = experiment.get("data") if isinstance(experiment, dict) else None
+
+        if isinstance(data, dict) and data.get("memory") == []:
+            data["memory"] = next(memories)
+
+
+class StreamedProgramResult:
+    """A qiskit program result decoded from a stream, whose level 2 memory is
+    held in ``MemoryArray`` buffers instead of lists of strings."""
+
+    def __init__(self, result_dict: Dict):
+        self.result_dict = result_dict
+
+    def to_qiskit_result(self, **kwargs) -> Result:
+        from qio.utils.conversion.program_result.dict_to_qiskit import (
+            convert as dict_to_qiskit_convert,
+        )
+
+        return dict_to_qiskit_convert(self.result_dict, **kwargs)
+
+    def to_program_result(self) -> QuantumProgramResult:
+        """Serializes the result back to a regular, uncompressed program result."""
+        return _to_program_result(
+            QuantumProgramResultSerializationFormat.QISKIT_RESULT_JSON_V1,
+            self.result_dict,
+        )
+
+
+def _to_program_result(
+    serialization_format: QuantumProgramResultSerializationFormat, result_dict: Dict
+) -> QuantumProgramResult:
+    memories = []
+
+    def _default(value):
+        if isinstance(value, MemoryArray):
+            # Spliced in afterwards, without a list of strings
+            memories.append(value)
+            return _MEMORY_PLACEHOLDER
+        raise TypeError(f"Object of type {type(value)} is not JSON serializable")
+
+    def _list_default(value):
+        if isinstance(value, MemoryArray):
+            return list(value)
+        raise TypeError(f"Object of type {type(value)} is not JSON serializable")
+
+    parts = json.dumps(result_dict, default=_default).split(_DUMPED_PLACEHOLDER)
+
+    if len(parts) == len(memories) + 1:
+        texts = [parts[0]]
+
+        for memory, part in zip(memories, parts[1:]):
+            texts.extend((memory.to_json(), part))
+
+        serialization = "".join(texts)
+    else:
+        # The placeholder shows up in the result itself
+        serialization = json.dumps(result_dict, default=_list_default)
+
+    return QuantumProgramResult(
+        compression_format=QuantumProgramResultCompressionFormat.NONE,
+        serialization_format=serialization_format,
+        serialization=serialization,
+    )
+
+
+def decode_result_stream(
+    chunks: Iterable[bytes],
+) -> Union[StreamedProgramResult, QuantumProgramResult]:
+    """Incrementally decodes a serialized ``QuantumProgramResult`` read from
+    ``chunks`` (e.g. ``httpx.Response.iter_bytes()``).
+
+    The payload is unescaped, base64 decoded and decompressed on the fly, and
+    level 2 memory lists are written straight into NumPy buffers, so neither
+    the whole text payload nor the per-shot strings are held in memory.
+    """
+    chunks = iter(chunks)
+    head = b""
+
+    for chunk in chunks:
+        head += chunk
+
+        if head.lstrip():
+            break
+
+    if head.lstrip()[:1] == b'"':
+        # Double encoded document, fall back to the regular decoder
+        text = b"".join([head, *chunks]).decode("utf-8")
+        return QuantumProgramResult.from_json_str(text)
+
+    def _all_chunks():
+        yield head
+        yield from chunks
+
+    envelope: List[bytes] = []
+    buffers: List[_MemoryBuffer] = []
+
+    serialization = _decompress(_unescape(_split_envelope(_all_chunks(), envelope)))
+    skeleton = _extract_memory(serialization, buffers)
+
+    data = json.loads(b"".join(envelope))
+
+    if not skeleton.strip():
+        # No serialization field or an empty one
+        return QuantumProgramResult.from_json_dict(data)
+
+    result_dict = json.loads(skeleton)
+    _assign_memory(result_dict, (b.to_memory() for b in buffers))
+
+    serialization_format = QuantumProgramResultSerializationFormat(
+        data["serialization_format"]
+    )
+
+    if (
+        serialization_format
+        != QuantumProgramResultSerializationFormat.QISKIT_RESULT_JSON_V1
+    ):
+        # Other SDK conversions need the regular program result
+        return _to_program_result(serialization_format, result_dict)
+
+    return StreamedProgramResult(result_dict)
@@ -0,0 +1,198 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import itertools
+import threading
+import time
+
+import pytest
+
+from qiskit import transpile
+from qiskit_aer import AerSimulator
+from qio.core import (
+    QuantumComputationModel,
+    QuantumComputationParameters,
+    QuantumProgramResult,
+)
+from scaleway_qaas_client.v1alpha1 import QaaSJob, QaaSJobResult, QaaSPlatform
+from scaleway_qaas_client.v1alpha1.quantum_as_a_service_api_client.models import (
+    ScalewayQaasV1Alpha1Model,
+    ScalewayQaasV1Alpha1Session,
+)
+
+import qiskit_scaleway.provider
+
+from qiskit_scaleway import ScalewayProvider
+
+
+class FakeQaaSClient:
+    """In-memory QaaS API exposing one Aer platform, jobs complete after
+    ``run_delay`` seconds and are simulated with Aer when their results are
+    listed."""
+
+    def __init__(self, run_delay: float = 0.1, max_circuits: int = 10):
+        self.run_delay = run_delay
+        self.calls = []
+        self.models = {}
+        self.jobs = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self.platform = QaaSPlatform(
+            id="platform-0",
+            version="1.0",
+            name="EMU-AER-16C-128M",
+            provider_name="aer",
+            backend_name="aer",
+            max_qubit_count=20,
+            max_shot_count=100000,
+            max_circuit_count=max_circuits,
+            availability="available",
+            description="Fake Aer platform",
+        )
+
+    def count(self, call: str) -> int:
+        return sum(1 for name, _ in self.calls if name == call)
+
+    def _log(self, call: str, **kwargs):
+        with self._lock:
+            self.calls.append((call, kwargs))
+            return next(self._ids)
+
+    def list_platforms(self, name=None):
+        self._log("list_platforms", name=name)
+        return [self.platform]
+
+    def create_session(self, **kwargs):
+        return ScalewayQaasV1Alpha1Session(
+            id=f"session-{self._log('create_session', **kwargs)}"
+        )
+
+    def terminate_session(self, session_id):
+        self._log("terminate_session", session_id=session_id)
+
+    def delete_session(self, session_id):
+        self._log("delete_session", session_id=session_id)
+
+    def create_model(self, payload):
+        model_id = f"model-{self._log('create_model')}"
+        self.models[model_id] = payload
+        return ScalewayQaasV1Alpha1Model(id=model_id)
+
+    def create_job(self, name, session_id, model_id, parameters):
+        job_id = f"job-{self._log('create_job', model_id=model_id)}"
+        self.jobs[job_id] = dict(
+            name=name,
+            session_id=session_id,
+            model_id=model_id,
+            parameters=parameters,
+            created_at=time.monotonic(),
+        )
+        return QaaSJob(id=job_id, session_id=session_id, status="waiting")
+
+    def cancel_job(self, job_id):
+        self._log("cancel_job", job_id=job_id)
+        self.jobs[job_id]["cancelled"] = True
+
+    def get_job(self, job_id):
+        self._log("get_job", job_id=job_id)
+        job = self.jobs[job_id]
+        done = time.monotonic() - job["created_at"] > self.run_delay
+        status = "completed" if done else "running"
+
+        return QaaSJob(
+            id=job_id,
+            name=job["name"],
+            session_id=job["session_id"],
+            model_id=job["model_id"],
+            parameters=job["parameters"],
+            status="cancelled" if job.get("cancelled") else status,
+            progress_message=None,
+        )
+
+    def list_jobs(self, session_id):
+        return [
+            self.get_job(job_id)
+            for job_id, job in list(self.jobs.items())
+            if job["session_id"] == session_id
+        ]
+
+    def list_job_results(self, job_id):
+        self._log("list_job_results", job_id=job_id)
+        job = self.jobs[job_id]
+        model = QuantumComputationModel.from_json_str(self.models[job["model_id"]])
+        params = QuantumComputationParameters.from_json_str(job["parameters"])
+        options = model.backend.options or {}
+
+        circuits = [program.to_qiskit_circuit() for program in model.programs]
+        run_options = {}
+
+        if options.get("parameter_binds"):
+            run_options["parameter_binds"] = [
+                {param: table[param.name] for param in circuit.parameters}
+                for circuit, table in zip(circuits, options["parameter_binds"])
+            ]
+
+        simulator = AerSimulator()
+        result = simulator.run(
+            transpile(circuits, simulator),
+            shots=params.shots,
+            memory=(params.options or {}).get("memory", False),
+            seed_simulator=options.get("seed_simulator"),
+            **run_options,
+        ).result()
+
+        return [
+            QaaSJobResult(
+                job_id=job_id,
+                result=QuantumProgramResult.from_qiskit_result(result).to_json_str(),
+                url=None,
+                created_at=None,
+            )
+        ]
+
+
+class FakeAsyncQaaSClient:
+    """Asyncio view of a ``FakeQaaSClient``."""
+
+    def __init__(self, client: FakeQaaSClient):
+        self._client = client
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        async def _call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return _call
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def fake_client() -> FakeQaaSClient:
+    return FakeQaaSClient()
+
+
+@pytest.fixture
+def fake_provider(monkeypatch, fake_client) -> ScalewayProvider:
+    monkeypatch.setattr(
+        qiskit_scaleway.provider, "QaaSClient", lambda **kwargs: fake_client
+    )
+    monkeypatch.setattr(
+        qiskit_scaleway.provider,
+        "AsyncQaaSClient",
+        lambda **kwargs: FakeAsyncQaaSClient(fake_client),
+    )
+
+    return ScalewayProvider(project_id="project", secret_key="secret")
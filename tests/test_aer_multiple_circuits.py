@@ -64,6 +64,49 @@ def test_aer_multiple_circuits():
         backend.delete_session(session_id)
 
 
+def test_aer_split_circuits_in_several_jobs():
+    provider = ScalewayProvider(
+        project_id=os.environ["QISKIT_SCALEWAY_PROJECT_ID"],
+        secret_key=os.environ["QISKIT_SCALEWAY_SECRET_KEY"],
+        url=os.getenv("QISKIT_SCALEWAY_API_URL"),
+    )
+
+    backend = provider.get_backend(
+        os.getenv("QISKIT_SCALEWAY_BACKEND_NAME", "EMU-AER-16C-128M")
+    )
+
+    assert backend is not None
+
+    session_id = backend.start_session(
+        name="my-aer-session-autotest",
+        deduplication_id=f"my-aer-session-autotest-{random.randint(1, 1000)}",
+        max_duration="15m",
+    )
+
+    assert session_id is not None
+
+    try:
+        circuits = [random_square_qiskit_circuit(5) for _ in range(6)]
+
+        job = backend.run(
+            circuits,
+            shots=100,
+            session_id=session_id,
+            max_payload_bytes=1,
+        )
+
+        assert len(job.jobs) == len(circuits)
+
+        run_result = job.result()
+
+        assert len(run_result.results) == len(circuits)
+
+        for result in run_result.results:
+            assert result.success
+    finally:
+        backend.delete_session(session_id)
+
+
 def _get_noise_model():
     import qiskit_aer.noise as noise
 
@@ -0,0 +1,211 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import copy
+
+import pytest
+
+from qiskit import QuantumCircuit
+
+from qiskit_scaleway.backends import CompositeJob, merge_results
+from qiskit_scaleway.backends.coalescer import CoalescedJob
+from qiskit_scaleway.backends.result_memo import MemoizedJob
+
+
+def _circuit(value: int) -> QuantumCircuit:
+    qc = QuantumCircuit(3)
+
+    for qubit in range(3):
+        if value >> qubit & 1:
+            qc.x(qubit)
+
+    qc.measure_all()
+
+    return qc
+
+
+def _backend(fake_provider, fake_client, max_circuits: int):
+    fake_client.platform = copy.copy(fake_client.platform)
+    fake_client.platform.max_circuit_count = max_circuits
+
+    return fake_provider.get_backend()
+
+
+def _failing_create_job(monkeypatch, fake_client, failing: int):
+    create_job = fake_client.create_job
+    calls = []
+
+    def _create_job(**kwargs):
+        calls.append(kwargs)
+
+        if len(calls) == failing:
+            raise Exception("error 400: invalid parameters")
+
+        return create_job(**kwargs)
+
+    monkeypatch.setattr(fake_client, "create_job", _create_job)
+
+
+def test_split_circuits(fake_provider, fake_client):
+    backend = _backend(fake_provider, fake_client, max_circuits=3)
+    circuits = [_circuit(i) for i in range(8)]
+
+    def _split(**kwargs):
+        batches = backend._split_circuits(circuits, backend.job_cls, **kwargs)
+        # Splitting never reorders the circuits
+        assert [circuit for batch in batches for circuit in batch] == circuits
+
+        return [len(batch) for batch in batches]
+
+    assert _split() == [3, 3, 2]
+    # The lowest of the platform and backend limits applies
+    assert _split(max_circuits=5) == [3, 3, 2]
+    assert _split(max_circuits=2) == [2, 2, 2, 2]
+
+    sizes = [
+        len(backend.job_cls._to_quantum_program(circuit).serialization)
+        for circuit in circuits
+    ]
+    assert max(_split(max_payload_bytes=sizes[0] + sizes[1])) <= 2
+    # A circuit over the budget still gets a job of its own
+    assert _split(max_payload_bytes=1) == [1] * 8
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_composite_job_result_order(fake_provider, fake_client, use_async):
+    backend = _backend(fake_provider, fake_client, max_circuits=3)
+    circuits = [_circuit(i) for i in range(8)]
+
+    if use_async:
+
+        async def _run():
+            job = await backend.arun(circuits, shots=10)
+            return job, await job.aresult()
+
+        job, result = asyncio.run(_run())
+    else:
+        job = backend.run(circuits, shots=10)
+        result = job.result()
+
+    assert isinstance(job, CompositeJob)
+    assert len(job.jobs) == 3
+    assert job.job_id() == ",".join(sub_job.job_id() for sub_job in job.jobs)
+    assert result.job_id == job.job_id()
+    assert [result.get_counts(i) for i in range(8)] == [
+        {format(i, "03b"): 10} for i in range(8)
+    ]
+
+
+def test_merge_results(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+    results = [backend.run(_circuit(i), shots=10).result() for i in range(3)]
+
+    # Nested lists are flattened, the experiments keep their order
+    merged = merge_results([results[0], results[1:]], job_id="job-a,job-b")
+
+    assert merged.job_id == "job-a,job-b"
+    assert merged.success
+    assert [merged.get_counts(i) for i in range(3)] == [
+        {format(i, "03b"): 10} for i in range(3)
+    ]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_partly_submitted_runs_are_cancelled(
+    monkeypatch, fake_provider, fake_client, use_async
+):
+    backend = _backend(fake_provider, fake_client, max_circuits=2)
+    circuits = [_circuit(i) for i in range(8)]
+    _failing_create_job(monkeypatch, fake_client, failing=2)
+
+    with pytest.raises(Exception, match="error 400"):
+        if use_async:
+            asyncio.run(backend.arun(circuits, shots=10))
+        else:
+            backend.run(circuits, shots=10)
+
+    # No job of the failed run is left running without a handle
+    assert len(fake_client.jobs) == 3
+    assert fake_client.count("cancel_job") == 3
+    assert all(job["cancelled"] for job in fake_client.jobs.values())
+
+
+@pytest.mark.parametrize("backend_name", ["qsim", "cudaq", "qperfect", "quobly"])
+def test_single_circuit_platforms_fan_out(fake_provider, fake_client, backend_name):
+    fake_client.platform = copy.copy(fake_client.platform)
+    fake_client.platform.provider_name = backend_name
+    fake_client.platform.backend_name = backend_name
+    backend = fake_provider.get_backend()
+    circuits = [_circuit(i) for i in range(4)]
+
+    assert type(backend).__name__.lower() == f"{backend_name}backend"
+
+    job = backend.run(circuits, shots=10)
+
+    assert isinstance(job, CompositeJob)
+    assert fake_client.count("create_job") == 4
+    assert fake_client.count("create_session") == 1
+    assert len({sub_job.session_id for sub_job in job.jobs}) == 1
+
+    result = job.result()
+
+    assert [result.get_counts(i) for i in range(4)] == [
+        {format(i, "03b"): 10} for i in range(4)
+    ]
+
+    # A single circuit still gives a single job
+    assert not isinstance(backend.run(circuits[0], shots=10), CompositeJob)
+
+
+def test_arun_goes_through_run_layers(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+
+    async def _arun(*calls):
+        jobs = await asyncio.gather(
+            *(backend.arun(circuit, **options) for circuit, options in calls)
+        )
+        results = await asyncio.gather(*(job.aresult() for job in jobs))
+
+        return jobs, results
+
+    # Seeded runs are memoized and shared with run()
+    backend.enable_result_memoization()
+    (job,), (result,) = asyncio.run(_arun((_circuit(1), dict(seed_simulator=7))))
+    assert isinstance(job, MemoizedJob)
+    assert backend.run(_circuit(1), seed_simulator=7).result() is result
+    assert backend.result_memo.hits == 1
+    backend.disable_result_memoization()
+
+    # Identical in-flight runs share their job
+    backend.enable_deduplication()
+    jobs, _ = asyncio.run(_arun((_circuit(2), {}), (_circuit(2), {})))
+    assert jobs[0] is jobs[1]
+    assert backend.inflight_jobs.hits == 1
+    backend.disable_deduplication()
+
+    # Concurrent runs are coalesced in a single job
+    backend.enable_coalescing(window=0.2)
+    submitted = fake_client.count("create_job")
+    jobs, results = asyncio.run(_arun((_circuit(3), {}), (_circuit(4), {})))
+    assert all(isinstance(job, CoalescedJob) for job in jobs)
+    assert fake_client.count("create_job") == submitted + 1
+    assert [r.get_counts(0) for r in results] == [{"011": 1000}, {"100": 1000}]
+    backend.disable_coalescing()
+
+    # Small enough circuits are simulated locally
+    backend.enable_local_execution(max_qubits=3)
+    submitted = fake_client.count("create_job")
+    _, (result,) = asyncio.run(_arun((_circuit(5), dict(shots=10))))
+    assert result.get_counts() == {"101": 10}
+    assert fake_client.count("create_job") == submitted
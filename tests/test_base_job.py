@@ -0,0 +1,195 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from qiskit.circuit.random import random_circuit
+from qiskit_aer import AerSimulator
+
+from qio.core import QuantumProgramResult
+from scaleway_qaas_client.v1alpha1 import QaaSJobResult
+
+from qiskit import QuantumCircuit
+
+import qiskit_scaleway.provider
+
+from qiskit_scaleway import ScalewayProvider
+from qiskit_scaleway.backends import base_job
+from qiskit_scaleway.backends.base_job import PROGRAM_CACHE
+
+
+def _bell() -> QuantumCircuit:
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+
+    return qc
+
+
+@pytest.mark.parametrize("result_workers", [1, 4])
+def test_run_result_workers(fake_provider, fake_client, result_workers):
+    backend = fake_provider.get_backend()
+    job = backend.run(_bell(), shots=10, result_workers=result_workers)
+    job.result()
+
+    model_id = fake_client.jobs[job.job_id()]["model_id"]
+    assert "result_workers" not in fake_client.models[model_id]
+
+    threads = set()
+    download_payload = job._download_payload
+
+    def _download(job_result):
+        threads.add(threading.current_thread().name)
+        return download_payload(job_result)
+
+    job._download_payload = _download
+    job_results = fake_client.list_job_results(job.job_id()) * 4
+    results = job._process_results(job_results, job._to_qiskit_result)
+
+    assert len(results) == 4
+    if result_workers == 1:
+        assert threads == {threading.current_thread().name}
+    else:
+        assert all(name.startswith("qiskit-scaleway-results") for name in threads)
+
+
+def test_compressed_models_are_pushed_by_the_model_client(
+    monkeypatch, fake_provider, fake_client
+):
+    class _ModelClient:
+        def __init__(self, transport, **kwargs):
+            self.transport = transport
+            self.payloads = []
+
+        def create_model(self, payload):
+            self.payloads.append(payload)
+            return fake_client.create_model(payload)
+
+    monkeypatch.setattr(qiskit_scaleway.provider, "ModelClient", _ModelClient)
+    provider = ScalewayProvider(
+        project_id="project", secret_key="secret", model_compression="gzip"
+    )
+    assert provider.model_client.transport is provider.model_compression
+
+    job = provider.get_backend().run(_bell(), shots=10)
+
+    assert len(provider.model_client.payloads) == 1
+    assert sum(job.result().get_counts().values()) == 10
+
+
+def test_pooled_serialization(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+    backend.set_options(serialization_workers=2, serialization_threshold=2)
+    circuits = [
+        random_circuit(3, 4, measure=True, seed=seed) for seed in range(6)
+    ]
+    PROGRAM_CACHE.clear()
+
+    job = backend.run(circuits, shots=10)
+    job.result()
+
+    model_id = fake_client.jobs[job.job_id()]["model_id"]
+    pooled = json.loads(fake_client.models[model_id])["programs"]
+    serial = [job._serialize_circuit(circuit).to_dict() for circuit in circuits]
+
+    assert 2 in base_job._process_pools
+    assert PROGRAM_CACHE.misses == len(circuits)
+    assert pooled == serial
+
+
+def test_async_download_is_decoded_while_received(monkeypatch, fake_provider):
+    expected = AerSimulator().run(_bell(), shots=500, memory=True).result()
+    payload = QuantumProgramResult.from_qiskit_result(expected).to_json_str().encode()
+    size = len(payload) // 8 + 1
+    events = []
+
+    async def _body():
+        for i in range(0, len(payload), size):
+            events.append("received")
+            yield payload[i : i + size]
+            await asyncio.sleep(0.02)
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_body())
+
+    decode_result_stream = base_job.decode_result_stream
+
+    def _decode(chunks):
+        def _record():
+            for chunk in chunks:
+                events.append("decoded")
+                yield chunk
+
+        return decode_result_stream(_record())
+
+    monkeypatch.setattr(base_job, "decode_result_stream", _decode)
+    provider = ScalewayProvider(
+        project_id="project",
+        secret_key="secret",
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    job = provider.get_backend().run(_bell(), shots=10)
+    job_result = QaaSJobResult(
+        job_id=job.job_id(), result=None, url="https://results.example.com/r"
+    )
+
+    async def _download():
+        return await job._adownload_payload(job_result)
+
+    program_result = asyncio.run(_download())
+
+    assert program_result.to_qiskit_result().get_memory() == expected.get_memory()
+    # Chunks are decoded as they arrive, not once the download is over
+    last_received = max(i for i, event in enumerate(events) if event == "received")
+    assert events.index("decoded") < last_received
+
+
+@pytest.mark.parametrize(
+    "error, retried",
+    [
+        (Exception("error 404: model not found"), True),
+        (Exception("error 403: forbidden"), False),
+        (httpx.ReadTimeout("timed out"), False),
+    ],
+)
+def test_cached_model_retry(monkeypatch, fake_provider, fake_client, error, retried):
+    backend = fake_provider.get_backend()
+    backend.run(_bell(), shots=10).result()
+    assert fake_client.count("create_model") == 1
+
+    create_job = fake_client.create_job
+    errors = [error]
+
+    def _create_job(**kwargs):
+        if errors:
+            raise errors.pop()
+        return create_job(**kwargs)
+
+    monkeypatch.setattr(fake_client, "create_job", _create_job)
+
+    if retried:
+        job = backend.run(_bell(), shots=10)
+        assert sum(job.result().get_counts().values()) == 10
+        assert fake_client.count("create_model") == 2
+    else:
+        with pytest.raises(type(error)):
+            backend.run(_bell(), shots=10)
+        # Only a missing model is pushed again, anything else is left as is
+        assert fake_client.count("create_model") == 1
+        assert fake_client.count("create_job") == 1
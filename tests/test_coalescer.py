@@ -0,0 +1,123 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import time
+
+import pytest
+
+from qiskit import QuantumCircuit
+from qiskit.providers import JobError, JobStatus
+
+from qiskit_scaleway.backends.coalescer import CoalescedJob, freeze_options
+
+
+def _basis_state(bits: str) -> QuantumCircuit:
+    qc = QuantumCircuit(len(bits))
+    for qubit, bit in enumerate(reversed(bits)):
+        if bit == "1":
+            qc.x(qubit)
+    qc.measure_all()
+
+    return qc
+
+
+def test_freeze_options():
+    noise_model = object()
+    options = {"shots": 10, "binds": [{"a": [1, 2]}], "noise": noise_model}
+
+    assert freeze_options(options) == freeze_options(dict(reversed(options.items())))
+    assert freeze_options(options) != freeze_options(dict(options, shots=11))
+
+    # Unhashable values that are not containers are compared by identity
+    values = {1, 2}
+    assert hash(freeze_options({"values": values, "lists": [[1], {}]}))
+    assert freeze_options({"values": values}) == freeze_options({"values": values})
+    assert freeze_options({"values": values}) != freeze_options({"values": {1, 2}})
+
+
+def test_coalescing_window(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+    backend.enable_coalescing(window=0.2)
+
+    calls = [["01", "10"], ["11"], ["00", "01", "11"]]
+    jobs = [
+        backend.run([_basis_state(bits) for bits in call], shots=20)
+        for call in calls
+    ]
+
+    assert all(isinstance(job, CoalescedJob) for job in jobs)
+    assert jobs[0].status() == JobStatus.INITIALIZING
+    assert jobs[0].job_id() is None
+    assert fake_client.count("create_job") == 0
+
+    # The three calls are flushed together at the end of the window
+    time.sleep(0.4)
+    assert fake_client.count("create_job") == 1
+    assert len({job.job_id() for job in jobs}) == 1
+
+    for job, call in zip(jobs, calls):
+        result = job.result()
+        assert len(result.results) == len(call)
+        assert [result.get_counts(i) for i in range(len(call))] == [
+            {bits: 20} for bits in call
+        ]
+
+    assert asyncio.run(jobs[1].aresult()).get_counts(0) == {"11": 20}
+    assert jobs[2].future().result(timeout=30) is not None
+    assert fake_client.count("list_job_results") == 1
+
+
+def test_coalescing_batches(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+    backend.enable_coalescing(window=60, max_circuits=3)
+
+    first = backend.run([_basis_state("01"), _basis_state("10")], shots=10)
+    # Calls with other options or sessions go to other batches
+    other = backend.run([_basis_state("11")], shots=30)
+    assert fake_client.count("create_job") == 0
+
+    # The batch is flushed as soon as it is full
+    second = backend.run([_basis_state("11")], shots=10)
+    assert fake_client.count("create_job") == 1
+    assert first.job_id() == second.job_id()
+    assert second.result().get_counts(0) == {"11": 10}
+    assert len(first.result().results) == 2
+
+    backend.disable_coalescing()
+    assert fake_client.count("create_job") == 2
+    assert other.job_id() != first.job_id()
+    assert other.result().get_counts(0) == {"11": 30}
+
+    # Not coalesced anymore
+    assert not isinstance(backend.run(_basis_state("01"), shots=10), CoalescedJob)
+
+
+def test_coalescing_submission_error(fake_provider, fake_client, monkeypatch):
+    backend = fake_provider.get_backend()
+    backend.enable_coalescing(window=60)
+
+    def _fail(*args, **kwargs):
+        raise RuntimeError("platform unavailable")
+
+    monkeypatch.setattr(fake_client, "create_job", _fail)
+
+    job = backend.run(_basis_state("01"), shots=10)
+    backend.disable_coalescing()
+
+    assert job.status() == JobStatus.ERROR
+    assert job.job_id() is None
+    with pytest.raises(JobError):
+        job.result()
+    with pytest.raises(JobError):
+        job.future().result(timeout=30)
@@ -0,0 +1,189 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import gzip
+import json
+import httpx
+import pytest
+
+from qiskit_scaleway.utils import (
+    CompressionTransport,
+    ModelClient,
+    create_async_http_client,
+    create_http_client,
+)
+
+_MODELS_URL = "https://api.example.com/qaas/v1alpha1/models"
+_PAYLOAD = b'{"programs": "' + b"x" * 4096 + b'"}'
+
+
+def test_http_client_retries_transient_errors():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+
+        if len(calls) < 3:
+            return httpx.Response(503)
+
+        return httpx.Response(200, text='{"ok": true}')
+
+    client = create_http_client(transport=httpx.MockTransport(handler), retries=3)
+
+    resp = client.get("https://results.example.com/job-result")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": True}
+    assert len(calls) == 3
+
+
+def test_http_client_gives_up_after_retries():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(502)
+
+    client = create_http_client(transport=httpx.MockTransport(handler), retries=2)
+
+    resp = client.get("https://results.example.com/job-result")
+
+    assert resp.status_code == 502
+    assert len(calls) == 3
+
+
+def test_async_http_client_retries_transient_errors():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+
+        if len(calls) < 2:
+            return httpx.Response(429)
+
+        return httpx.Response(200, text='{"ok": true}')
+
+    async def _get():
+        async with create_async_http_client(
+            transport=httpx.MockTransport(handler), retries=3
+        ) as client:
+            return await client.get("https://results.example.com/job-result")
+
+    resp = asyncio.run(_get())
+
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": True}
+    assert len(calls) == 2
+
+
+def _decoded_body(request: httpx.Request) -> bytes:
+    if request.headers.get("Content-Encoding") == "gzip":
+        return gzip.decompress(request.content)
+
+    return request.content
+
+
+def test_compression_transport_compresses_large_uploads():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"id": "model"})
+
+    transport = CompressionTransport(httpx.MockTransport(handler), threshold=1024)
+    client = httpx.Client(transport=transport)
+
+    client.post(_MODELS_URL, content=_PAYLOAD)
+    client.post(_MODELS_URL, content=b"small")
+    client.post("https://api.example.com/qaas/v1alpha1/jobs", content=_PAYLOAD)
+
+    encodings = [request.headers.get("Content-Encoding") for request in requests]
+    assert encodings == ["gzip", None, None]
+    assert all(_decoded_body(request) in (_PAYLOAD, b"small") for request in requests)
+
+    assert transport.negotiated
+    assert transport.bytes_sent == len(requests[0].content)
+    assert transport.bytes_saved == len(_PAYLOAD) - len(requests[0].content)
+
+
+@pytest.mark.parametrize("status_code", [400, 415])
+def test_compression_transport_falls_back_when_rejected(status_code):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        if request.headers.get("Content-Encoding"):
+            return httpx.Response(status_code)
+
+        return httpx.Response(200, json={"id": "model"})
+
+    transport = CompressionTransport(httpx.MockTransport(handler), threshold=1024)
+    client = httpx.Client(transport=transport)
+
+    assert client.post(_MODELS_URL, content=_PAYLOAD).status_code == 200
+    assert client.post(_MODELS_URL, content=_PAYLOAD).status_code == 200
+
+    # Rejected once, then sent uncompressed without trying again
+    encodings = [request.headers.get("Content-Encoding") for request in requests]
+    assert encodings == ["gzip", None, None]
+    assert all(request.content == _PAYLOAD for request in requests[1:])
+    assert not transport.enabled
+    assert transport.bytes_saved == 0
+
+
+def test_compression_transport_keeps_negotiated_result():
+    statuses = iter([200, 400])
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(next(statuses))
+
+    transport = CompressionTransport(httpx.MockTransport(handler), threshold=1024)
+    client = httpx.Client(transport=transport)
+
+    assert client.post(_MODELS_URL, content=_PAYLOAD).status_code == 200
+
+    # Compression was accepted, a later 400 is an error of the request itself
+    assert client.post(_MODELS_URL, content=_PAYLOAD).status_code == 400
+    assert len(requests) == 2
+    assert transport.enabled
+
+
+def test_model_client():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"id": "model-1", "project_id": "project"})
+
+    transport = CompressionTransport(httpx.MockTransport(handler), threshold=1024)
+    client = ModelClient(
+        project_id="project",
+        secret_key="secret",
+        url="https://api.example.com",
+        transport=transport,
+    )
+
+    model = client.create_model(_PAYLOAD.decode())
+
+    assert model.id == "model-1"
+    assert requests[0].url == _MODELS_URL
+    assert requests[0].headers["X-Auth-Token"] == "secret"
+    assert requests[0].headers["Content-Encoding"] == "gzip"
+    assert json.loads(_decoded_body(requests[0])) == {
+        "project_id": "project",
+        "payload": _PAYLOAD.decode(),
+    }
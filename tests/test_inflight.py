@@ -0,0 +1,108 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from qiskit import QuantumCircuit
+from qiskit.providers import JobError
+
+from qiskit_scaleway.backends.inflight import InFlightJobs
+
+
+def _bell() -> QuantumCircuit:
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+
+    return qc
+
+
+def test_deduplication_shares_inflight_jobs(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+    backend.enable_deduplication()
+
+    job = backend.run(_bell(), shots=100)
+
+    # Rebuilt circuits are identical
+    assert backend.run(_bell(), shots=100) is job
+    assert backend.inflight_jobs.hits == 1
+    assert len(backend.inflight_jobs) == 1
+
+    # Other shots, options or sessions are other submissions
+    assert backend.run(_bell(), shots=200) is not job
+    assert backend.run(_bell(), shots=100, seed_simulator=1) is not job
+    assert backend.run(_bell(), shots=100, session_id="other") is not job
+    assert fake_client.count("create_job") == 4
+
+    # Finished jobs are released
+    job.future().result(timeout=30)
+    assert backend.run(_bell(), shots=100) is not job
+    assert fake_client.count("create_job") == 5
+
+    backend.disable_deduplication()
+    assert backend.inflight_jobs is None
+
+
+def test_deduplication_concurrent_submissions():
+    inflight = InFlightJobs()
+    submitted = threading.Event()
+    release = threading.Event()
+    jobs = []
+
+    class _Job:
+        def future(self):
+            raise JobError("No job monitor")
+
+    def _submit(circuits, job_config, session_id):
+        submitted.set()
+        release.wait(timeout=30)
+        jobs.append(_Job())
+        return jobs[-1]
+
+    def _run():
+        return inflight.get_or_submit([_bell()], {"shots": 10}, None, _submit)
+
+    with ThreadPoolExecutor(4) as executor:
+        first = executor.submit(_run)
+        submitted.wait(timeout=30)
+        # Identical submissions wait for the one in progress
+        others = [executor.submit(_run) for _ in range(3)]
+        release.set()
+
+        assert {id(f.result(timeout=30)) for f in [first, *others]} == {id(jobs[0])}
+
+    assert len(jobs) == 1
+    assert inflight.hits == 3
+    # Untracked jobs are released right away
+    assert len(inflight) == 0
+
+
+def test_deduplication_submission_error():
+    inflight = InFlightJobs()
+
+    def _fail(circuits, job_config, session_id):
+        raise RuntimeError("platform unavailable")
+
+    with pytest.raises(RuntimeError):
+        inflight.get_or_submit([_bell()], {"shots": 10}, None, _fail)
+
+    # Failed submissions are not shared
+    assert len(inflight) == 0
+    with pytest.raises(RuntimeError):
+        inflight.get_or_submit([_bell()], {"shots": 10}, None, _fail)
+    assert inflight.hits == 0
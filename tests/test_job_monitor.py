@@ -0,0 +1,273 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+import httpx
+
+import pytest
+
+from collections import Counter
+
+from qiskit.providers import JobError, JobStatus, JobTimeoutError
+
+from qiskit_scaleway import ScalewayProvider
+from qiskit_scaleway.backends import FixedPolling, JobMonitor, PollingStrategy
+
+
+class _QaaSJob:
+    def __init__(self, id, status):
+        self.id = id
+        self.status = status
+        self.progress_message = None
+
+
+class _Client:
+    def __init__(self):
+        self.statuses = {}
+        self.errors = {}
+        self.requests = Counter()
+
+    def get_job(self, job_id):
+        self.requests["get_job", job_id] += 1
+
+        if self.errors.get(job_id):
+            raise self.errors[job_id].pop(0)
+
+        return _QaaSJob(job_id, self.statuses[job_id])
+
+    def list_jobs(self, session_id):
+        self.requests["list_jobs", session_id] += 1
+        return [_QaaSJob(job_id, status) for job_id, status in self.statuses.items()]
+
+    def list_job_results(self, job_id):
+        return [f"result-{job_id}"]
+
+
+class _Job:
+    def __init__(self, job_id, session_id=None):
+        self._job_id = job_id
+        self.session_id = session_id
+        self._last_status = None
+        self._last_progress_message = ""
+
+    def job_id(self):
+        return self._job_id
+
+    def _update_status(self, qaas_job) -> JobStatus:
+        self._last_status = {
+            "waiting": JobStatus.QUEUED,
+            "running": JobStatus.RUNNING,
+            "completed": JobStatus.DONE,
+        }.get(qaas_job.status, JobStatus.ERROR)
+
+        return self._last_status
+
+
+class _BackOff(PollingStrategy):
+    """Checks fast once, then waits for a long time."""
+
+    def next_interval(self, attempt, status, progress_message):
+        return 0.05 if attempt == 0 else 30
+
+
+def test_resolves_finished_jobs():
+    client = _Client()
+    client.statuses = {"done": "running", "failed": "running"}
+    monitor = JobMonitor(client, FixedPolling(0.01))
+
+    done = monitor.watch(_Job("done"))
+    failed = monitor.watch(_Job("failed"))
+    client.statuses = {"done": "completed", "failed": "error"}
+
+    assert done.result(timeout=5) == ["result-done"]
+    with pytest.raises(JobError):
+        failed.result(timeout=5)
+
+
+def test_session_jobs_are_listed_together():
+    client = _Client()
+    client.statuses = {"a": "running", "b": "running"}
+    monitor = JobMonitor(client, FixedPolling(0.05))
+
+    futures = [monitor.watch(_Job(job_id, "session")) for job_id in ("a", "b")]
+    time.sleep(0.1)
+    client.statuses = {"a": "completed", "b": "completed"}
+
+    assert [f.result(timeout=5) for f in futures] == [["result-a"], ["result-b"]]
+    assert client.requests["list_jobs", "session"] > 0
+    assert client.requests["get_job", "a"] == client.requests["get_job", "b"] == 0
+
+
+def test_submissions_do_not_reset_the_backoff():
+    client = _Client()
+    client.statuses = {"first": "running"}
+    monitor = JobMonitor(client, FixedPolling(0.2))
+
+    monitor.watch(_Job("first"))
+    time.sleep(0.3)
+
+    for i in range(5):
+        client.statuses[f"job-{i}"] = "running"
+        monitor.watch(_Job(f"job-{i}"))
+        time.sleep(0.01)
+
+    time.sleep(0.1)
+
+    # Ticks at 0.2 and 0.4 seconds, none per submission
+    assert client.requests["get_job", "first"] == 2
+
+
+def test_sooner_jobs_wake_the_monitor():
+    client = _Client()
+    client.statuses = {"slow": "running", "fast": "completed"}
+    monitor = JobMonitor(client, _BackOff())
+
+    monitor.watch(_Job("slow"))
+    time.sleep(0.3)
+
+    # The monitor now sleeps for 30 seconds, the new job is checked sooner
+    assert monitor.watch(_Job("fast")).result(timeout=2) == ["result-fast"]
+
+
+def test_max_requests():
+    client = _Client()
+    client.statuses = {"stuck": "waiting"}
+    monitor = JobMonitor(client, FixedPolling(0.01, max_requests=3))
+
+    with pytest.raises(JobTimeoutError):
+        monitor.watch(_Job("stuck")).result(timeout=5)
+
+    assert client.requests["get_job", "stuck"] == 3
+
+
+class _Recorder(FixedPolling):
+    def __init__(self, interval):
+        super().__init__(interval)
+        self.statuses = []
+
+    def next_interval(self, attempt, status, progress_message):
+        self.statuses.append(status)
+        return super().next_interval(attempt, status, progress_message)
+
+
+def test_permanent_errors_fail_the_job():
+    client = _Client()
+    client.statuses = {"deleted": "running", "other": "running"}
+    client.errors = {"deleted": [Exception('error 404: {"message": "not found"}')]}
+    monitor = JobMonitor(client, FixedPolling(0.01))
+
+    deleted = monitor.watch(_Job("deleted"))
+    other = monitor.watch(_Job("other"))
+
+    with pytest.raises(Exception, match="error 404"):
+        deleted.result(timeout=5)
+
+    assert client.requests["get_job", "deleted"] == 1
+    assert not other.done()
+    client.statuses["other"] = "completed"
+    assert other.result(timeout=5) == ["result-other"]
+
+
+def test_transient_errors_are_retried():
+    client = _Client()
+    client.statuses = {"job": "completed"}
+    client.errors = {
+        "job": [
+            httpx.ConnectError("connection refused"),
+            Exception("error 503: unavailable"),
+            Exception("error 429: slow down"),
+        ]
+    }
+    monitor = JobMonitor(client, FixedPolling(0.01))
+
+    assert monitor.watch(_Job("job")).result(timeout=5) == ["result-job"]
+    assert client.requests["get_job", "job"] == 4
+
+
+def test_max_failures():
+    client = _Client()
+    client.statuses = {"job": "running"}
+    client.errors = {"job": [Exception("error 502: bad gateway")] * 10}
+    monitor = JobMonitor(client, FixedPolling(0.01), max_failures=3)
+
+    with pytest.raises(JobError, match="after 3 failed status requests"):
+        monitor.watch(_Job("job")).result(timeout=5)
+
+    assert client.requests["get_job", "job"] == 3
+
+
+def test_tick_errors_fail_the_jobs():
+    class _Broken(_Job):
+        def _update_status(self, qaas_job):
+            raise RuntimeError("unexpected payload")
+
+    client = _Client()
+    client.statuses = {"job": "running"}
+    monitor = JobMonitor(client, FixedPolling(0.01))
+
+    with pytest.raises(RuntimeError, match="unexpected payload"):
+        monitor.watch(_Broken("job")).result(timeout=5)
+
+
+def test_queued_jobs_interval():
+    client = _Client()
+    client.statuses = {"a": "waiting", "b": "waiting"}
+    polling = _Recorder(0.05)
+    monitor = JobMonitor(client, polling)
+
+    futures = [monitor.watch(_Job(job_id)) for job_id in ("a", "b")]
+    time.sleep(0.12)
+    ticks = len(polling.statuses)
+    client.statuses["a"] = "running"
+    time.sleep(0.12)
+    client.statuses = {"a": "completed", "b": "completed"}
+    [f.result(timeout=5) for f in futures]
+
+    # The first intervals are the ones of the first checks in watch()
+    assert ticks > 2
+    assert set(polling.statuses[2:ticks]) == {JobStatus.QUEUED}
+    assert JobStatus.RUNNING in polling.statuses[ticks:]
+
+
+def test_job_polling_strategy():
+    client = _Client()
+    client.statuses = {"a": "running", "b": "running"}
+    monitor = JobMonitor(client, _BackOff())
+
+    default = monitor.watch(_Job("a"))
+    # A job watched again with a strategy is then polled on its own schedule
+    assert monitor.watch(_Job("b")) is monitor.watch(
+        _Job("b"), FixedPolling(0.01, max_requests=5)
+    )
+    own = monitor.watch(_Job("b"))
+
+    with pytest.raises(JobTimeoutError, match="after 5 status requests"):
+        own.result(timeout=5)
+
+    # The other job keeps the backoff of the monitor strategy
+    assert client.requests["get_job", "b"] == 5
+    assert client.requests["get_job", "a"] <= 2
+    assert not default.done()
+
+    client.statuses["a"] = "completed"
+    monitor.watch(_Job("a"), FixedPolling(0.01))
+    assert default.result(timeout=5) == ["result-a"]
+
+
+def test_provider_polling_strategy(fake_provider):
+    polling = FixedPolling(1)
+    provider = ScalewayProvider(
+        project_id="project", secret_key="secret", polling_strategy=polling
+    )
+
+    assert provider.job_monitor._polling_strategy is polling
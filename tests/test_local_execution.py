@@ -0,0 +1,93 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+
+from qiskit import QuantumCircuit
+
+from qiskit_scaleway.backends.aer.local import HybridJob
+
+
+def _ghz(num_qubits: int) -> QuantumCircuit:
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for qubit in range(1, num_qubits):
+        qc.cx(0, qubit)
+    qc.measure_all()
+
+    return qc
+
+
+def _backend(provider):
+    backend = provider.get_backend()
+    backend.enable_local_execution(max_qubits=3)
+
+    return backend
+
+
+def test_local_execution_as_completed(fake_provider, fake_client):
+    backend = _backend(fake_provider)
+    circuits = [_ghz(2), _ghz(5), _ghz(3)]
+
+    jobs = [backend.run(circuits, shots=100) for _ in range(2)]
+    assert all(isinstance(job, HybridJob) for job in jobs)
+
+    completed = list(fake_provider.as_completed(jobs, timeout=30))
+    assert {id(job) for job in completed} == {id(job) for job in jobs}
+
+    for job in completed:
+        result = job.result()
+        assert len(result.results) == 3
+        assert sum(result.get_counts(1).values()) == 100
+        assert set(result.get_counts(1)) == {"00000", "11111"}
+
+    # Only the 5 qubits circuit went to the platform
+    assert fake_client.count("create_job") == 2
+
+    done, not_done = fake_provider.wait(jobs, timeout=30)
+    assert len(done) == 2 and not not_done
+
+
+def test_local_execution_deduplication(fake_provider, fake_client):
+    backend = _backend(fake_provider)
+    backend.enable_deduplication()
+    circuits = [_ghz(2), _ghz(5)]
+
+    first = backend.run(circuits, shots=100)
+    second = backend.run(circuits, shots=100)
+
+    assert second is first
+    assert backend.inflight_jobs.hits == 1
+    assert fake_client.count("create_job") == 1
+
+    first.future().result(timeout=30)
+    assert len(first.result().results) == 2
+
+    # Finished jobs are not shared anymore
+    third = backend.run(circuits, shots=100)
+    assert third is not first
+    assert fake_client.count("create_job") == 2
+
+
+def test_local_execution_aresult(fake_provider):
+    backend = _backend(fake_provider)
+    backend.enable_result_memoization()
+
+    job = backend.run([_ghz(2), _ghz(5)], shots=100, seed_simulator=42)
+    result = asyncio.run(job.aresult())
+
+    assert len(result.results) == 2
+    assert result.get_counts(0) == job.result().get_counts(0)
+
+    memoized = backend.run([_ghz(2), _ghz(5)], shots=100, seed_simulator=42)
+    assert asyncio.run(memoized.aresult()) is result
@@ -0,0 +1,151 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import errno
+import logging
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from qiskit_scaleway.utils import ModelCache
+
+
+def _key(payload: str) -> str:
+    return ModelCache.key(payload, "project", "platform")
+
+
+def test_model_cache_roundtrip(tmp_path):
+    cache = ModelCache(directory=str(tmp_path))
+
+    assert _key("a") != _key("b")
+    assert _key("a") != ModelCache.key("a", "project", "other-platform")
+    assert cache.get(_key("a")) is None
+
+    cache.put(_key("a"), "model-a")
+
+    assert cache.get(_key("a")) == "model-a"
+
+    # A new instance on the same directory sees the entry
+    assert ModelCache(directory=str(tmp_path)).get(_key("a")) == "model-a"
+
+    cache.invalidate(_key("a"))
+
+    assert cache.get(_key("a")) is None
+    assert ModelCache(directory=str(tmp_path)).get(_key("a")) is None
+
+
+def test_model_cache_expiry():
+    cache = ModelCache(max_age=0.05)
+    cache.put(_key("a"), "model-a")
+
+    assert cache.get(_key("a")) == "model-a"
+
+    time.sleep(0.1)
+
+    assert cache.get(_key("a")) is None
+    assert len(cache) == 0
+
+
+def test_model_cache_evicts_least_recently_used(tmp_path):
+    cache = ModelCache(max_size=2, directory=str(tmp_path))
+
+    cache.put(_key("a"), "model-a")
+    time.sleep(0.01)
+    cache.put(_key("b"), "model-b")
+    time.sleep(0.01)
+
+    # Reading a makes b the least recently used entry
+    cache.get(_key("a"))
+    cache.put(_key("c"), "model-c")
+
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) == "model-a"
+    assert cache.get(_key("c")) == "model-c"
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_model_cache_disabled(tmp_path):
+    cache = ModelCache(max_size=0, directory=str(tmp_path))
+    cache.put(_key("a"), "model-a")
+
+    assert cache.get(_key("a")) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_model_cache_only_manages_its_files(tmp_path):
+    cache = ModelCache(max_size=1, directory=str(tmp_path))
+
+    other = tmp_path / "notes.txt"
+    other.write_text("not an entry")
+    writing = tmp_path / f"{_key('d')}.tmp"
+    writing.write_text("")
+    stale = tmp_path / f"{_key('c')}.tmp"
+    stale.write_text("")
+    os.utime(stale, (time.time() - 3600, time.time() - 3600))
+
+    cache.put(_key("a"), "model-a")
+    cache.put(_key("b"), "model-b")
+
+    # Eviction keeps the foreign and in-progress files
+    assert other.exists()
+    assert writing.exists()
+
+    cache.clear()
+
+    assert sorted(os.listdir(tmp_path)) == sorted(["notes.txt", writing.name])
+    assert not stale.exists()
+
+
+def test_model_cache_expands_user(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    cache = ModelCache(directory="~/models")
+
+    assert cache.directory == str(tmp_path / "models")
+    assert os.path.isdir(cache.directory)
+
+
+def test_model_cache_shared_directory(tmp_path):
+    # Separate instances share the directory like separate processes would
+    caches = [ModelCache(directory=str(tmp_path)) for _ in range(8)]
+    keys = [_key(str(i)) for i in range(20)]
+
+    def _put(cache):
+        for _ in range(10):
+            for key in keys:
+                cache.put(key, f"model-{key}")
+
+    with ThreadPoolExecutor(len(caches)) as executor:
+        list(executor.map(_put, caches))
+
+    reader = ModelCache(directory=str(tmp_path))
+    assert all(reader.get(key) == f"model-{key}" for key in keys)
+    assert sorted(os.listdir(tmp_path)) == sorted(keys)
+
+
+def test_model_cache_write_errors(tmp_path, monkeypatch, caplog):
+    cache = ModelCache(directory=str(tmp_path))
+
+    def _disk_full(*args, **kwargs):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(os, "replace", _disk_full)
+
+    with caplog.at_level(logging.WARNING):
+        cache.put(_key("a"), "model-a")
+
+    # The entry is only kept in memory
+    assert cache.get(_key("a")) == "model-a"
+    assert "No space left on device" in caplog.text
+    assert os.listdir(tmp_path) == []
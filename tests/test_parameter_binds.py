@@ -0,0 +1,86 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit.primitives.containers.bindings_array import BindingsArray
+
+from qiskit_scaleway.backends.aer.parameter_binds import to_parameter_table
+from qiskit_scaleway.primitives.parameter_binding import parameter_table
+
+
+def _circuit() -> QuantumCircuit:
+    theta = ParameterVector("θ", 2)
+    qc = QuantumCircuit(2)
+    qc.rx(theta[0], 0)
+    qc.ry(2 * theta[1] + Parameter("x"), 1)
+    qc.measure_all()
+
+    return qc
+
+
+def test_to_parameter_table():
+    qc = _circuit()
+    plain = QuantumCircuit(1)
+    plain.h(0)
+
+    binds = [{param: [0.1 * i, 0.2 * i] for i, param in enumerate(qc.parameters)}, {}]
+    circuits, table = to_parameter_table([qc, plain], binds)
+
+    assert table[1] == {}
+    assert circuits[1] is plain
+
+    # Parameters are renamed by position, the table is keyed by the new names
+    names = [param.name for param in circuits[0].parameters]
+    assert sorted(names) == sorted(table[0])
+    for i, param in enumerate(qc.parameters):
+        assert table[0][f"_pb{i}"] == binds[0][param]
+
+    bound = circuits[0].assign_parameters(
+        {param: table[0][param.name][1] for param in circuits[0].parameters}
+    )
+    expected = qc.assign_parameters(
+        {param: binds[0][param][1] for param in qc.parameters}
+    )
+    assert bound == expected
+
+
+def test_to_parameter_table_errors():
+    qc = _circuit()
+    params = list(qc.parameters)
+
+    with pytest.raises(ValueError):
+        to_parameter_table([qc, qc], [{param: [0.0] for param in params}])
+
+    with pytest.raises(ValueError):
+        to_parameter_table([qc], [{param: [0.0] for param in params[:-1]}])
+
+    with pytest.raises(ValueError):
+        to_parameter_table(
+            [qc], [{param: [0.0] * (i + 1) for i, param in enumerate(params)}]
+        )
+
+
+def test_parameter_table_order():
+    qc = _circuit()
+    values = np.arange(2 * 3 * qc.num_parameters, dtype=float).reshape(2, 3, -1)
+    bindings = BindingsArray({tuple(qc.parameters): values})
+
+    table = parameter_table(qc, bindings)
+
+    for i, index in enumerate(np.ndindex(bindings.shape)):
+        for j, param in enumerate(qc.parameters):
+            assert table[param][i] == values[index][j]
@@ -0,0 +1,86 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import efficient_su2
+from qiskit.quantum_info import PauliList, Statevector
+
+from qiskit_scaleway.primitives.pauli_grouping import (
+    COLORING_STRATEGIES,
+    commuting_measurement_circuit,
+    group_paulis,
+)
+
+_PAULIS = PauliList(["XX", "YY", "ZZ", "XI", "IX", "ZI", "XY", "YX", "II"])
+
+
+@pytest.mark.parametrize("coloring", list(COLORING_STRATEGIES))
+@pytest.mark.parametrize("grouping", ["none", "qubit_wise", "commuting"])
+def test_group_paulis_partitions(grouping, coloring):
+    groups = group_paulis(_PAULIS, grouping, coloring)
+
+    labels = sorted(label for group in groups for label in group.to_labels())
+    assert labels == sorted(_PAULIS.to_labels())
+
+    for group in groups:
+        graph = group.noncommutation_graph(qubit_wise=grouping != "commuting")
+        assert graph.num_edges() == 0
+
+    if grouping == "none":
+        assert len(groups) == len(_PAULIS)
+    else:
+        assert len(groups) < len(_PAULIS)
+
+
+@pytest.mark.parametrize(
+    "labels, measured",
+    [
+        (["XXI", "YYI", "ZZI", "IIX", "XXX"], None),
+        # Groups on qubit 0 only, or on no qubit at all
+        (["IIX"], [0]),
+        (["III", "IIY"], [0]),
+        (["III"], [0]),
+    ],
+)
+def test_commuting_measurement_circuit(labels, measured):
+    state = efficient_su2(3, reps=1)
+    state = state.assign_parameters(np.linspace(0.1, 2.0, state.num_parameters))
+    paulis = PauliList(labels)
+
+    meas_circuit, indices, meas_paulis, signs = commuting_measurement_circuit(
+        3, paulis, "__c_g0"
+    )
+    assert not meas_paulis.x.any()
+    assert meas_circuit.num_clbits == len(indices) == meas_paulis.num_qubits
+
+    if measured is not None:
+        assert indices == measured
+
+    # Expectation values from the measured probabilities
+    rotated = QuantumCircuit(3)
+    rotated.compose(state, inplace=True)
+    rotated.compose(meas_circuit.remove_final_measurements(inplace=False), inplace=True)
+    probs = Statevector(rotated).probabilities(indices)
+
+    outcomes = np.arange(len(probs))
+
+    for pauli, meas_pauli, sign in zip(paulis, meas_paulis, signs):
+        # Bit k of an outcome is the measured qubit indices[k]
+        mask = sum(1 << k for k in np.flatnonzero(meas_pauli.z))
+        parities = np.array([(-1) ** bin(o & mask).count("1") for o in outcomes])
+        expval = sign * np.dot(parities, probs)
+
+        assert np.isclose(expval, Statevector(state).expectation_value(pauli))
@@ -0,0 +1,141 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+
+import pytest
+
+from qiskit import QuantumCircuit
+from qiskit.providers import JobStatus, JobTimeoutError
+
+from qiskit_scaleway.backends import (
+    AdaptivePolling,
+    ExponentialBackoffPolling,
+    FixedPolling,
+)
+
+
+def _bell() -> QuantumCircuit:
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+
+    return qc
+
+
+def test_fixed_polling():
+    polling = FixedPolling(2)
+
+    assert polling.max_requests is None
+    assert [
+        polling.next_interval(attempt, JobStatus.RUNNING, "") for attempt in range(5)
+    ] == [2] * 5
+
+
+def test_exponential_backoff_polling():
+    polling = ExponentialBackoffPolling(
+        initial_interval=1, max_interval=10, multiplier=2, jitter=0
+    )
+
+    intervals = [
+        polling.next_interval(attempt, JobStatus.RUNNING, "") for attempt in range(6)
+    ]
+
+    assert intervals == [1, 2, 4, 8, 10, 10]
+
+
+def test_exponential_backoff_polling_jitter():
+    polling = ExponentialBackoffPolling(
+        initial_interval=1, max_interval=10, multiplier=2, jitter=0.1
+    )
+
+    for attempt in range(6):
+        expected = min(2**attempt, 10)
+        interval = polling.next_interval(attempt, JobStatus.RUNNING, "")
+        assert 0.9 * expected <= interval <= 1.1 * expected
+
+
+def test_adaptive_polling():
+    polling = AdaptivePolling(
+        initial_interval=1,
+        max_interval=5,
+        queued_max_interval=30,
+        multiplier=2,
+        jitter=0,
+    )
+
+    # Backs off further while queued, stays reactive while running
+    assert polling.next_interval(10, JobStatus.QUEUED, "") == 30
+    assert polling.next_interval(10, JobStatus.RUNNING, "") == 5
+    assert polling.next_interval(0, JobStatus.RUNNING, "") == 1
+
+
+def test_run_polling_strategy(fake_provider, fake_client):
+    fake_client.run_delay = 60
+    backend = fake_provider.get_backend()
+
+    job = backend.run(
+        _bell(), shots=10, polling_strategy=FixedPolling(0.01, max_requests=3)
+    )
+
+    # The strategy given to run() is used instead of the shared monitor
+    with pytest.raises(JobTimeoutError, match="after 3 status requests"):
+        job.result()
+
+    # It is not sent to the platform along with the backend options
+    model_id = fake_client.jobs[job.job_id()]["model_id"]
+    assert "polling_strategy" not in fake_client.models[model_id]
+
+
+def test_run_polling_strategy_async(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+    polling = FixedPolling(0.01)
+
+    async def _run():
+        job = await backend.arun(_bell(), shots=10, polling_strategy=polling)
+        assert job._get_polling_strategy(None, None) is polling
+
+        return await job.aresult()
+
+    result = asyncio.run(_run())
+
+    assert sum(result.get_counts().values()) == 10
+
+
+def test_run_polling_strategy_async_max_requests(fake_provider, fake_client):
+    fake_client.run_delay = 60
+    backend = fake_provider.get_backend()
+    polling = FixedPolling(0.01, max_requests=2)
+
+    async def _run():
+        job = await backend.arun(_bell(), shots=10, polling_strategy=polling)
+
+        return await job.aresult()
+
+    with pytest.raises(JobTimeoutError, match="after 2 status requests"):
+        asyncio.run(_run())
+
+
+def test_result_polling_strategy(fake_provider, fake_client):
+    fake_client.run_delay = 60
+    backend = fake_provider.get_backend()
+    job = backend.run(_bell(), shots=10)
+
+    with pytest.raises(JobTimeoutError, match="after 3 status requests"):
+        job.result(polling_strategy=FixedPolling(0.01, max_requests=3))
+
+    # The strategy applies to the monitor watching the job, which is not
+    # polled by result() on top of it
+    assert isinstance(job.future().exception(timeout=1), JobTimeoutError)
+    assert fake_client.count("get_job") <= 4
@@ -0,0 +1,96 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, qasm3
+from qiskit.circuit import Clbit
+from qiskit.circuit.classical import expr
+
+from qiskit_scaleway.utils import circuit_fingerprint
+
+
+def _if_test(value: int) -> QuantumCircuit:
+    qc = QuantumCircuit(1, 2)
+    qc.measure(0, 0)
+    with qc.if_test((qc.clbits[0], value)):
+        qc.x(0)
+    return qc
+
+
+def _if_register(value: int) -> QuantumCircuit:
+    qc = QuantumCircuit(QuantumRegister(1, "q"), ClassicalRegister(2, "c"))
+    qc.measure(0, 0)
+    with qc.if_test((qc.cregs[0], value)):
+        qc.x(0)
+    return qc
+
+
+def _if_expr(value: bool) -> QuantumCircuit:
+    qc = QuantumCircuit(1, 2)
+    qc.measure(0, 0)
+    with qc.if_test(expr.logic_and(qc.clbits[0], expr.lift(value))):
+        qc.x(0)
+    return qc
+
+
+def _while_loop(value: int) -> QuantumCircuit:
+    qc = QuantumCircuit(1, 1)
+    with qc.while_loop((qc.clbits[0], value)):
+        qc.h(0)
+        qc.measure(0, 0)
+    return qc
+
+
+def _switch(label: int) -> QuantumCircuit:
+    qc = QuantumCircuit(1, 2)
+    qc.measure(0, 0)
+    with qc.switch(qc.cregs[0]) as case:
+        with case(label):
+            qc.x(0)
+    return qc
+
+
+def _delay(unit: str) -> QuantumCircuit:
+    qc = QuantumCircuit(1)
+    qc.delay(100, 0, unit=unit)
+    return qc
+
+
+def _register_bits(reverse: bool) -> QuantumCircuit:
+    bits = [Clbit(), Clbit()]
+    qc = QuantumCircuit(QuantumRegister(2, "q"), bits)
+    qc.add_register(ClassicalRegister(bits=bits[::-1] if reverse else bits, name="c"))
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+@pytest.mark.parametrize(
+    "build, first, second",
+    [
+        (_if_test, 0, 1),
+        (_if_register, 1, 2),
+        (_if_expr, True, False),
+        (_while_loop, 0, 1),
+        (_switch, 1, 2),
+        (_delay, "ns", "dt"),
+        (_register_bits, False, True),
+    ],
+)
+def test_fingerprint_follows_serialization(build, first, second):
+    # Circuits built the same way share their fingerprint
+    assert circuit_fingerprint(build(first)) == circuit_fingerprint(build(first))
+
+    # Circuits serialized differently never do
+    assert qasm3.dumps(build(first)) != qasm3.dumps(build(second))
+    assert circuit_fingerprint(build(first)) != circuit_fingerprint(build(second))
@@ -0,0 +1,108 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import copy
+
+from types import SimpleNamespace
+
+import qiskit_scaleway.provider
+
+from scaleway_qaas_client.v1alpha1 import QaaSPlatform
+
+from qiskit_scaleway import ScalewayProvider
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _updated(platform: QaaSPlatform, **fields) -> QaaSPlatform:
+    platform = copy.copy(platform)
+    for name, value in fields.items():
+        setattr(platform, name, value)
+
+    return platform
+
+
+def _clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    # Only the clock of the provider module
+    monkeypatch.setattr(
+        qiskit_scaleway.provider, "time", SimpleNamespace(monotonic=clock.monotonic)
+    )
+
+    return clock
+
+
+def test_platform_cache_hits(fake_provider, fake_client, monkeypatch):
+    _clock(monkeypatch)
+
+    backend = fake_provider.get_backend()
+    assert fake_client.count("list_platforms") == 1
+
+    assert fake_provider.get_backend() is backend
+    assert fake_provider.backends() == [backend]
+    assert asyncio.run(fake_provider.aget_backend()) is backend
+    assert fake_client.count("list_platforms") == 1
+
+    # Listings are cached by name
+    assert fake_provider.get_backend("EMU-AER-16C-128M") is backend
+    assert fake_client.count("list_platforms") == 2
+    fake_provider.get_backend("EMU-AER-16C-128M")
+    assert fake_client.count("list_platforms") == 2
+
+    fake_provider.invalidate_cache()
+    assert fake_provider.get_backend() is backend
+    assert fake_client.count("list_platforms") == 3
+
+
+def test_platform_cache_expiry(fake_provider, fake_client, monkeypatch):
+    clock = _clock(monkeypatch)
+    provider = ScalewayProvider(
+        project_id="project", secret_key="secret", platform_cache_ttl=10
+    )
+
+    backend = provider.get_backend()
+    clock.now += 9.9
+    provider.get_backend()
+    assert fake_client.count("list_platforms") == 1
+
+    # Expired listings are queried again, refreshing the volatile fields of
+    # the backend of the same platform version
+    fake_client.platform = _updated(fake_client.platform, availability="busy")
+    clock.now += 0.1
+    assert provider.get_backend() is backend
+    assert backend.availability == "busy"
+    assert fake_client.count("list_platforms") == 2
+
+    # A new platform version gets a new backend
+    fake_client.platform = _updated(fake_client.platform, version="2.0")
+    clock.now += 10
+    assert provider.get_backend() is not backend
+    assert fake_client.count("list_platforms") == 3
+
+
+def test_platform_cache_disabled(fake_provider, fake_client, monkeypatch):
+    _clock(monkeypatch)
+    provider = ScalewayProvider(
+        project_id="project", secret_key="secret", platform_cache_ttl=0
+    )
+
+    backend = provider.get_backend()
+    assert provider.get_backend() is backend
+    assert fake_client.count("list_platforms") == 2
@@ -58,3 +58,45 @@ def test_qsim_simple_circuit():
 
     finally:
         backend.delete_session(session_id)
+
+
+def test_qsim_multiple_circuits():
+    provider = ScalewayProvider(
+        project_id=os.environ["QISKIT_SCALEWAY_PROJECT_ID"],
+        secret_key=os.environ["QISKIT_SCALEWAY_SECRET_KEY"],
+        url=os.getenv("QISKIT_SCALEWAY_API_URL"),
+    )
+
+    backend = provider.get_backend(
+        os.getenv("QSIM_SCALEWAY_BACKEND_NAME", "EMU-QSIM-16C-128M")
+    )
+
+    assert backend is not None
+
+    session_id = backend.start_session(
+        name="my-qsim-session-autotest",
+        deduplication_id=f"my-qsim-session-autotest-{random.randint(1, 1000)}",
+        max_duration="15m",
+    )
+
+    assert session_id is not None
+
+    try:
+        circuits = []
+
+        for i in range(3):
+            qc = QuantumCircuit(3)
+            qc.x(i)
+            qc.measure_all()
+            circuits.append(qc)
+
+        job = backend.run(circuits, shots=100, session_id=session_id)
+
+        assert len(job.jobs) == len(circuits)
+
+        qiskit_result = job.result()
+
+        assert qiskit_result.success
+        assert len(qiskit_result.results) == len(circuits)
+    finally:
+        backend.delete_session(session_id)
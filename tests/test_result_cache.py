@@ -0,0 +1,158 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import errno
+import logging
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from qiskit import QuantumCircuit
+
+from qiskit_scaleway import ScalewayProvider
+from qiskit_scaleway.utils import ResultCache
+
+
+def _entry(job_id: str, size: int) -> dict:
+    return {
+        "name": f"qj-{job_id}",
+        "session_id": "session-1",
+        "platform_id": "platform-1",
+        "job_results": [{"job_id": job_id, "result": os.urandom(size).hex()}],
+    }
+
+
+def test_result_cache_roundtrip(tmp_path):
+    cache = ResultCache(str(tmp_path))
+
+    assert cache.get("job-1") is None
+
+    cache.put("job-1", _entry("job-1", 16))
+
+    assert cache.get("job-1") == cache.get("job-1")
+    assert cache.get("job-1")["job_results"][0]["job_id"] == "job-1"
+    assert len(cache) == 1
+
+    # A new instance on the same directory sees the entry
+    assert ResultCache(str(tmp_path)).get("job-1")["name"] == "qj-job-1"
+
+    cache.invalidate("job-1")
+
+    assert cache.get("job-1") is None
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path))
+
+    entries = {job_id: _entry(job_id, 4096) for job_id in ("job-1", "job-2", "job-3")}
+
+    for job_id, entry in entries.items():
+        cache.put(job_id, entry)
+        time.sleep(0.01)
+
+    # Reading job-1 makes job-2 the least recently used entry
+    cache.get("job-1")
+    time.sleep(0.01)
+
+    cache.max_bytes = cache.size - 1
+    cache.put("job-3", entries["job-3"])
+
+    assert cache.get("job-2") is None
+    assert cache.get("job-1") is not None
+    assert cache.get("job-3") is not None
+
+
+def test_result_cache_clear_only_removes_its_entries(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put("job-1", _entry("job-1", 16))
+
+    other = tmp_path / "notes.txt"
+    other.write_text("not an entry")
+
+    name = os.path.basename(cache._path("job-2"))
+    writing = tmp_path / f"{name}.tmp"
+    writing.write_bytes(b"")
+    stale = tmp_path / f"{os.path.basename(cache._path('job-3'))}.tmp"
+    stale.write_bytes(b"")
+    os.utime(stale, (time.time() - 3600, time.time() - 3600))
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert other.exists()
+    assert writing.exists()
+    assert not stale.exists()
+
+
+def test_result_cache_expands_user(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    cache = ResultCache("~/results")
+
+    assert cache.directory == str(tmp_path / "results")
+    assert os.path.isdir(cache.directory)
+
+
+def test_result_cache_shared_directory(tmp_path):
+    # Separate instances share the directory like separate processes would
+    caches = [ResultCache(str(tmp_path)) for _ in range(8)]
+    job_ids = [f"job-{i}" for i in range(10)]
+    entries = {job_id: _entry(job_id, 16) for job_id in job_ids}
+
+    def _put(cache):
+        for _ in range(5):
+            for job_id in job_ids:
+                cache.put(job_id, entries[job_id])
+
+    with ThreadPoolExecutor(len(caches)) as executor:
+        list(executor.map(_put, caches))
+
+    reader = ResultCache(str(tmp_path))
+    assert all(reader.get(job_id) == entries[job_id] for job_id in job_ids)
+    assert len(os.listdir(tmp_path)) == len(job_ids)
+
+
+def test_result_cache_write_errors(tmp_path, monkeypatch, caplog, fake_provider):
+    cache = ResultCache(str(tmp_path))
+
+    def _disk_full(*args, **kwargs):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(os, "replace", _disk_full)
+
+    with caplog.at_level(logging.WARNING):
+        cache.put("job-1", _entry("job-1", 16))
+
+    assert cache.get("job-1") is None
+    assert "No space left on device" in caplog.text
+    assert os.listdir(tmp_path) == []
+
+    def _unserializable(job_id, entry):
+        raise TypeError("Object of type complex is not JSON serializable")
+
+    # Results are still returned when they cannot be cached
+    monkeypatch.setattr(cache, "put", _unserializable)
+    provider = ScalewayProvider(
+        project_id="project", secret_key="secret", result_cache=cache
+    )
+    qc = QuantumCircuit(1)
+    qc.x(0)
+    qc.measure_all()
+
+    job = provider.get_backend().run(qc, shots=10)
+
+    with caplog.at_level(logging.WARNING):
+        assert job.result().get_counts() == {"1": 10}
+
+    assert "not JSON serializable" in caplog.text
@@ -0,0 +1,138 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+
+import pytest
+
+from qiskit import QuantumCircuit
+from qiskit.providers import JobStatus
+from scaleway_qaas_client.v1alpha1 import QaaSPlatform
+
+from qiskit_scaleway.backends.result_memo import MemoizedJob
+
+
+def _circuit(num_qubits: int = 2) -> QuantumCircuit:
+    qc = QuantumCircuit(num_qubits)
+    qc.h(range(num_qubits))
+    qc.measure_all()
+
+    return qc
+
+
+def test_result_memoization(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+    backend.enable_result_memoization()
+    memo = backend.result_memo
+
+    job = backend.run(_circuit(), shots=100, seed_simulator=7)
+    assert isinstance(job, MemoizedJob)
+    result = job.result()
+    assert (memo.hits, memo.misses) == (0, 1)
+
+    # An identical seeded run shares the result without any API call
+    calls = len(fake_client.calls)
+    memoized = backend.run(_circuit(), shots=100, seed_simulator=7)
+    assert memoized.status() == JobStatus.DONE
+    assert memoized.result() is result
+    assert asyncio.run(memoized.aresult()) is result
+    assert memoized.job_id() == job.job_id()
+    assert len(fake_client.calls) == calls
+    assert (memo.hits, memo.misses) == (1, 1)
+
+    # Other seeds or shots are other runs, the session is not part of the key
+    assert backend.run(_circuit(), shots=100, seed_simulator=8).result() is not result
+    assert backend.run(_circuit(), shots=50, seed_simulator=7).result() is not result
+    assert (
+        backend.run(_circuit(), shots=100, seed_simulator=7, session_id="other")
+        .result()
+        is result
+    )
+    assert (memo.hits, memo.misses) == (2, 3)
+
+    # Runs without a seed are always submitted
+    jobs = fake_client.count("create_job")
+    assert not isinstance(backend.run(_circuit(), shots=100), MemoizedJob)
+    assert fake_client.count("create_job") == jobs + 1
+
+    memo.clear()
+    assert len(memo) == 0
+    assert backend.run(_circuit(), shots=100, seed_simulator=7).result() is not result
+
+    backend.disable_result_memoization()
+    assert backend.result_memo is None
+
+
+def test_result_memoization_lru(fake_provider, fake_client):
+    backend = fake_provider.get_backend()
+    backend.enable_result_memoization(max_size=2)
+    memo = backend.result_memo
+
+    for seed in (1, 2):
+        backend.run(_circuit(), shots=10, seed_simulator=seed).result()
+
+    # Using seed 1 makes seed 2 the least recently used run
+    backend.run(_circuit(), shots=10, seed_simulator=1)
+    backend.run(_circuit(), shots=10, seed_simulator=3).result()
+    assert len(memo) == 2
+    assert fake_client.count("create_job") == 3
+
+    backend.run(_circuit(), shots=10, seed_simulator=1)
+    assert fake_client.count("create_job") == 3
+    backend.run(_circuit(), shots=10, seed_simulator=2)
+    assert fake_client.count("create_job") == 4
+    assert (memo.hits, memo.misses) == (2, 4)
+
+
+def test_result_memoization_error(fake_provider, fake_client, monkeypatch):
+    backend = fake_provider.get_backend()
+    backend.enable_result_memoization()
+
+    list_job_results = fake_client.list_job_results
+
+    def _fail(job_id):
+        raise RuntimeError("results unavailable")
+
+    monkeypatch.setattr(fake_client, "list_job_results", _fail)
+
+    job = backend.run(_circuit(), shots=10, seed_simulator=1)
+    with pytest.raises(Exception):
+        job.result()
+
+    # Failed runs are submitted again
+    assert len(backend.result_memo) == 0
+    monkeypatch.setattr(fake_client, "list_job_results", list_job_results)
+    rerun = backend.run(_circuit(), shots=10, seed_simulator=1)
+    assert rerun.job_id() != job.job_id()
+    assert sum(rerun.result().get_counts().values()) == 10
+
+
+def test_result_memoization_without_seed(fake_provider, fake_client):
+    fake_client.platform = QaaSPlatform(
+        id="platform-1",
+        version="1.0",
+        name="EMU-QSIM-16C-128M",
+        provider_name="qsim",
+        backend_name="qsim",
+        max_qubit_count=20,
+        max_shot_count=100000,
+        max_circuit_count=1,
+        availability="available",
+        description="Fake Qsim platform",
+    )
+    backend = fake_provider.get_backend()
+
+    with pytest.raises(ValueError, match="cannot be seeded"):
+        backend.enable_result_memoization()
+
+    assert backend.result_memo is None
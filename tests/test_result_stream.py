@@ -0,0 +1,116 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import numpy as np
+import pytest
+
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+
+from qio.core import QuantumProgramResult, QuantumProgramResultCompressionFormat
+
+from qiskit_scaleway.utils import MemoryArray, decode_result_stream
+
+
+def _chunks(payload: bytes, size: int):
+    for i in range(0, len(payload), size):
+        yield payload[i : i + size]
+
+
+@pytest.mark.parametrize(
+    "compression_format",
+    [
+        QuantumProgramResultCompressionFormat.ZLIB_BASE64_V1,
+        QuantumProgramResultCompressionFormat.NONE,
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_streamed_result_matches_regular_decoding(compression_format, chunk_size):
+    qc = QuantumCircuit(3, 3)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.x(2)
+    qc.measure(range(3), range(3))
+
+    expected = AerSimulator().run(qc, shots=200, memory=True).result()
+
+    payload = (
+        QuantumProgramResult.from_qiskit_result(expected, compression_format)
+        .to_json_str()
+        .encode("utf-8")
+    )
+
+    result = decode_result_stream(_chunks(payload, chunk_size)).to_qiskit_result()
+
+    assert isinstance(result.results[0].data.memory, MemoryArray)
+    assert result.get_memory() == expected.get_memory()
+    assert result.get_counts() == expected.get_counts()
+
+
+def _payload(qc: QuantumCircuit, **run_options) -> tuple:
+    expected = AerSimulator().run(qc, shots=200, memory=True, **run_options).result()
+    payload = (
+        QuantumProgramResult.from_qiskit_result(
+            expected, QuantumProgramResultCompressionFormat.ZLIB_BASE64_V1
+        )
+        .to_json_str()
+        .encode("utf-8")
+    )
+
+    return expected, payload
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_streamed_result_ignores_metadata_memory(chunk_size):
+    qc = QuantumCircuit(2, 2, metadata={"memory": ["not-hex", "[]"], "data": {}})
+    qc.h(0)
+    qc.measure(range(2), range(2))
+
+    expected, payload = _payload(qc)
+    result = decode_result_stream(_chunks(payload, chunk_size)).to_qiskit_result()
+
+    assert result.results[0].header["metadata"] == {
+        "memory": ["not-hex", "[]"],
+        "data": {},
+    }
+    assert isinstance(result.results[0].data.memory, MemoryArray)
+    assert result.get_memory() == expected.get_memory()
+
+
+def test_streamed_result_to_program_result():
+    first = QuantumCircuit(3, 3, name="first")
+    first.h(range(3))
+    first.measure(range(3), range(3))
+    second = QuantumCircuit(1, 1, name="second")
+    second.x(0)
+    second.measure(0, 0)
+
+    expected, payload = _payload([first, second])
+    streamed = decode_result_stream(_chunks(payload, 7))
+
+    regular = QuantumProgramResult.from_json_str(payload.decode("utf-8"))
+    result = streamed.to_program_result().to_qiskit_result()
+
+    assert result.to_dict() == regular.to_qiskit_result().to_dict()
+    assert result.get_memory(0) == expected.get_memory(0)
+    assert result.get_memory(1) == expected.get_memory(1)
+
+
+def test_memory_array_to_json():
+    memory = MemoryArray(np.array([0, 5, 2**40], dtype=np.uint64))
+    binary = MemoryArray(np.array([1, 2], dtype=np.uint64), base=2, width=3)
+
+    assert json.loads(memory.to_json()) == ["0x0", "0x5", hex(2**40)]
+    assert json.loads(binary.to_json()) == ["001", "010"]
+    assert MemoryArray(np.array([], dtype=np.uint64)).to_json() == "[]"
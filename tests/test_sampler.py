@@ -13,13 +13,20 @@
 # limitations under the License.
 import os
 import numpy as np
+import pytest
 import random
 
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
 from qiskit.circuit.library import iqp
+from qiskit.primitives.containers.bindings_array import BindingsArray
 from qiskit.quantum_info import random_hermitian
+from qiskit_aer import AerSimulator
 
 from qiskit_scaleway import ScalewayProvider
 from qiskit_scaleway.primitives import Sampler
+from qiskit_scaleway.primitives.sampler import _extract_register, _memory_to_bytes
+from qiskit_scaleway.utils import MemoryArray
 
 
 def test_sampler():
@@ -57,3 +64,140 @@ def test_sampler():
         assert result is not None
     finally:
         backend.stop_session(session_id)
+
+
+def _to_bytes(values, num_bytes: int) -> np.ndarray:
+    data = b"".join(int(v).to_bytes(num_bytes, "big") for v in values)
+
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, num_bytes)
+
+
+@pytest.mark.parametrize("num_bits", [1, 3, 8, 11, 17, 64, 70])
+def test_memory_to_bytes(num_bits):
+    rng = random.Random(num_bits)
+    values = [rng.getrandbits(num_bits) for _ in range(50)] + [0, 2**num_bits - 1]
+    num_bytes = (num_bits + 7) // 8
+    expected = _to_bytes(values, num_bytes)
+
+    hex_memory = [hex(v) for v in values]
+    upper_memory = ["0x" + format(v, "X") for v in values]
+    binary_memory = [format(v, f"0{num_bits}b") for v in values]
+
+    assert np.array_equal(_memory_to_bytes(hex_memory, num_bytes, 16), expected)
+    assert np.array_equal(_memory_to_bytes(upper_memory, num_bytes, 16), expected)
+    assert np.array_equal(_memory_to_bytes(binary_memory, num_bytes, 2), expected)
+
+    if num_bits <= 64:
+        memory = MemoryArray(np.array(values, dtype=np.uint64))
+        assert np.array_equal(_memory_to_bytes(memory, num_bytes, 16), expected)
+
+    # Wider rows are zero-padded on the left
+    assert np.array_equal(
+        _memory_to_bytes(hex_memory, num_bytes + 2, 16),
+        _to_bytes(values, num_bytes + 2),
+    )
+
+
+def test_memory_to_bytes_registers():
+    qc = QuantumCircuit(QuantumRegister(8), ClassicalRegister(3), ClassicalRegister(5))
+    qc.h(range(8))
+    qc.measure(range(8), range(8))
+
+    result = AerSimulator().run(qc, shots=100, memory=True, seed_simulator=1).result()
+    hex_memory = result.results[0].data.memory
+    # Binary memory separates the registers with spaces
+    binary_memory = [m.replace(" ", "") for m in result.get_memory()]
+
+    expected = _to_bytes([int(m, 16) for m in hex_memory], 1)
+
+    assert np.array_equal(_memory_to_bytes(hex_memory, 1, 16), expected)
+    assert np.array_equal(_memory_to_bytes(binary_memory, 1, 2), expected)
+    assert np.array_equal(
+        _memory_to_bytes([], 1, 16), np.zeros((0, 1), dtype=np.uint8)
+    )
+    assert _memory_to_bytes(hex_memory, 0, 16).shape == (100, 0)
+
+
+@pytest.mark.parametrize(
+    "num_bits, start",
+    [(3, 0), (5, 3), (8, 0), (8, 4), (11, 5), (7, 9), (13, 11), (1, 23), (24, 0)],
+)
+def test_extract_register(num_bits, start):
+    rng = np.random.default_rng(start * 32 + num_bits)
+    memory = rng.integers(0, 256, size=(2, 3, 10, 3), dtype=np.uint8)
+
+    # Clbit i is bit i from the right of the big-endian rows
+    bits = np.unpackbits(memory, axis=-1, bitorder="big")
+    width = bits.shape[-1]
+    register = bits[..., width - start - num_bits : width - start]
+    num_bytes = (num_bits + 7) // 8
+    padding = [(0, 0)] * 3 + [(num_bytes * 8 - num_bits, 0)]
+    expected = np.packbits(np.pad(register, padding), axis=-1, bitorder="big")
+
+    assert np.array_equal(_extract_register(memory, num_bits, start), expected)
+
+
+@pytest.mark.parametrize("runtime_parameter_bind", [False, True])
+def test_sampler_unaligned_registers(fake_provider, runtime_parameter_bind):
+    theta = [Parameter(f"θ{i}") for i in range(9)]
+    low, high = ClassicalRegister(3, "low"), ClassicalRegister(6, "high")
+    qc = QuantumCircuit(QuantumRegister(9), low, high)
+    for qubit, param in enumerate(theta):
+        qc.rx(param, qubit)
+    qc.measure(range(9), range(9))
+
+    # Deterministic outcomes, one random bit pattern per binding
+    patterns = np.random.default_rng(0).integers(0, 2, size=(2, 3, 9))
+    bindings = BindingsArray({tuple(theta): np.pi * patterns})
+
+    sampler = Sampler(
+        backend=fake_provider.get_backend(),
+        session_id="session",
+        runtime_parameter_bind=runtime_parameter_bind,
+    )
+    data = sampler.run([(qc, bindings)], shots=10).result()[0].data
+
+    assert data.shape == (2, 3)
+    for index in np.ndindex(2, 3):
+        bits = "".join(str(b) for b in patterns[index][::-1])
+        assert data.low.get_counts(index) == {bits[-3:]: 10}
+        assert data.high.get_counts(index) == {bits[:-3]: 10}
+
+
+@pytest.mark.parametrize("shuffle_seed", [None, 3])
+def test_sampler_counts_only(fake_provider, shuffle_seed):
+    theta = Parameter("θ")
+    low, high = ClassicalRegister(3, "low"), ClassicalRegister(9, "high")
+    qc = QuantumCircuit(QuantumRegister(12), low, high)
+    qc.h(range(12))
+    qc.rx(theta, 0)
+    qc.measure(range(12), range(12))
+    pubs = [(qc, [[0.1], [0.7]]), (qc.assign_parameters([0.3]),)]
+
+    def _run(counts_only: bool):
+        sampler = Sampler(
+            backend=fake_provider.get_backend(),
+            session_id="session",
+            options={"seed_simulator": 11},
+            counts_only=counts_only,
+            shuffle_seed=shuffle_seed,
+        )
+        return sampler.run(pubs, shots=500).result()
+
+    expected = _run(counts_only=False)
+    result = _run(counts_only=True)
+
+    for pub_result, expected_result in zip(result, expected):
+        for name in ("low", "high"):
+            bit_array = pub_result.data[name]
+            expected_array = expected_result.data[name]
+
+            assert bit_array.shape == expected_array.shape
+            assert bit_array.num_shots == expected_array.num_shots == 500
+            for index in np.ndindex(bit_array.shape):
+                assert bit_array.get_counts(index) == expected_array.get_counts(
+                    index
+                )
+
+        joined = pub_result.join_data()
+        assert joined.get_counts() == expected_result.join_data().get_counts()
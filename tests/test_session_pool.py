@@ -0,0 +1,170 @@
+# Copyright 2026 Scaleway
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import threading
+import time
+
+from qiskit import QuantumCircuit
+from qiskit_scaleway import ScalewayProvider
+from qiskit_scaleway.backends.session_pool import SessionPool
+
+
+def test_auto_session_is_reused():
+    provider = ScalewayProvider(
+        project_id=os.environ["QISKIT_SCALEWAY_PROJECT_ID"],
+        secret_key=os.environ["QISKIT_SCALEWAY_SECRET_KEY"],
+        url=os.getenv("QISKIT_SCALEWAY_API_URL"),
+    )
+
+    backend = provider.get_backend(
+        os.getenv("QISKIT_SCALEWAY_BACKEND_NAME", "EMU-AER-16C-128M")
+    )
+
+    assert backend is not None
+
+    try:
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+
+        job1 = backend.run(qc, shots=100)
+        job2 = backend.run(qc, shots=100)
+
+        assert job1.session_id is not None
+        assert job1.session_id == job2.session_id
+
+        assert job1.result().success
+        assert job2.result().success
+    finally:
+        backend.close()
+
+
+class _Job:
+    def __init__(self, status: str):
+        self.status = status
+
+
+class _Client:
+    def __init__(self):
+        self.jobs = {}
+
+    def list_jobs(self, session_id: str):
+        return self.jobs.get(session_id, [])
+
+
+class _Backend:
+    def __init__(self, max_duration: str, max_idle_duration: str = "59m"):
+        self.options = {
+            "session_name": "test",
+            "session_max_duration": max_duration,
+            "session_max_idle_duration": max_idle_duration,
+        }
+        self._client = _Client()
+        self.started = []
+        self.stopped = []
+
+    def start_session(self, name, max_duration, max_idle_duration) -> str:
+        session_id = f"session-{len(self.started)}"
+        self.started.append(session_id)
+        return session_id
+
+    def stop_session(self, session_id: str) -> None:
+        self.stopped.append(session_id)
+
+
+def test_short_sessions_are_not_renewed_in_a_loop():
+    backend = _Backend(max_duration="1m", max_idle_duration="1m")
+    pool = SessionPool(backend)
+
+    try:
+        session_id = pool.acquire()
+        time.sleep(0.5)
+
+        # The margin is capped to a tenth of the 60 s duration
+        assert backend.started == [session_id]
+        assert pool._timer is not None
+        assert pool.acquire() == session_id
+    finally:
+        pool.close()
+
+
+def test_short_renewal_timer():
+    backend = _Backend(max_duration="1s")
+    pool = SessionPool(backend)
+
+    try:
+        first = pool.acquire()
+        time.sleep(1.5)
+
+        # Renewed in the background once, 0.1 s before the end of the session
+        assert 2 <= len(backend.started) <= 3
+        assert pool.acquire() != first
+    finally:
+        pool.close()
+
+
+def test_close_keeps_sessions_with_pending_jobs():
+    backend = _Backend(max_duration="59m")
+    pool = SessionPool(backend)
+
+    busy = pool.acquire()
+    backend._client.jobs[busy] = [_Job("completed"), _Job("running")]
+    pool.close()
+
+    assert backend.stopped == []
+
+    backend = _Backend(max_duration="59m")
+    pool = SessionPool(backend)
+
+    idle = pool.acquire()
+    backend._client.jobs[idle] = [_Job("completed"), _Job("error")]
+    pool.close()
+
+    assert backend.stopped == [idle]
+
+
+def test_acquire_reuses_the_pending_timer(monkeypatch):
+    backend = _Backend(max_duration="59m", max_idle_duration="1s")
+    pool = SessionPool(backend)
+    timers = []
+    timer_cls = threading.Timer
+
+    def _timer(*args, **kwargs):
+        timers.append(timer_cls(*args, **kwargs))
+        return timers[-1]
+
+    monkeypatch.setattr(threading, "Timer", _timer)
+
+    try:
+        session_id = pool.acquire()
+
+        # Runs in a row share the timer armed by the first one
+        for _ in range(100):
+            assert pool.acquire() == session_id
+        assert len(timers) == 1
+
+        # Used until past its first idle deadline, the session is kept and
+        # the timer is armed again for the new idle deadline
+        for _ in range(6):
+            time.sleep(0.25)
+            assert pool.acquire() == session_id
+        assert 2 <= len(timers) <= 4
+
+        # Then released once nobody uses it
+        time.sleep(1.5)
+        assert pool.session_id is None
+        assert backend.started == [session_id]
+    finally:
+        pool.close()